@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Compare full-frame cost at native tile sizes: direct 32px drawing vs a small
+framebuffer upscaled to the same 800x608 window.
+
+Usage: python benchmarks/bench_framebuffer.py [frames]
+"""
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.game import Game
+
+TILE_SIZES = [32, 16, 8]
+SEED = 42
+
+
+def timed(draw, frames):
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) == 2 else 500
+    print(f"{'tile':>5} {'native':>10} {'scale':>6} {'draw ms':>9} {'upscale ms':>11} {'frame ms':>9}")
+    for tile_size in TILE_SIZES:
+        random.seed(SEED)
+        game = Game(headless=True, tile_size=tile_size)
+        screen, renderer, gs = game.screen, game.renderer, game.game_state
+        fb = game.framebuffer
+        draw = timed(lambda: renderer.render_view(screen, gs), frames)
+        upscale = timed(fb.upscale, frames) if fb else 0.0
+
+        def frame():
+            game.dirty.mark_all()
+            game.render()
+        total = timed(frame, frames)
+        width, height = screen.get_size()
+        print(f"{tile_size:>5} {width:>4}x{height:<5} {fb.scale if fb else 1:>6} "
+              f"{draw:>9.3f} {upscale:>11.3f} {total:>9.3f}")
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark pathfinding and FOV on the Python and tcod grid backends.
+
+Usage: python benchmarks/bench_grid_backend.py [width height]
+"""
+import sys
+import os
+import random
+import time
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from environment.world.world_generator import WorldGenerator
+from engine.collision import CollisionSystem
+from engine.grid_backend import get_backend, TCOD_AVAILABLE
+
+SEEDS = [42, 1001, 1234, 4321, 9999]
+QUERIES_PER_SEED = 20
+FOV_RADIUS = 12
+
+
+def build_seed(seed, width, height):
+    """Generate a world and the grids both backends consume."""
+    random.seed(seed)
+    world_gen = WorldGenerator(width=width, height=height)
+    terrain, hero = world_gen.generate()
+    collision = CollisionSystem(world_gen)
+    collision.set_world(terrain, world_gen.chests)
+    walkable = collision.get_walkable_grid()
+
+    transparent = np.ones((height, width), dtype=bool)
+    for (x, y), tile in terrain.items():
+        transparent[y, x] = not tile.blocks_sight
+
+    rng = random.Random(seed)
+    open_tiles = np.argwhere(walkable)
+    goals = [tuple(open_tiles[rng.randrange(len(open_tiles))][::-1]) for _ in range(QUERIES_PER_SEED)]
+    return (hero.x, hero.y), walkable, transparent, goals
+
+
+def bench(backend, worlds):
+    """Time every query on every seed for one backend."""
+    path_time = 0.0
+    fov_time = 0.0
+    lengths = []
+    for start, walkable, transparent, goals in worlds:
+        t0 = time.perf_counter()
+        for goal in goals:
+            lengths.append(backend.find_path(walkable, start, goal).length)
+        path_time += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for x, y in goals:
+            backend.compute_fov(transparent, x, y, FOV_RADIUS)
+        fov_time += time.perf_counter() - t0
+    return path_time, fov_time, lengths
+
+
+def main():
+    width, height = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) == 3 else (200, 150)
+    print(f"Building {len(SEEDS)} worlds of {width}x{height}...")
+    worlds = [build_seed(seed, width, height) for seed in SEEDS]
+    queries = len(SEEDS) * QUERIES_PER_SEED
+
+    names = ["python"] + (["tcod"] if TCOD_AVAILABLE else [])
+    results = {name: bench(get_backend(name), worlds) for name in names}
+
+    print(f"\n{'backend':<10}{'path ms/query':>16}{'fov ms/query':>16}")
+    for name, (path_time, fov_time, _) in results.items():
+        print(f"{name:<10}{path_time / queries * 1000:>16.3f}{fov_time / queries * 1000:>16.3f}")
+
+    if TCOD_AVAILABLE:
+        same = results["python"][2] == results["tcod"][2]
+        print(f"\nPath lengths identical across backends: {same}")
+    else:
+        print("\ntcod not installed - only the Python backend was measured")
+
+
+if __name__ == "__main__":
+    main()
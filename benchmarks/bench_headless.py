@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Play the scripted headless scenarios: frames/second and golden-frame check.
+
+Usage: python benchmarks/bench_headless.py [--backend tcod|python] [--update]
+
+--update rewrites tests/goldens/render_frames.json for the backend used.
+"""
+import sys
+import os
+import argparse
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.headless import run_all, load_goldens, save_goldens, compare_goldens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backend', help="FOV grid backend (default: tcod when installed)")
+    parser.add_argument('--update', action='store_true', help="store these frames as the goldens")
+    args = parser.parse_args()
+
+    results = run_all(args.backend)
+    mismatches = dict(compare_goldens(results, load_goldens()))
+
+    print(f"{'scenario':<10} {'frames':>7} {'fps':>9}  golden")
+    for name, result in results.items():
+        if name not in mismatches:
+            status = "ok"
+        elif mismatches[name] is None:
+            status = "missing"
+        else:
+            status = f"differs from step {mismatches[name]}"
+        print(f"{name:<10} {result['frames']:>7} {result['fps']:>9.0f}  {status}")
+
+    if args.update:
+        save_goldens(results)
+        print("Goldens updated")
+    elif mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Compare A* and jump point search node expansions, scanned tiles and time on WorldGenerator seeds.
+
+Usage: python benchmarks/bench_jump_point.py [width height]
+"""
+import sys
+import os
+import random
+import time
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from environment.world.world_generator import WorldGenerator
+from engine.collision import CollisionSystem
+from engine.pathfinding import STRATEGIES, find_path
+
+SEEDS = [42, 1001, 1234, 4321, 9999]
+QUERIES_PER_SEED = 20
+
+
+def main():
+    width, height = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) == 3 else (200, 150)
+    totals = {name: {'expanded': 0, 'scanned': 0, 'time': 0.0, 'length': 0} for name in STRATEGIES}
+
+    for seed in SEEDS:
+        random.seed(seed)
+        world_gen = WorldGenerator(width=width, height=height)
+        terrain, hero = world_gen.generate()
+        collision = CollisionSystem(world_gen)
+        collision.set_world(terrain, world_gen.chests)
+        walkable = collision.get_walkable_grid()
+
+        rng = random.Random(seed)
+        open_tiles = np.argwhere(walkable)
+        goals = [tuple(open_tiles[rng.randrange(len(open_tiles))][::-1]) for _ in range(QUERIES_PER_SEED)]
+
+        for name in STRATEGIES:
+            for goal in goals:
+                t0 = time.perf_counter()
+                result = find_path(walkable, (hero.x, hero.y), goal, name)
+                totals[name]['time'] += time.perf_counter() - t0
+                totals[name]['expanded'] += result.expanded
+                totals[name]['scanned'] += result.scanned
+                totals[name]['length'] += max(result.length, 0)
+
+    queries = len(SEEDS) * QUERIES_PER_SEED
+    print(f"{queries} queries on {width}x{height} worlds (seeds {SEEDS})\n")
+    print(f"{'strategy':<10}{'expanded/query':>16}{'scanned/query':>15}{'ms/query':>12}{'total length':>14}")
+    for name, total in totals.items():
+        print(f"{name:<10}{total['expanded'] / queries:>16.1f}{total['scanned'] / queries:>15.1f}"
+              f"{total['time'] / queries * 1000:>12.3f}{total['length']:>14}")
+
+    speedup = totals['astar']['expanded'] / max(totals['jps']['expanded'], 1)
+    time_ratio = totals['astar']['time'] / max(totals['jps']['time'], 1e-9)
+    print(f"\nJPS expands {speedup:.1f}x fewer nodes than A*, but scans "
+          f"{totals['jps']['scanned'] / queries:.0f} tiles/query; wall time {time_ratio:.2f}x A*'s speed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Time the array particle pool: update and batched draw of a live burst,
+against a per-particle Python loop doing the same work.
+
+Usage: python benchmarks/bench_particles.py [frames]
+"""
+import sys
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.particles import ParticlePool
+
+COUNTS = [500, 2000, 8000, 16000]
+SCREEN = (800, 608)
+FRAME_MS = 1000 / 60
+SPARKS = [(255, 215, 0), (248, 184, 0), (252, 216, 168)]
+
+
+def burst(count):
+    """Pool holding one long-lived burst in the middle of the screen"""
+    pool = ParticlePool(capacity=count, gravity=0, seed=1)
+    pool.emit(SCREEN[0] / 2, SCREEN[1] / 2, count, speed=(0, 300), life_ms=(10 ** 9, 10 ** 9), color=SPARKS)
+    return pool
+
+
+def timed(step, frames):
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def loop_frame(particles, screen):
+    """One frame the per-particle way: a Python update and fill() per particle"""
+    dt = FRAME_MS / 1000
+    for particle in particles:
+        particle[0] += particle[2] * dt
+        particle[1] += particle[3] * dt
+        screen.fill(particle[4], (int(particle[0]), int(particle[1]), 2, 2))
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) == 2 else 200
+    screen = pygame.Surface(SCREEN)
+    print(f"{'particles':>9} {'update ms':>10} {'draw ms':>8} {'array ms':>9} {'loop ms':>8}")
+    for count in COUNTS:
+        pool = burst(count)
+        update = timed(lambda: pool.update(FRAME_MS), frames)
+        draw = timed(lambda: pool.draw(screen), frames)
+
+        pool = burst(count)
+        particles = [[*pool.position[i], *pool.velocity[i], tuple(pool.color[i])] for i in range(count)]
+        loop = timed(lambda: loop_frame(particles, screen), max(1, frames // 10))
+        print(f"{count:>9} {update:>10.3f} {draw:>8.3f} {update + draw:>9.3f} {loop:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
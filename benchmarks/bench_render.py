@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare world drawing: per-tile blit loop, Surface.blits() batches, baked layer
+(tile-aligned and at sub-tile scroll offsets).
+
+Usage: python benchmarks/bench_render.py [frames]
+"""
+import sys
+import os
+import random
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from environment.world.world_generator import WorldGenerator
+from engine.renderer import Renderer, SPRITE_SIZE
+from engine.world_layer import WorldLayer
+
+SEEDS = [42, 1001, 1234, 4321, 9999]
+GRID_WIDTH = 25
+GRID_HEIGHT = 19
+
+
+def viewport_pairs(sprites, world, chests, camera_x, camera_y):
+    """(sprite, dest) pairs for the viewport, built the way the old loop walked it"""
+    pairs = []
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            tile = world.get((x + camera_x, y + camera_y))
+            tile_type = type(tile).__name__.lower() if tile else 'grass'
+            pairs.append((sprites.get(tile_type, sprites['grass']), (x * SPRITE_SIZE, y * SPRITE_SIZE)))
+    for chest in chests:
+        pairs.append((sprites['chest'], ((chest['x'] - camera_x) * SPRITE_SIZE,
+                                         (chest['y'] - camera_y) * SPRITE_SIZE)))
+    return pairs
+
+
+def atlas_triples(atlas, world, chests, camera_x, camera_y):
+    """(atlas, dest, area) triples for the viewport, looked up by tile ID"""
+    surface = atlas.surface
+    areas = {}  # Terrain class -> area rect, as WorldLayer caches it
+    triples = []
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            tile = world.get((x + camera_x, y + camera_y))
+            area = areas.get(type(tile))
+            if area is None:
+                name = type(tile).__name__.lower() if tile else 'grass'
+                area = areas[type(tile)] = atlas.rects[atlas.id_of(name, default=atlas.id_of('grass'))]
+            triples.append((surface, (x * SPRITE_SIZE, y * SPRITE_SIZE), area))
+    chest = atlas.rects[atlas.id_of('chest')]
+    for data in chests:
+        triples.append((surface, ((data['x'] - camera_x) * SPRITE_SIZE,
+                                  (data['y'] - camera_y) * SPRITE_SIZE), chest))
+    return triples
+
+
+def per_tile_loop(screen, sprites, world, chests, camera_x, camera_y):
+    """One Python-level blit per tile (the pre-batching renderer)"""
+    for sprite, dest in viewport_pairs(sprites, world, chests, camera_x, camera_y):
+        screen.blit(sprite, dest)
+
+
+def batched(screen, sprites, world, chests, camera_x, camera_y):
+    """Same pairs submitted with one Surface.blits() call"""
+    screen.blits(viewport_pairs(sprites, world, chests, camera_x, camera_y), doreturn=False)
+
+
+def batched_atlas(screen, atlas, world, chests, camera_x, camera_y):
+    """Area blits from the display-format atlas, one Surface.blits() call"""
+    screen.blits(atlas_triples(atlas, world, chests, camera_x, camera_y), doreturn=False)
+
+
+def timed(draw, frames):
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) == 2 else 500
+    pygame.display.init()
+    screen = pygame.display.set_mode((GRID_WIDTH * SPRITE_SIZE, GRID_HEIGHT * SPRITE_SIZE))
+    renderer = Renderer(*screen.get_size())
+    sprites = renderer._create_sprites()  # Separate, unconverted surfaces
+    totals = {'per-tile blit loop': 0.0, 'blits() batch': 0.0, 'blits() from atlas': 0.0,
+              'baked layer': 0.0, 'baked layer, scrolled': 0.0,
+              'chunk bake (loop)': 0.0, 'chunk bake (blits)': 0.0}
+
+    for seed in SEEDS:
+        random.seed(seed)
+        world_gen = WorldGenerator(width=GRID_WIDTH * 2, height=GRID_HEIGHT * 2)
+        world, hero = world_gen.generate()
+        chests = world_gen.chests
+        camera_x, camera_y = GRID_WIDTH // 2, GRID_HEIGHT // 2
+        layer = WorldLayer(renderer.atlas, (90, 90, 120))
+        layer.set_world(world, world_gen.width, world_gen.height, chests)
+        layer.blit_view(screen, camera_x, camera_y)
+
+        totals['per-tile blit loop'] += timed(
+            lambda: per_tile_loop(screen, sprites, world, chests, camera_x, camera_y), frames)
+        totals['blits() batch'] += timed(
+            lambda: batched(screen, sprites, world, chests, camera_x, camera_y), frames)
+        totals['blits() from atlas'] += timed(
+            lambda: batched_atlas(screen, renderer.atlas, world, chests, camera_x, camera_y), frames)
+        totals['baked layer'] += timed(lambda: layer.blit_view(screen, camera_x, camera_y), frames)
+        # Smooth scrolling sits between tiles, so up to four chunks per frame
+        offsets = [(camera_x * SPRITE_SIZE + i % 32, camera_y * SPRITE_SIZE + i * 7 % 32) for i in range(frames)]
+        offsets = iter(offsets)
+        totals['baked layer, scrolled'] += timed(lambda: layer.blit_view_px(screen, *next(offsets)), frames)
+
+        # Baking a chunk is the remaining per-tile work
+        tiles = [(x, y) for y in range(world_gen.height) for x in range(world_gen.width)]
+        chunk = pygame.Surface((world_gen.width * SPRITE_SIZE, world_gen.height * SPRITE_SIZE)).convert()
+        layer.chunk_tiles = max(world_gen.width, world_gen.height)
+        totals['chunk bake (loop)'] += timed(
+            lambda: [chunk.blit(*pair) for pair in layer._tile_blits((0, 0), tiles)], frames // 10)
+        totals['chunk bake (blits)'] += timed(
+            lambda: chunk.blits(layer._tile_blits((0, 0), tiles), doreturn=False), frames // 10)
+
+    print(f"{'draw path':<22} {'ms/frame':>10}")
+    for name, total in totals.items():
+        print(f"{name:<22} {total / len(SEEDS):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
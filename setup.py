@@ -10,6 +10,10 @@ setup(
         "pygame>=2.5.0",
         "numpy>=1.24.0",
     ],
+    extras_require={
+        # Optional C-accelerated pathfinding/FOV (see src/engine/grid_backend.py)
+        'tcod': ["tcod>=13.8.0"],
+    },
     entry_points={
         'console_scripts': [
             'untitled-game=main:main',
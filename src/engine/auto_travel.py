@@ -0,0 +1,208 @@
+"""
+Auto-Travel
+Walks the hero to the nearest unopened chest or unexplored ground one step
+at a time, replanning incrementally with D* Lite as the world changes
+"""
+import logging
+import numpy as np
+
+from engine.dstar_lite import DStarLite
+from engine.flow_field import compute_distance_field, UNREACHABLE
+
+logger = logging.getLogger(__name__)
+
+
+class AutoTravel:
+    """Drives GameState.move_hero toward a target until arrival or interruption"""
+
+    MODE_CHEST = "chest"
+    MODE_EXPLORE = "explore"
+
+    def __init__(self, game_state, collision):
+        """
+        Initialize auto-travel
+
+        Args:
+            game_state: GameState whose hero is moved
+            collision: CollisionSystem providing walkability and change tracking
+        """
+        self.game_state = game_state
+        self.collision = collision
+        self.mode = None
+        self.target = None
+        self.planner = None
+        self.version = None
+        self._target_chests = []  # Unopened chests next to the target (chest mode)
+
+        # Tiles that have been on screen, used when GameState has no
+        # exploration memory; explore mode heads for the rest
+        self.seen = None
+
+        self.last_step_stats = {}
+        self.total_replans = 0
+        self.total_touched = 0
+        logger.info("Auto-travel initialized")
+
+    @property
+    def active(self):
+        """Check if auto-travel is currently moving the hero"""
+        return self.mode is not None
+
+    def start(self, mode):
+        """
+        Start auto-travel
+
+        Args:
+            mode: MODE_CHEST or MODE_EXPLORE
+
+        Returns:
+            bool: True if a reachable target was found
+        """
+        self.mode = mode
+        self.target = None
+        self.planner = None
+        self.total_replans = 0
+        self.total_touched = 0
+        self._mark_seen()
+        if not self._plan():
+            self.stop("nothing to travel to")
+            return False
+        logger.info(f"Auto-travel ({mode}) toward {self.target}")
+        return True
+
+    def stop(self, reason="interrupted"):
+        """Stop auto-travel"""
+        if self.active:
+            logger.info(f"Auto-travel stopped: {reason} "
+                        f"({self.total_replans} replans, {self.total_touched} nodes touched)")
+        self.mode = None
+        self.target = None
+        self.planner = None
+
+    def step(self):
+        """
+        Move the hero one tile along the current plan
+
+        Returns:
+            bool: True if the hero moved
+        """
+        if not self.active:
+            return False
+
+        stats = {'replans': 0, 'touched': 0, 'full_plan': False}
+        self.last_step_stats = stats
+        hero = (self.game_state.hero_x, self.game_state.hero_y)
+
+        if not self._target_still_valid():
+            if not self._plan(stats):
+                self.stop("no targets left")
+                return False
+        else:
+            self._apply_changes(stats, hero)
+
+        if hero == self.target:
+            self.stop("arrived")
+            return False
+
+        stats['touched'] += self.planner.compute_shortest_path()
+        next_tile = self.planner.next_step()
+        if next_tile is None:
+            self.stop("target unreachable")
+            return False
+
+        moved = self.game_state.move_hero(next_tile[0] - hero[0], next_tile[1] - hero[1])
+        if not moved:
+            self.stop("blocked")
+            return False
+
+        self.planner.move_start(next_tile)
+        self._mark_seen()
+        self.total_replans += stats['replans']
+        self.total_touched += stats['touched']
+        logger.debug(f"Auto-travel step to {next_tile}: {stats['replans']} replans, "
+                     f"{stats['touched']} nodes touched")
+        return True
+
+    def _apply_changes(self, stats, hero):
+        """Feed walkability changes since the last step into the planner"""
+        if self.collision.version == self.version:
+            return
+        changes = self.collision.changes_since(self.version)
+        if changes is None or self.planner.walkable is not self.collision.get_walkable_grid():
+            self._start_planner(hero, stats)
+        elif changes:
+            touched = self.planner.touched
+            self.planner.update_tiles(changes)
+            stats['touched'] += self.planner.touched - touched
+            stats['replans'] += 1
+        self.version = self.collision.version
+
+    def _plan(self, stats=None):
+        """Pick a target for the current mode and plan from scratch"""
+        walkable = self.collision.get_walkable_grid()
+        hero = (self.game_state.hero_x, self.game_state.hero_y)
+        distances = compute_distance_field(walkable, hero[0], hero[1])
+
+        if self.mode == self.MODE_CHEST:
+            candidates = self._chest_approach_mask(walkable)
+        else:
+            candidates = walkable & ~self._explored_mask()
+        candidates &= distances != UNREACHABLE
+        if not candidates.any():
+            return False
+
+        masked = np.where(candidates, distances, UNREACHABLE)
+        y, x = np.unravel_index(np.argmin(masked), masked.shape)
+        self.target = (int(x), int(y))
+        self._target_chests = [chest for chest in self.game_state.chests
+                               if not chest['opened'] and abs(chest['x'] - x) + abs(chest['y'] - y) == 1]
+        self._start_planner(hero, stats)
+        return True
+
+    def _start_planner(self, hero, stats=None):
+        """Create a fresh D* Lite planner toward the current target"""
+        self.planner = DStarLite(self.collision.get_walkable_grid(), hero, self.target)
+        self.version = self.collision.version
+        if stats is not None:
+            stats['replans'] += 1
+            stats['full_plan'] = True
+
+    def _chest_approach_mask(self, walkable):
+        """Walkable tiles next to an unopened chest"""
+        mask = np.zeros_like(walkable)
+        height, width = walkable.shape
+        for chest in self.game_state.chests:
+            if chest['opened']:
+                continue
+            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+                x, y = chest['x'] + dx, chest['y'] + dy
+                if 0 <= x < width and 0 <= y < height:
+                    mask[y, x] = True
+        return mask & walkable
+
+    def _target_still_valid(self):
+        """Check if the current target is still worth travelling to (looks at the target tile only)"""
+        if self.target is None or self.planner is None:
+            return False
+        x, y = self.target
+        if self.mode == self.MODE_CHEST:
+            return (bool(self.collision.get_walkable_grid()[y, x]) and
+                    any(not chest['opened'] for chest in self._target_chests))
+        if self.game_state.fov and self.game_state.explored:
+            return not self.game_state.explored.is_explored(x, y)
+        return not self.seen[y, x]
+
+    def _explored_mask(self):
+        """Tiles explore mode considers already known"""
+        if self.game_state.fov and self.game_state.explored:
+            return self.game_state.explored.as_mask()
+        return self.seen
+
+    def _mark_seen(self):
+        """Mark the tiles currently on screen as seen"""
+        walkable = self.collision.get_walkable_grid()
+        if self.seen is None or self.seen.shape != walkable.shape:
+            self.seen = np.zeros_like(walkable)
+        gs = self.game_state
+        self.seen[gs.camera_y:gs.camera_y + gs.grid_height,
+                  gs.camera_x:gs.camera_x + gs.grid_width] = True
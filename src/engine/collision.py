@@ -3,6 +3,7 @@ Collision System for NES Roguelike
 Handles all collision detection and tile blocking logic
 """
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,9 @@ class CollisionSystem:
     # Define which tile types are walkable
     WALKABLE_TILES = {'grass', 'bridge'}
     
+    # How many per-tile changes to remember for incremental consumers
+    MAX_CHANGE_LOG = 4096
+    
     def __init__(self, world_generator):
         """
         Initialize collision system
@@ -25,6 +29,12 @@ class CollisionSystem:
         self.world_generator = world_generator
         self.world = None
         self.chests = []
+        
+        # Walkability grid shared by pathfinding/AI, indexed [y, x]
+        self.version = 0
+        self._walkable = None
+        self._rebuild_version = 0
+        self._changes = []  # (version, x, y) for every tile that flipped
         logger.info("Collision system initialized")
     
     def set_world(self, world, chests):
@@ -37,6 +47,12 @@ class CollisionSystem:
         """
         self.world = world
         self.chests = chests
+        
+        # Whole world replaced - consumers must rebuild from scratch
+        self.version += 1
+        self._rebuild_version = self.version
+        self._walkable = None
+        self._changes = []
         logger.debug(f"Collision system updated with {len(chests)} chests")
     
     def is_blocked(self, x, y):
@@ -79,6 +95,82 @@ class CollisionSystem:
         # Default to walkable (grass)
         return False
     
+    def get_walkable_grid(self):
+        """
+        Get the walkability of the whole world as a NumPy array
+        
+        The array is indexed [y, x] and cached until the world changes,
+        so callers must treat it as read-only.
+        
+        Returns:
+            numpy.ndarray: Boolean array, True where a tile can be entered
+        """
+        if self._walkable is None:
+            self._walkable = self._build_walkable_grid()
+        return self._walkable
+    
+    def _build_walkable_grid(self):
+        """Build the walkability array from terrain and closed chests"""
+        width = self.world_generator.width
+        height = self.world_generator.height
+        walkable = np.ones((height, width), dtype=bool)
+        
+        for (x, y), tile in (self.world or {}).items():
+            if 0 <= x < width and 0 <= y < height:
+                if type(tile).__name__.lower() in self.BLOCKING_TILES:
+                    walkable[y, x] = False
+        
+        for chest in self.chests:
+            if not chest['opened']:
+                walkable[chest['y'], chest['x']] = False
+        
+        logger.debug(f"Built {width}x{height} walkable grid (version {self.version})")
+        return walkable
+    
+    def refresh_tile(self, x, y):
+        """
+        Re-check a single tile after terrain or chest state changed
+        
+        Args:
+            x: X coordinate of the changed tile
+            y: Y coordinate of the changed tile
+            
+        Returns:
+            bool: True if the tile's walkability flipped
+        """
+        walkable = self.get_walkable_grid()
+        if not (0 <= x < walkable.shape[1] and 0 <= y < walkable.shape[0]):
+            return False
+        
+        now_walkable = not self.is_blocked(x, y)
+        if walkable[y, x] == now_walkable:
+            return False
+        
+        walkable[y, x] = now_walkable
+        self.version += 1
+        self._changes.append((self.version, x, y))
+        if len(self._changes) > self.MAX_CHANGE_LOG:
+            # Forget the oldest half; anyone that far behind rebuilds
+            self._rebuild_version = self._changes[len(self._changes) // 2][0] - 1
+            self._changes = self._changes[len(self._changes) // 2:]
+        logger.debug(f"Tile ({x}, {y}) walkability -> {now_walkable} (version {self.version})")
+        return True
+    
+    def changes_since(self, version):
+        """
+        Get the tiles whose walkability changed after a given version
+        
+        Args:
+            version: Walkability version the caller last synced with
+            
+        Returns:
+            set: (x, y) tiles that changed, or None if the caller is too
+                 far behind and must rebuild from get_walkable_grid()
+        """
+        if version < self._rebuild_version:
+            return None
+        return {(x, y) for v, x, y in self._changes if v > version}
+    
     def can_move(self, from_x, from_y, to_x, to_y):
         """
         Check if entity can move from one position to another
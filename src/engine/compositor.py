@@ -0,0 +1,137 @@
+"""
+Layer Compositor
+Builds the screen from ordered layers. Static layers (terrain, props) are
+flattened into a cached background surface and redrawn only where they were
+invalidated; dynamic layers (entities, UI) are drawn over a copy of that
+background in the screen's dirty regions
+"""
+import logging
+
+import pygame
+
+from engine.dirty_rects import DirtyRects
+from engine.sprite_atlas import display_format
+
+logger = logging.getLogger(__name__)
+
+
+class Layer:
+    """One named layer that draws itself inside a surface's clip"""
+
+    def __init__(self, name, draw, static=False, phase=None):
+        """
+        Initialize a layer
+
+        Args:
+            name: Layer name used to invalidate it
+            draw: Callable taking the surface to draw on (clip already set)
+            static: Flattened into the cached background when True
+            phase: FrameProfiler phase charged with its drawing time
+        """
+        self.name = name
+        self.draw = draw
+        self.static = static
+        self.phase = phase
+        self.draws = 0          # Clipped draw calls
+        self.invalidations = 0
+
+
+class Compositor:
+    """Ordered layers with per-layer invalidation"""
+
+    def __init__(self, width, height, tile_size, dirty, profiler=None):
+        """
+        Initialize the compositor
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+            tile_size: Invalidation granularity in pixels
+            dirty: DirtyRects for the screen (the caller presents it)
+            profiler: Optional FrameProfiler charged per layer
+        """
+        self.dirty = dirty
+        self.profiler = profiler
+        self.background = display_format(pygame.Surface((width, height)))
+        self.stale = DirtyRects(width, height, tile_size)  # Background regions to redraw
+        self.layers = []
+        self._by_name = {}
+
+    def add_layer(self, name, draw, static=False, phase=None):
+        """
+        Add a layer on top of the existing ones (static layers go under all dynamic ones)
+
+        Returns:
+            Layer: The new layer
+        """
+        layer = Layer(name, draw, static, phase)
+        self.layers.append(layer)
+        self.layers.sort(key=lambda existing: not existing.static)  # Stable: keeps order within each group
+        self._by_name[name] = layer
+        return layer
+
+    def invalidate(self, name, rect=None):
+        """
+        Redraw a layer's area next frame
+
+        Args:
+            name: Layer name
+            rect: Screen rectangle in pixels, or None for the whole screen
+        """
+        for tracker in self._trackers(name):
+            if rect is None:
+                tracker.mark_all()
+            else:
+                tracker.mark_rect(rect)
+
+    def invalidate_tiles(self, name, tiles):
+        """
+        Redraw a layer on some screen tiles next frame
+
+        Args:
+            name: Layer name
+            tiles: (x, y) screen tiles
+        """
+        for tracker in self._trackers(name):
+            tracker.mark_tiles(tiles)
+
+    def compose(self, screen):
+        """
+        Redraw the screen's dirty regions; the caller presents them
+
+        Args:
+            screen: Surface to draw on
+        """
+        if self.stale.pending:
+            background = self.background
+            for rect in self.stale.rects():
+                background.set_clip(rect)
+                self._draw_layers(background, True)
+            background.set_clip(None)
+            self.stale.clear()
+
+        for rect in self.dirty.rects():
+            screen.set_clip(rect)
+            screen.blit(self.background, rect, rect)
+            if self.profiler:
+                self.profiler.lap('world')  # Copying the background counts as world drawing
+            self._draw_layers(screen, False)
+        screen.set_clip(None)
+
+    def _draw_layers(self, surface, static):
+        """Draw the static or the dynamic layers, bottom up"""
+        profiler = self.profiler
+        for layer in self.layers:
+            if layer.static == static:
+                layer.draw(surface)
+                layer.draws += 1
+                if profiler and layer.phase:
+                    profiler.lap(layer.phase)
+
+    def _trackers(self, name):
+        """Dirty trackers a layer's invalidation goes to"""
+        layer = self._by_name[name]
+        layer.invalidations += 1
+        if layer.static:
+            return self.dirty, self.stale
+        return (self.dirty,)
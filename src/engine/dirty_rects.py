@@ -0,0 +1,151 @@
+"""
+Dirty Rectangles
+Tracks which screen tiles changed since the last frame so only those are
+redrawn and pushed with pygame.display.update(rects)
+"""
+import logging
+import pygame
+
+logger = logging.getLogger(__name__)
+
+FULL_REDRAW_RATIO = 0.5  # Above this share of dirty tiles, just redraw everything
+
+
+class DirtyRects:
+    """Collects dirty screen tiles and presents them"""
+
+    def __init__(self, screen_width, screen_height, tile_size, full_ratio=FULL_REDRAW_RATIO,
+                 framebuffer=None):
+        """
+        Initialize dirty tracking
+
+        Args:
+            screen_width: Screen width in pixels
+            screen_height: Screen height in pixels
+            tile_size: Tile size in pixels
+            full_ratio: Share of dirty tiles that triggers a full redraw
+            framebuffer: Framebuffer the screen is upscaled through, so pushed
+                         rects are mapped to the window
+        """
+        self.tile_size = tile_size
+        self.framebuffer = framebuffer
+        self.grid_width = (screen_width + tile_size - 1) // tile_size
+        self.grid_height = (screen_height + tile_size - 1) // tile_size
+        self.screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.max_tiles = int(self.grid_width * self.grid_height * full_ratio)
+        self.full = True  # The first frame always draws everything
+        self._tiles = set()
+        self._rects = None  # Merged rects, reused until the next mark
+
+        self.frames_presented = 0
+        self.frames_skipped = 0
+
+    @property
+    def pending(self):
+        """Check if anything needs drawing this frame"""
+        return self.full or bool(self._tiles)
+
+    def mark_all(self):
+        """Redraw the whole screen next frame"""
+        self.full = True
+        self._tiles.clear()
+        self._rects = None
+
+    def mark_tile(self, x, y):
+        """
+        Mark one screen tile dirty
+
+        Args:
+            x: Screen tile column
+            y: Screen tile row
+        """
+        if self.full or not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
+            return
+        self._tiles.add((x, y))
+        self._rects = None
+        if len(self._tiles) > self.max_tiles:
+            self.mark_all()
+
+    def mark_tiles(self, tiles):
+        """Mark several screen tiles dirty"""
+        for x, y in tiles:
+            self.mark_tile(x, y)
+
+    def mark_rect(self, rect):
+        """
+        Mark every tile under a pixel rectangle dirty (e.g. a message box)
+
+        Args:
+            rect: pygame.Rect or (x, y, width, height) in pixels
+        """
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width == 0 or rect.height == 0:
+            return
+        size = self.tile_size
+        for y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for x in range(rect.left // size, (rect.right - 1) // size + 1):
+                self.mark_tile(x, y)
+
+    def tiles(self):
+        """
+        Get the screen tiles to redraw
+
+        Returns:
+            list: (x, y) screen tiles, every tile when a full redraw is pending
+        """
+        if self.full:
+            return [(x, y) for y in range(self.grid_height) for x in range(self.grid_width)]
+        return sorted(self._tiles, key=lambda tile: (tile[1], tile[0]))
+
+    def rects(self):
+        """
+        Get the dirty area as pixel rectangles, merging runs along each row
+
+        Returns:
+            list: pygame.Rect regions to push to the display
+        """
+        if self.full:
+            return [self.screen_rect.copy()]
+        if self._rects is not None:
+            return self._rects
+        rects = []
+        size = self.tile_size
+        run = None
+        for x, y in self.tiles():
+            if run and run.top == y * size and run.right == x * size:
+                run.width += size
+            else:
+                run = pygame.Rect(x * size, y * size, size, size)
+                rects.append(run)
+        self._rects = [rect.clip(self.screen_rect) for rect in rects]
+        return self._rects
+
+    def clear(self):
+        """Forget everything marked without pushing it (e.g. an offscreen layer was redrawn)"""
+        self.full = False
+        self._tiles.clear()
+        self._rects = None
+
+    def present(self):
+        """
+        Push the dirty area to the display and start a new frame
+
+        Returns:
+            int: Number of rectangles pushed (0 if the frame was skipped)
+        """
+        if not self.pending:
+            self.frames_skipped += 1
+            return 0
+
+        if self.full:
+            pygame.display.flip()
+            pushed = 1
+        else:
+            rects = self.rects()
+            if self.framebuffer:
+                rects = [self.framebuffer.to_window(rect) for rect in rects]
+            pygame.display.update(rects)
+            pushed = len(rects)
+        self.frames_presented += 1
+        self.clear()
+        return pushed
@@ -0,0 +1,169 @@
+"""
+D* Lite Incremental Planner
+Keeps a shortest path to a fixed goal while the start moves and tiles change,
+repairing only the part of the search tree the changes affect
+"""
+import heapq
+import logging
+
+from engine.pathfinding import NEIGHBORS, manhattan
+
+logger = logging.getLogger(__name__)
+
+INF = float('inf')
+
+
+class DStarLite:
+    """Incremental 4-way planner over a walkable grid (Koenig & Likhachev)"""
+
+    def __init__(self, walkable, start, goal):
+        """
+        Initialize planner
+
+        Args:
+            walkable: Boolean array indexed [y, x]; may be updated in place
+            start: (x, y) tile the traveller stands on
+            goal: (x, y) tile to reach
+        """
+        self.walkable = walkable
+        self.start = start
+        self.goal = goal
+        self.km = 0
+        self._last = start
+
+        self.g = {}
+        self.rhs = {goal: 0}
+        self._queue = []
+        self._queued = {}  # node -> key currently valid in the heap
+
+        # Running count of nodes whose g/rhs were examined
+        self.touched = 0
+        self._push(goal, (manhattan(start, goal), 0))
+
+    def _is_open(self, node):
+        """Check if a tile is inside the grid and walkable"""
+        x, y = node
+        height, width = self.walkable.shape
+        return 0 <= x < width and 0 <= y < height and bool(self.walkable[y, x])
+
+    def _cost(self, a, b):
+        """
+        Cost of moving between two adjacent tiles
+
+        The traveller can always leave the tile it stands on, even a blocked
+        one (e.g. a chest), like the start tile in astar().
+        """
+        if (a == self.start or self._is_open(a)) and self._is_open(b):
+            return 1
+        return INF
+
+    def _key(self, node):
+        """Priority key for a node"""
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + manhattan(self.start, node) + self.km, best)
+
+    def _push(self, node, key):
+        """Queue a node (older heap entries for it become stale)"""
+        self._queued[node] = key
+        heapq.heappush(self._queue, (key, node))
+
+    def _top_key(self):
+        """Smallest valid key in the queue, dropping stale entries"""
+        while self._queue:
+            key, node = self._queue[0]
+            if self._queued.get(node) == key:
+                return key
+            heapq.heappop(self._queue)
+        return (INF, INF)
+
+    def _neighbors(self, node):
+        """Adjacent tiles of a node"""
+        x, y = node
+        return [(x + dx, y + dy) for dx, dy in NEIGHBORS]
+
+    def _update_vertex(self, node):
+        """Recompute a node's one-step lookahead and requeue it if inconsistent"""
+        self.touched += 1
+        if node != self.goal:
+            self.rhs[node] = min(
+                (self._cost(node, n) + self.g.get(n, INF) for n in self._neighbors(node)),
+                default=INF,
+            )
+        self._queued.pop(node, None)
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self._push(node, self._key(node))
+
+    def compute_shortest_path(self):
+        """
+        Repair the search tree until the start is consistent
+
+        Returns:
+            int: Number of nodes touched while repairing
+        """
+        touched_before = self.touched
+        while (self._top_key() < self._key(self.start) or
+               self.rhs.get(self.start, INF) != self.g.get(self.start, INF)):
+            if not self._queue:
+                break
+            old_key, node = heapq.heappop(self._queue)
+            if self._queued.get(node) != old_key:
+                continue
+            new_key = self._key(node)
+            if old_key < new_key:
+                self._push(node, new_key)
+                continue
+
+            del self._queued[node]
+            self.touched += 1
+            if self.g.get(node, INF) > self.rhs.get(node, INF):
+                self.g[node] = self.rhs[node]
+                for pred in self._neighbors(node):
+                    self._update_vertex(pred)
+            else:
+                self.g[node] = INF
+                self._update_vertex(node)
+                for pred in self._neighbors(node):
+                    self._update_vertex(pred)
+        return self.touched - touched_before
+
+    def move_start(self, start):
+        """
+        Tell the planner the traveller moved
+
+        Args:
+            start: New (x, y) tile of the traveller
+        """
+        self.km += manhattan(self._last, start)
+        self._last = start
+        self.start = start
+
+    def update_tiles(self, tiles):
+        """
+        Tell the planner some tiles changed walkability
+
+        Args:
+            tiles: Iterable of (x, y) tiles whose walkability flipped
+        """
+        for tile in tiles:
+            self._update_vertex(tile)
+            for neighbor in self._neighbors(tile):
+                self._update_vertex(neighbor)
+
+    def path_cost(self):
+        """Remaining distance to the goal (inf if unreachable)"""
+        return self.g.get(self.start, INF)
+
+    def next_step(self):
+        """
+        Get the best next tile from the start
+
+        Returns:
+            tuple: (x, y) of the next tile, or None if the goal is unreachable
+        """
+        if self.start == self.goal or self.path_cost() == INF:
+            return None
+        best = min(self._neighbors(self.start),
+                   key=lambda n: self._cost(self.start, n) + self.g.get(n, INF))
+        if self._cost(self.start, best) + self.g.get(best, INF) == INF:
+            return None
+        return best
@@ -0,0 +1,59 @@
+"""
+Event Pump
+Collects input events for the main loop, blocking on pygame.event.wait when
+nothing is animating so a static screen doesn't spin at full frame rate
+"""
+import logging
+import pygame
+
+logger = logging.getLogger(__name__)
+
+IDLE_WAIT_MS = 500  # Longest sleep before the loop wakes to check timers
+
+
+class EventPump:
+    """Polls events while busy, sleeps until input arrives while idle"""
+
+    def __init__(self, idle_wait_ms=IDLE_WAIT_MS):
+        """
+        Initialize the pump
+
+        Args:
+            idle_wait_ms: Default wait timeout in milliseconds while idle
+        """
+        self.idle_wait_ms = idle_wait_ms
+        self.idle = False
+        self.busy_frames = 0
+        self.idle_waits = 0
+        self.idle_timeouts = 0
+
+    def get(self, idle, timeout=None):
+        """
+        Get this frame's events
+
+        Args:
+            idle: True when no animation, timer or background task needs frames
+            timeout: Milliseconds until the caller's next timer is due; the
+                wait never exceeds idle_wait_ms either way
+
+        Returns:
+            list: Events to handle; empty after an idle timeout
+        """
+        if not idle:
+            if self.idle:
+                logger.debug("Leaving idle mode")
+            self.idle = False
+            self.busy_frames += 1
+            return pygame.event.get()
+
+        if not self.idle:
+            logger.debug("Entering idle mode")
+        self.idle = True
+        self.idle_waits += 1
+        wait_ms = self.idle_wait_ms if timeout is None else min(timeout, self.idle_wait_ms)
+        wait_ms = max(1, int(wait_ms))  # pygame waits forever on 0
+        event = pygame.event.wait(wait_ms)
+        if event.type == pygame.NOEVENT:
+            self.idle_timeouts += 1
+            return []
+        return [event] + pygame.event.get()
@@ -0,0 +1,109 @@
+"""
+Exploration Memory
+Remembers every tile the player has seen as one bit per tile, and saves it
+as compressed packed bits so fog of war stays small even on huge shells
+"""
+import base64
+import logging
+import zlib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAVE_ENCODING = "packbits+zlib+base64"
+
+
+class ExploredMap:
+    """Bitmap of explored tiles, rows packed 8 tiles per byte"""
+
+    def __init__(self, width, height):
+        """
+        Initialize an unexplored map
+
+        Args:
+            width: World width in tiles
+            height: World height in tiles
+        """
+        self.width = width
+        self.height = height
+        self.packed = np.zeros((height, (width + 7) // 8), dtype=np.uint8)
+        self.version = 0
+
+    def mark_visible(self, visible, bounds=None):
+        """
+        OR a visibility mask into the explored bits
+
+        Args:
+            visible: Boolean mask indexed [y, x] (e.g. FieldOfView.visible)
+            bounds: Optional (x0, y0, x1, y1) box containing every True tile,
+                    so only those rows are repacked
+        """
+        y0, y1 = (bounds[1], bounds[3]) if bounds else (0, self.height)
+        before = self.packed[y0:y1].copy()
+        self.packed[y0:y1] |= np.packbits(visible[y0:y1], axis=1)
+        if not np.array_equal(before, self.packed[y0:y1]):
+            self.version += 1
+
+    def is_explored(self, x, y):
+        """Check if a tile has ever been seen"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool((self.packed[y, x >> 3] >> (7 - (x & 7))) & 1)
+
+    def as_mask(self, y0=0, y1=None):
+        """
+        Unpack to a boolean array
+
+        Args:
+            y0: First row to unpack
+            y1: Row to stop before (defaults to the last row)
+
+        Returns:
+            numpy.ndarray: Boolean mask indexed [y - y0, x]
+        """
+        return np.unpackbits(self.packed[y0:y1], axis=1, count=self.width).astype(bool)
+
+    def explored_count(self):
+        """Number of explored tiles"""
+        return int(np.unpackbits(self.packed, axis=1, count=self.width).sum())
+
+    def nbytes(self):
+        """Size of the in-memory bitmap in bytes"""
+        return self.packed.nbytes
+
+    def to_save(self):
+        """
+        Serialize for the save file
+
+        Returns:
+            dict: JSON-friendly data with the compressed bitmap
+        """
+        compressed = zlib.compress(self.packed.tobytes(), 9)
+        return {
+            'width': self.width,
+            'height': self.height,
+            'encoding': SAVE_ENCODING,
+            'bits': base64.b64encode(compressed).decode('ascii'),
+        }
+
+    @classmethod
+    def from_save(cls, data):
+        """
+        Restore from save file data
+
+        Args:
+            data: Dictionary produced by to_save()
+
+        Returns:
+            ExploredMap: Restored map, or None if the data is missing or unreadable
+        """
+        if not data or data.get('encoding') != SAVE_ENCODING:
+            return None
+        explored = cls(data['width'], data['height'])
+        try:
+            raw = zlib.decompress(base64.b64decode(data['bits']))
+            explored.packed[:] = np.frombuffer(raw, dtype=np.uint8).reshape(explored.packed.shape)
+        except (ValueError, zlib.error) as e:
+            logger.error(f"Corrupt exploration data in save: {e}")
+            return None
+        return explored
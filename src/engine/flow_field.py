@@ -0,0 +1,177 @@
+"""
+Flow Field (Dijkstra map) System
+One shared distance field toward a target that any number of actors can follow
+"""
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Distance value for tiles that cannot reach the target
+UNREACHABLE = np.iinfo(np.int32).max
+
+# Step directions, indexed by the values stored in the direction array
+DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+NO_STEP = -1
+
+
+def compute_distance_field(walkable, target_x, target_y, max_distance=None):
+    """
+    Compute walking distances to a target with a vectorized wavefront
+
+    Each iteration grows the whole frontier by one tile using array shifts,
+    restricted to the frontier's bounding box, so the Python loop runs once
+    per distance ring instead of once per tile.
+
+    Args:
+        walkable: Boolean array indexed [y, x]
+        target_x: Target X coordinate
+        target_y: Target Y coordinate
+        max_distance: Stop expanding past this many steps (None = no limit)
+
+    Returns:
+        numpy.ndarray: int32 distances, UNREACHABLE where the target can't be reached
+    """
+    height, width = walkable.shape
+    distances = np.full((height, width), UNREACHABLE, dtype=np.int32)
+    if not (0 <= target_x < width and 0 <= target_y < height):
+        return distances
+
+    # The target itself may be blocked (e.g. a chest) - it still seeds the wave
+    distances[target_y, target_x] = 0
+    unvisited = walkable.copy()
+    unvisited[target_y, target_x] = False
+
+    frontier = np.zeros((height, width), dtype=bool)
+    frontier[target_y, target_x] = True
+    y0, y1, x0, x1 = target_y, target_y + 1, target_x, target_x + 1
+
+    step = 0
+    while max_distance is None or step < max_distance:
+        step += 1
+        # Window = frontier bounding box grown by one tile
+        wy0, wy1 = max(y0 - 1, 0), min(y1 + 1, height)
+        wx0, wx1 = max(x0 - 1, 0), min(x1 + 1, width)
+        front = frontier[wy0:wy1, wx0:wx1]
+
+        grown = np.zeros_like(front)
+        grown[1:, :] |= front[:-1, :]
+        grown[:-1, :] |= front[1:, :]
+        grown[:, 1:] |= front[:, :-1]
+        grown[:, :-1] |= front[:, 1:]
+        grown &= unvisited[wy0:wy1, wx0:wx1]
+
+        rows = np.flatnonzero(grown.any(axis=1))
+        if rows.size == 0:
+            break
+        cols = np.flatnonzero(grown.any(axis=0))
+
+        unvisited[wy0:wy1, wx0:wx1] &= ~grown
+        distances[wy0:wy1, wx0:wx1][grown] = step
+        front[:] = grown
+
+        y0, y1 = wy0 + rows[0], wy0 + rows[-1] + 1
+        x0, x1 = wx0 + cols[0], wx0 + cols[-1] + 1
+
+    return distances
+
+
+def compute_step_directions(distances):
+    """
+    Precompute the best step out of every tile of a distance field
+
+    Args:
+        distances: int32 distance array from compute_distance_field()
+
+    Returns:
+        numpy.ndarray: int8 index into DIRECTIONS, NO_STEP where no neighbor is closer
+    """
+    padded = np.pad(distances, 1, constant_values=UNREACHABLE)
+    neighbors = np.stack([
+        padded[:-2, 1:-1],   # up
+        padded[2:, 1:-1],    # down
+        padded[1:-1, :-2],   # left
+        padded[1:-1, 2:],    # right
+    ])
+    best = neighbors.argmin(axis=0).astype(np.int8)
+    best_distance = np.take_along_axis(neighbors, best[np.newaxis].astype(np.intp), axis=0)[0]
+    best[best_distance >= distances] = NO_STEP
+    return best
+
+
+class FlowField:
+    """Distance field toward one target, shared by every actor chasing it"""
+
+    def __init__(self, collision, max_distance=None):
+        """
+        Initialize flow field
+
+        Args:
+            collision: CollisionSystem providing the walkable grid
+            max_distance: Optional cap on how far the field spreads
+        """
+        self.collision = collision
+        self.max_distance = max_distance
+        self.target = None
+        self.version = None
+        self.distances = None
+        self.directions = None
+        self.rebuilds = 0
+
+    def update(self, target_x, target_y):
+        """
+        Bring the field up to date with the target and the world
+
+        Only recomputes when the target moved or the walkability version changed.
+
+        Args:
+            target_x: Target X coordinate (e.g. the hero)
+            target_y: Target Y coordinate
+
+        Returns:
+            bool: True if the field was recomputed
+        """
+        target = (target_x, target_y)
+        if target == self.target and self.collision.version == self.version:
+            return False
+
+        self.distances = compute_distance_field(
+            self.collision.get_walkable_grid(), target_x, target_y, self.max_distance
+        )
+        self.directions = compute_step_directions(self.distances)
+        self.target = target
+        self.version = self.collision.version
+        self.rebuilds += 1
+        logger.debug(f"Flow field rebuilt toward {target} (version {self.version})")
+        return True
+
+    def _in_bounds(self, x, y):
+        """Check if a position lies inside the field"""
+        return (self.distances is not None and
+                0 <= y < self.distances.shape[0] and 0 <= x < self.distances.shape[1])
+
+    def distance_at(self, x, y):
+        """
+        Get walking distance from a position to the target
+
+        Returns:
+            int: Number of steps, or None if unreachable
+        """
+        if not self._in_bounds(x, y):
+            return None
+        distance = int(self.distances[y, x])
+        return None if distance == UNREACHABLE else distance
+
+    def next_step(self, x, y):
+        """
+        Get the move an actor at (x, y) should make toward the target
+
+        Returns:
+            tuple: (dx, dy), or (0, 0) if already there or unreachable
+        """
+        if not self._in_bounds(x, y):
+            return (0, 0)
+        direction = self.directions[y, x]
+        if direction == NO_STEP:
+            return (0, 0)
+        return DIRECTIONS[direction]
@@ -0,0 +1,116 @@
+"""
+Field of View
+Visible-tile mask around the hero built from Terrain.blocks_sight, recomputed
+only when the hero moves or sight-blocking terrain changes
+"""
+import logging
+import numpy as np
+
+from engine.grid_backend import get_backend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RADIUS = 10
+
+
+class FieldOfView:
+    """Caches which tiles the hero can currently see"""
+
+    def __init__(self, radius=DEFAULT_RADIUS, backend=None):
+        """
+        Initialize field of view
+
+        Args:
+            radius: Sight radius in tiles (0 = unlimited)
+            backend: Grid backend used to cast sight (defaults to get_backend())
+        """
+        self.radius = radius
+        self.backend = backend or get_backend()
+        self.transparent = None
+        self.visible = None
+        self.version = 0
+        self.origin = None
+        self._computed_version = None
+        self.recomputes = 0
+        logger.info(f"Field of view initialized (radius {radius}, {self.backend.name} backend)")
+
+    def set_world(self, world, width, height):
+        """
+        Build the transparency array for a new world
+
+        Args:
+            world: Dictionary of terrain tiles keyed by (x, y)
+            width: World width in tiles
+            height: World height in tiles
+        """
+        self.transparent = np.ones((height, width), dtype=bool)
+        for (x, y), tile in world.items():
+            if 0 <= x < width and 0 <= y < height and tile.blocks_sight:
+                self.transparent[y, x] = False
+        self.visible = np.zeros((height, width), dtype=bool)
+        self.version += 1
+        self.origin = None
+
+    def refresh_tile(self, x, y, tile):
+        """
+        Re-check a tile after its terrain changed
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            tile: New terrain at (x, y), or None for open ground
+
+        Returns:
+            bool: True if the tile's transparency flipped
+        """
+        transparent = tile is None or not tile.blocks_sight
+        if self.transparent[y, x] == transparent:
+            return False
+        self.transparent[y, x] = transparent
+        self.version += 1
+        return True
+
+    def update(self, x, y):
+        """
+        Recompute visibility if the viewer moved or sight-blocking terrain changed
+
+        Args:
+            x: Viewer X coordinate
+            y: Viewer Y coordinate
+
+        Returns:
+            bool: True if the visible mask was recomputed
+        """
+        if self.transparent is None:
+            return False
+        if self.origin == (x, y) and self._computed_version == self.version:
+            return False
+
+        self.visible = self.backend.compute_fov(self.transparent, x, y, self.radius)
+        self.origin = (x, y)
+        self._computed_version = self.version
+        self.recomputes += 1
+        return True
+
+    def bounds(self):
+        """
+        Get the box that can contain visible tiles
+
+        Returns:
+            tuple: Half-open (x0, y0, x1, y1), or None before the first update
+        """
+        if self.origin is None:
+            return None
+        height, width = self.visible.shape
+        if self.radius <= 0:
+            return (0, 0, width, height)
+        x, y = self.origin
+        return (max(x - self.radius, 0), max(y - self.radius, 0),
+                min(x + self.radius + 1, width), min(y + self.radius + 1, height))
+
+    def is_visible(self, x, y):
+        """Check if a tile is currently visible"""
+        if self.visible is None:
+            return True
+        height, width = self.visible.shape
+        return 0 <= x < width and 0 <= y < height and bool(self.visible[y, x])
@@ -0,0 +1,194 @@
+"""
+Frame Profiler
+Per-phase frame timings (input, update, autosave, world, entities, menu,
+hud, flip) in a rolling NumPy history, and a debug HUD that graphs them
+"""
+import logging
+import time
+
+import numpy as np
+import pygame
+
+from engine.render_cache import RenderCache
+from engine.text_cache import TextCache
+
+logger = logging.getLogger(__name__)
+
+PHASES = ('input', 'update', 'autosave', 'world', 'entities', 'menu', 'hud', 'flip')
+PHASE_COLORS = {
+    'input': (252, 116, 96),
+    'update': (248, 184, 0),
+    'autosave': (216, 0, 204),
+    'world': (0, 168, 0),
+    'entities': (60, 188, 252),
+    'menu': (188, 188, 188),
+    'hud': (104, 68, 252),
+    'flip': (248, 56, 0),
+}
+HISTORY = 120           # Frames kept for the graph and averages
+FRAME_BUDGET_MS = 1000 / 60
+
+
+class FrameProfiler:
+    """Splits each frame into timed phases and keeps a rolling history"""
+
+    def __init__(self, history=HISTORY, budget_ms=FRAME_BUDGET_MS):
+        """
+        Initialize an empty history
+
+        Args:
+            history: Frames kept
+            budget_ms: Frame time above which a frame counts as dropped
+        """
+        self.history = history
+        self.budget_ms = budget_ms
+        self.phase_ms = np.zeros((history, len(PHASES)))  # [frame, phase]
+        self.interval_ms = np.zeros(history)              # Time since the previous frame began
+        self.frames = 0
+        self.dropped = 0
+        self._index = {name: i for i, name in enumerate(PHASES)}
+        self._current = self.phase_ms[0]
+        self._frame_start = None
+        self._lap_start = None
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        now = time.perf_counter()
+        row = self.frames % self.history
+        self._current = self.phase_ms[row]
+        self._current[:] = 0
+        self.interval_ms[row] = (now - self._frame_start) * 1000 if self._frame_start else 0
+        self._frame_start = self._lap_start = now
+
+    def lap(self, phase):
+        """
+        Charge the time since the last lap to a phase
+
+        Args:
+            phase: Name from PHASES; a phase can be charged several times a frame
+        """
+        if self._lap_start is None:
+            return
+        now = time.perf_counter()
+        self._current[self._index[phase]] += (now - self._lap_start) * 1000
+        self._lap_start = now
+
+    def end_frame(self):
+        """Close the frame and count it as dropped if it ran over budget"""
+        if self._lap_start is None:
+            return
+        if self._current.sum() > self.budget_ms:
+            self.dropped += 1
+        self.frames += 1
+        self._lap_start = None
+
+    def recent(self):
+        """
+        Get the recorded frames, oldest first
+
+        Returns:
+            numpy.ndarray: [frame, phase] milliseconds
+        """
+        count = min(self.frames, self.history)
+        start = self.frames % self.history if self.frames > self.history else 0
+        return np.roll(self.phase_ms, -start, axis=0)[:count]
+
+    def averages(self):
+        """
+        Get the mean time per phase over the history
+
+        Returns:
+            dict: Phase name -> milliseconds
+        """
+        recent = self.recent()
+        means = recent.mean(axis=0) if len(recent) else np.zeros(len(PHASES))
+        return dict(zip(PHASES, means.tolist()))
+
+    def fps(self):
+        """Frames per second from the time between frame starts"""
+        count = min(self.frames, self.history)
+        intervals = self.interval_ms[:count]
+        intervals = intervals[intervals > 0]
+        return 1000 / intervals.mean() if len(intervals) else 0.0
+
+
+class FrameHUD:
+    """Debug overlay: FPS, dropped frames, per-phase numbers and a stacked graph"""
+
+    def __init__(self, position=(4, 4), line_height=11, refresh_frames=15):
+        """
+        Initialize the overlay
+
+        Args:
+            position: Top-left screen position
+            line_height: Pixels per text line
+            refresh_frames: Frames between number updates, so they stay readable
+        """
+        self.line_height = line_height
+        self.refresh_frames = refresh_frames
+        self.graph_height = line_height * len(PHASES)  # One frame budget tall
+        self.rect = pygame.Rect(position, (HISTORY + 110, self.graph_height + line_height + 10))
+        self.font = None
+        self.render_cache = RenderCache()
+        self.text_cache = TextCache(max_entries=64)
+        self._graph = pygame.Surface((HISTORY, self.graph_height))
+        self._pixels = np.zeros((self.graph_height, HISTORY, 3), dtype=np.uint8)
+        self._palette = np.array([PHASE_COLORS[name] for name in PHASES], dtype=np.uint8)
+        self._lines = []
+        self._shown_at = None
+        self._graph_at = None  # Profiler frame the graph was drawn for
+
+    def draw(self, screen, profiler):
+        """
+        Draw the overlay
+
+        Args:
+            screen: Surface to draw on
+            profiler: FrameProfiler to show
+        """
+        if self.font is None:
+            self.font = pygame.font.Font(None, 14)
+        if self._shown_at is None or profiler.frames - self._shown_at >= self.refresh_frames:
+            self._lines = self._text_lines(profiler)
+            self._shown_at = profiler.frames
+
+        screen.blit(self.render_cache.panel(self.rect.size, (0, 0, 0), (188, 188, 188), 1), self.rect)
+        x, y = self.rect.x + 4, self.rect.y + 4
+        header, legend = self._lines[0], self._lines[1:]
+        screen.blit(self.text_cache.render(self.font, header, True, (248, 248, 248)), (x, y))
+
+        y += self.line_height + 2
+        if self._graph_at != profiler.frames:  # Drawn once per frame, even if clipped draws repeat
+            self._draw_graph(profiler)
+            self._graph_at = profiler.frames
+        screen.blit(self._graph, (x, y))
+        column = x + HISTORY + 4
+        for i, (name, text) in enumerate(zip(PHASES, legend)):
+            line_y = y + i * self.line_height
+            screen.fill(PHASE_COLORS[name], (column, line_y + 2, 6, 6))
+            screen.blit(self.text_cache.render(self.font, text, True, (188, 188, 188)), (column + 9, line_y))
+
+    def _text_lines(self, profiler):
+        """Header line, then one 'phase ms' line per phase"""
+        averages = profiler.averages()
+        total = sum(averages.values())
+        lines = [f"{profiler.fps():.0f} fps  {total:.2f} ms  dropped {profiler.dropped}"]
+        lines.extend(f"{name} {averages[name]:.2f}" for name in PHASES)
+        return lines
+
+    def _draw_graph(self, profiler):
+        """Stack each frame's phase times as a coloured bar; the full height is one frame budget"""
+        recent = profiler.recent()
+        height = self.graph_height
+        pixels = self._pixels
+        pixels[:] = 0
+        if len(recent):
+            scale = height / profiler.budget_ms
+            tops = np.cumsum(recent, axis=1) * scale
+            bottoms = tops - recent * scale
+            rows = np.arange(height)[::-1, None] + 0.5  # Pixel centres, counted up from the bottom
+            bars = pixels[:, HISTORY - len(recent):]
+            for phase in range(len(PHASES)):
+                bars[(rows >= bottoms[:, phase]) & (rows < tops[:, phase])] = self._palette[phase]
+        pixels[0, ::2] = (248, 248, 248)  # Budget line; longer frames are clipped at it
+        pygame.surfarray.blit_array(self._graph, pixels.swapaxes(0, 1))
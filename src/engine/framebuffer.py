@@ -0,0 +1,114 @@
+"""
+Framebuffer
+A small native-resolution surface the world is drawn into, upscaled by a
+whole-number factor into the window (letterboxed when the window isn't an
+exact multiple)
+"""
+import logging
+
+import pygame
+
+from engine.sprite_atlas import display_format
+
+logger = logging.getLogger(__name__)
+
+
+class Framebuffer:
+    """Native surface plus its integer upscale into the window"""
+
+    def __init__(self, width, height, window):
+        """
+        Initialize the framebuffer
+
+        Args:
+            width: Native width in pixels
+            height: Native height in pixels
+            window: Display surface to upscale into
+        """
+        self.surface = display_format(pygame.Surface((width, height)))
+        self.rect = self.surface.get_rect()
+        self.window = None
+        self.scale = 1
+        self.dest = self.rect.copy()
+        self._target = None  # Window subsurface covering dest
+        self.resize(window)
+
+    def resize(self, window):
+        """
+        Fit the largest whole-number scale into a (new) window
+
+        Args:
+            window: Display surface after a resize or mode change
+        """
+        self.window = window
+        width, height = window.get_size()
+        self.scale = max(1, min(width // self.rect.width, height // self.rect.height))
+        self.dest = pygame.Rect(0, 0, self.rect.width * self.scale, self.rect.height * self.scale)
+        self.dest.center = window.get_rect().center
+        self.dest.clamp_ip(window.get_rect())
+        # A scale of 2+ always fits; at 1 a smaller window just crops
+        self._target = window.subsurface(self.dest) if self.scale > 1 else None
+        self.fill_letterbox()
+        logger.info(f"Framebuffer {self.rect.size} x{self.scale} into {width}x{height}")
+
+    def fill_letterbox(self):
+        """Paint the window outside dest black (UI such as the menu may have drawn there)"""
+        width, height = self.window.get_size()
+        dest = self.dest
+        for rect in [(0, 0, width, dest.top), (0, dest.bottom, width, height - dest.bottom),
+                     (0, dest.top, dest.left, dest.height), (dest.right, dest.top, width - dest.right, dest.height)]:
+            if rect[2] > 0 and rect[3] > 0:
+                self.window.fill((0, 0, 0), rect)
+
+    def to_window(self, rect):
+        """
+        Get the window area a native rectangle is scaled onto
+
+        Args:
+            rect: Native pygame.Rect
+
+        Returns:
+            pygame.Rect: Window rectangle
+        """
+        scale = self.scale
+        return pygame.Rect(self.dest.x + rect.x * scale, self.dest.y + rect.y * scale,
+                           rect.width * scale, rect.height * scale)
+
+    def to_native(self, rect):
+        """
+        Get the native area under a window rectangle (rounded outward)
+
+        Args:
+            rect: pygame.Rect or (x, y, width, height) in window pixels
+
+        Returns:
+            pygame.Rect: Native rectangle, clipped to the framebuffer
+        """
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        left = (rect.left - self.dest.x) // scale
+        top = (rect.top - self.dest.y) // scale
+        right = -(-(rect.right - self.dest.x) // scale)
+        bottom = -(-(rect.bottom - self.dest.y) // scale)
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.rect)
+
+    def upscale(self, rects=None):
+        """
+        Scale native areas into the window
+
+        Args:
+            rects: Native rectangles to copy, or None for the whole framebuffer
+                   (which also repaints the letterbox)
+        """
+        if rects is None:
+            self.fill_letterbox()
+        if self._target is None:
+            for rect in rects or [self.rect]:
+                self.window.blit(self.surface, self.to_window(rect), rect)
+        elif rects is None:
+            pygame.transform.scale(self.surface, self.dest.size, self._target)
+        else:
+            for rect in rects:
+                scaled = self.to_window(rect).move(-self.dest.x, -self.dest.y)
+                pygame.transform.scale(self.surface.subsurface(rect), scaled.size,
+                                       self._target.subsurface(scaled))
@@ -30,6 +30,15 @@ from engine.game_state import GameState
 from engine.renderer import Renderer
 from engine.input_handler import InputHandler
 from engine.simple_menu import SimpleMenu
+from engine.collision import CollisionSystem
+from engine.auto_travel import AutoTravel
+from engine.fov import FieldOfView
+from engine.grid_backend import get_backend
+from engine.dirty_rects import DirtyRects
+from engine.event_pump import EventPump
+from engine.frame_profiler import FrameProfiler, FrameHUD
+from engine.framebuffer import Framebuffer
+from engine.minimap import Minimap, palette_from_atlas
 
 # Game constants
 SPRITE_SIZE = 32
@@ -38,26 +47,66 @@ GRID_HEIGHT = 19
 WINDOW_WIDTH = GRID_WIDTH * SPRITE_SIZE
 WINDOW_HEIGHT = GRID_HEIGHT * SPRITE_SIZE
 FPS = 60
+AUTO_TRAVEL_STEP_MS = 80  # Delay between auto-travel steps
 
 class Game:
     """Main game class - coordinates all systems"""
     
-    def __init__(self):
+    def __init__(self, headless=False, fov_backend=None, tile_size=SPRITE_SIZE):
+        """
+        Initialize the game
+        
+        Args:
+            headless: Render offscreen through SDL's dummy video driver (no window)
+            fov_backend: Grid backend name for sight ("tcod"/"python"), None for the default
+            tile_size: Native tile size; below SPRITE_SIZE the world is drawn into a
+                       small framebuffer upscaled to a resizable window
+        """
         logger.info("=== NES Roguelike Starting ===")
         
         # Initialize pygame
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Must be set before the display starts
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.tile_size = tile_size
+        if tile_size == SPRITE_SIZE:
+            self.window = self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.framebuffer = None
+        else:
+            self.window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE)
+            self.framebuffer = Framebuffer(GRID_WIDTH * tile_size, GRID_HEIGHT * tile_size, self.window)
+            self.screen = self.framebuffer.surface  # The world is drawn here at native size
         pygame.display.set_caption("NES Roguelike")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 32)
         
         # Initialize game systems
         self.game_state = GameState(GRID_WIDTH, GRID_HEIGHT)
-        self.renderer = Renderer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.renderer = Renderer(*self.screen.get_size(), tile_size)
         self.input_handler = InputHandler()
         self.menu = SimpleMenu(WINDOW_WIDTH, WINDOW_HEIGHT)
         self.world_generator = WorldGenerator(GRID_WIDTH * 2, GRID_HEIGHT * 2)
+        self.collision = CollisionSystem(self.world_generator)
+        self.game_state.collision = self.collision
+        self.game_state.fov = FieldOfView(backend=get_backend(fov_backend))
+        self.auto_travel = AutoTravel(self.game_state, self.collision)
+        self.input_handler.auto_travel = self.auto_travel
+        self.last_travel_step = 0
+        
+        # Only redraw and push what changed each frame
+        self.dirty = DirtyRects(*self.screen.get_size(), tile_size, framebuffer=self.framebuffer)
+        self.last_view = None
+        
+        # Sleep on the event queue while nothing is moving
+        self.events = EventPump()
+        
+        # Per-phase frame timings, shown with F3
+        self.profiler = FrameProfiler()
+        self.hud = FrameHUD()
+        
+        # Whole-shell overview in the top-right corner, toggled with N
+        terrain = ('grass', 'river', 'rock', 'tree', 'bridge')
+        self.minimap = Minimap(palette_from_atlas(self.renderer.atlas, terrain), self.minimap_corner())
         
         # Start new game
         self.new_game()
@@ -80,11 +129,166 @@ class Game:
                 chest_data['y'],
                 chest_data['item']
             )
+        self.collision.set_world(world, self.game_state.chests)
+        self.renderer.set_world(self.game_state)
+        self.minimap.set_world(world, self.world_generator.width, self.world_generator.height,
+                               self.game_state.chests)
+        self.dirty.mark_all()
+        self.last_view = None
         
         logger.info(f"World generated: {self.world_generator.width}x{self.world_generator.height}")
         logger.info(f"Hero at ({hero.x}, {hero.y})")
         logger.info(f"{len(self.game_state.chests)} chests placed")
     
+    def track_changes(self, now_ms):
+        """
+        Compare the view with last frame and mark what needs redrawing
+        
+        Args:
+            now_ms: Frame time in ms (drives tile animation)
+        """
+        gs = self.game_state
+        view = {
+            'camera': self.renderer.camera.offset(),
+            'hero': self.renderer.hero_sprite.offset(),
+            'menu': (self.input_handler.menu_open, self.menu.cursor),
+            'opened': [chest['opened'] for chest in gs.chests],
+            'fov': gs.fov.recomputes,
+            'hud': self.input_handler.hud_open,
+            'minimap': (self.input_handler.minimap_open, self.minimap.version),
+        }
+        last = self.last_view
+        self.last_view = view
+        
+        # Re-bake opened chests every frame, even ones opened while the view scrolls
+        if last is not None and len(view['opened']) == len(last['opened']):
+            for chest, was_opened in zip(gs.chests, last['opened']):
+                if chest['opened'] != was_opened:
+                    self.renderer.refresh_tile(chest['x'], chest['y'])
+                    self.minimap.refresh_tiles([(chest['x'], chest['y'])])
+                    self.mark_pixels(chest['x'] * self.tile_size, chest['y'] * self.tile_size)
+        
+        if (last is None or view['camera'] != last['camera'] or view['menu'] != last['menu']
+                or len(view['opened']) != len(last['opened'])):
+            self.dirty.mark_all()
+        elif view['hero'] != last['hero']:
+            for hero_x, hero_y in (last['hero'], view['hero']):
+                self.mark_pixels(hero_x, hero_y)
+        
+        if last is None or view['fov'] != last['fov']:
+            changed = self.renderer.update_fog(gs)
+            for x, y in changed:
+                self.mark_pixels(x * self.tile_size, y * self.tile_size)
+            self.minimap.reveal(changed)
+        for x, y in self.renderer.animate(now_ms):
+            self.mark_pixels(x * self.tile_size, y * self.tile_size)
+        
+        # The HUD graph scrolls every frame; closing it uncovers the view
+        if view['hud'] or (last is not None and last['hud']):
+            self.mark_window(self.hud.rect)
+        
+        # The minimap only changes when a tile is revealed, a chest opens or the hero moves
+        self.minimap.move_hero(gs.hero_x, gs.hero_y)
+        if last is not None and (view['minimap'] != last['minimap']
+                                 and (view['minimap'][0] or last['minimap'][0])):
+            self.mark_window(self.minimap.rect)
+        
+        # The menu overlay is translucent, so it can't be patched piecemeal
+        if self.input_handler.menu_open and self.dirty.pending:
+            self.dirty.mark_all()
+    
+    def mark_pixels(self, world_x, world_y):
+        """Mark the screen area under one tile-sized box at a world pixel position"""
+        camera_x, camera_y = self.last_view['camera']
+        self.dirty.mark_rect((world_x - camera_x, world_y - camera_y, self.tile_size, self.tile_size))
+    
+    def mark_window(self, rect):
+        """Mark the screen area under a window rectangle (UI drawn over the upscaled view)"""
+        self.dirty.mark_rect(self.framebuffer.to_native(rect) if self.framebuffer else rect)
+    
+    def resize_window(self):
+        """Refit the framebuffer and menu after the window was resized"""
+        self.window = pygame.display.get_surface()
+        self.framebuffer.resize(self.window)
+        self.menu.resize(*self.window.get_size())
+        self.minimap.place(self.minimap_corner())
+        self.dirty.mark_all()
+    
+    def minimap_corner(self):
+        """Window position of the minimap's top-right corner (inside the letterbox)"""
+        view = self.framebuffer.dest if self.framebuffer else self.window.get_rect()
+        return (view.right - 4, view.top + 4)
+    
+    def render(self, now_ms=None):
+        """
+        Redraw the parts of the screen that changed and push them
+        
+        Args:
+            now_ms: Frame time in ms for animation (default: pygame.time.get_ticks())
+        """
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+        self.renderer.update_motion(self.game_state, now_ms)
+        self.track_changes(now_ms)
+        self.profiler.lap('update')
+        if not self.dirty.pending:
+            self.dirty.present()
+            self.profiler.lap('flip')
+            return
+        
+        rects = self.dirty.rects()
+        self.renderer.render_view(self.screen, self.game_state, rects, self.profiler)
+        if self.framebuffer:
+            self.framebuffer.upscale(None if self.dirty.full else rects)
+            self.profiler.lap('world')
+        
+        if self.input_handler.minimap_open:
+            self.minimap.draw(self.window)
+            self.profiler.lap('hud')
+        
+        # Render menu if open (UI is drawn on the window at full resolution)
+        if self.input_handler.menu_open:
+            self.menu.render(self.window, self.font, self.game_state)
+        self.profiler.lap('menu')
+        
+        if self.input_handler.hud_open:
+            self.hud.draw(self.window, self.profiler)
+            self.profiler.lap('hud')
+        
+        self.dirty.present()
+        self.profiler.lap('flip')
+    
+    def is_idle(self):
+        """Check if the loop can sleep until the next input event"""
+        return not (self.auto_travel.active or self.renderer.moving or self.dirty.pending
+                    or self.input_handler.hud_open)
+    
+    def step(self, events, now_ms):
+        """
+        Run one frame: input, auto-travel, render
+        
+        Args:
+            events: Input events for this frame
+            now_ms: Frame time in ms (real in run(), simulated when headless)
+        
+        Returns:
+            bool: False when the game should quit
+        """
+        self.profiler.begin_frame()
+        if self.framebuffer and any(event.type == pygame.VIDEORESIZE for event in events):
+            self.resize_window()
+        running = self.input_handler.handle_events(self.game_state, self.menu, events)
+        self.profiler.lap('input')
+        
+        # Auto-travel moves one tile per step interval
+        if self.auto_travel.active and now_ms - self.last_travel_step >= AUTO_TRAVEL_STEP_MS:
+            self.auto_travel.step()
+            self.last_travel_step = now_ms
+        
+        self.render(now_ms)
+        self.profiler.end_frame()
+        return running
+    
     def run(self):
         """Main game loop"""
         logger.info("Starting game loop")
@@ -92,20 +296,13 @@ class Game:
         
         try:
             while running:
-                # Handle input
-                running = self.input_handler.handle_events(self.game_state, self.menu)
-                
-                # Render
-                self.screen.fill((0, 0, 0))
-                self.renderer.render_world(self.screen, self.game_state, GRID_WIDTH, GRID_HEIGHT)
-                self.renderer.render_chests(self.screen, self.game_state)
-                self.renderer.render_hero(self.screen, self.game_state)
-                
-                # Render menu if open
-                if self.input_handler.menu_open:
-                    self.menu.render(self.screen, self.font, self.game_state)
-                
-                pygame.display.flip()
+                # Handle input, sleeping on the queue while idle
+                idle = self.is_idle()
+                animation_due_in = self.renderer.animation_due_in(pygame.time.get_ticks())
+                events = self.events.get(idle, animation_due_in)
+                if idle and not events and animation_due_in is None:
+                    continue  # Nothing happened, so nothing to redraw
+                running = self.step(events, pygame.time.get_ticks())
                 self.clock.tick(FPS)
                 
         except Exception as e:
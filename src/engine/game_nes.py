@@ -32,6 +32,20 @@ from environment.items.treasure import TreasureChest
 from engine.menu import MenuSystem
 from engine.save_system import SaveSystem
 from engine.collision import CollisionSystem
+from engine.fov import FieldOfView
+from engine.exploration import ExploredMap
+from engine.dirty_rects import DirtyRects
+from engine.event_pump import EventPump
+from engine.world_layer import WorldLayer, HIDDEN, DIM
+from engine.compositor import Compositor
+from engine.sprite_atlas import SpriteAtlas
+from engine.palette import IndexedPalette
+from engine.render_cache import RenderCache
+from engine.text_cache import TextCache
+from engine.frame_profiler import FrameProfiler, FrameHUD
+from engine.minimap import Minimap
+from engine.particles import ParticlePool
+from engine.sprite_factory import new_pixels, pixel_coords, fill_rect, stamp, to_surface
 
 # Game constants
 SPRITE_SIZE = 32  # 32x32 pixel sprites for NES style
@@ -41,6 +55,10 @@ WINDOW_WIDTH = GRID_WIDTH * SPRITE_SIZE
 WINDOW_HEIGHT = GRID_HEIGHT * SPRITE_SIZE
 FPS = 60
 
+FOG_TINT = (90, 90, 120)  # Multiplied into tiles outside the field of view
+CHEST_BURST = 400  # Sparks when a chest opens (Options > Particles)
+CHEST_SPARKS = [(255, 215, 0), (248, 184, 0), (252, 216, 168), (255, 255, 255)]
+
 # NES Color Palette
 NES_COLORS = {
     'black': (0, 0, 0),
@@ -56,6 +74,29 @@ NES_COLORS = {
     'ui_text': (248, 248, 248) # Off-white for text
 }
 
+# Per-shell recolouring of the sprite colours above: swaps replace exact
+# sprite colours, tint multiplies everything (255 = unchanged)
+SHELL_THEMES = {
+    1: None,  # The Mist Surface - the base palette
+    2: {'tint': (230, 215, 200),  # The Industrial Depths - rust and soot
+        'swaps': {(0, 168, 0): (136, 112, 0), (0, 180, 0): (124, 100, 0),
+                  (0, 88, 248): (88, 88, 88), (0, 120, 248): (112, 112, 112), (88, 160, 248): (152, 152, 152)}},
+    3: {'tint': (255, 240, 210),  # The Forgotten Cities - sandstone
+        'swaps': {(0, 168, 0): (200, 168, 100), (0, 180, 0): (216, 184, 112),
+                  (0, 120, 0): (80, 120, 40), (0, 100, 0): (64, 100, 32)}},
+    4: {'tint': (255, 200, 170),  # The Burning Wastes - ash and lava
+        'swaps': {(0, 168, 0): (80, 48, 40), (0, 180, 0): (96, 56, 48),
+                  (0, 88, 248): (228, 40, 0), (0, 120, 248): (248, 120, 0), (88, 160, 248): (252, 216, 80),
+                  (0, 120, 0): (40, 28, 24), (0, 100, 0): (28, 20, 16)}},
+    5: {'tint': (210, 225, 255),  # The Frozen Betrayal - snow and ice
+        'swaps': {(0, 168, 0): (224, 232, 248), (0, 180, 0): (200, 216, 240),
+                  (0, 88, 248): (120, 200, 252), (0, 120, 248): (168, 228, 252), (88, 160, 248): (240, 252, 252),
+                  (0, 120, 0): (0, 88, 88), (0, 100, 0): (0, 64, 72)}},
+    6: {'tint': (210, 170, 255),  # The Corrupted Core - violet
+        'swaps': {(0, 168, 0): (88, 0, 120), (0, 180, 0): (104, 16, 136),
+                  (0, 88, 248): (216, 0, 204), (0, 120, 248): (248, 88, 232), (88, 160, 248): (252, 184, 248)}},
+}
+
 class Game:
     def __init__(self):
         logger.info("Initializing NES Roguelike")
@@ -71,6 +112,8 @@ class Game:
         self.treasure = None
         self.equipment = EquipmentManager()
         self.collision = CollisionSystem(self.world_generator)
+        self.fov = FieldOfView()
+        self.explored = None
         
         self.camera_x = 0
         self.camera_y = 0
@@ -81,16 +124,63 @@ class Game:
         self.menu = MenuSystem(WINDOW_WIDTH, WINDOW_HEIGHT)
         self.save_system = SaveSystem()
         
-        self.auto_save_counter = 0
-        self.auto_save_interval = 300  # Auto-save every 5 seconds (300 frames at 60 FPS)
+        self.auto_save_interval = 5000  # Auto-save every 5 seconds (ms, so idle waits don't stretch it)
+        self.last_auto_save = pygame.time.get_ticks()
         
         # Message system
         self.message = ""
         self.message_timer = 0
         self.message_duration = 180  # 3 seconds at 60 FPS
-        
-        # Create sprite surfaces
-        self.sprites = self._create_sprites()
+        self.message_surf = None  # Text rendered once per message
+        self.message_box = None
+        self.message_pos = None
+        
+        # Panels and overlays are built once and reused every frame
+        self.render_cache = RenderCache()
+        self.text_cache = TextCache()
+        
+        # Only redraw and push what changed each frame
+        self.dirty = DirtyRects(WINDOW_WIDTH, WINDOW_HEIGHT, SPRITE_SIZE)
+        
+        # Sleep on the event queue while nothing is moving
+        self.events = EventPump()
+        
+        # Per-phase frame timings, shown with F3
+        self.profiler = FrameProfiler()
+        self.hud = FrameHUD()
+        self.show_hud = False
+        
+        # Whole-shell overview in the top-right corner, toggled with N
+        terrain = ('grass', 'river', 'rock', 'tree', 'bridge')
+        self.minimap = Minimap({name: NES_COLORS[name] for name in terrain}, (WINDOW_WIDTH - 4, 4))
+        self.show_minimap = False
+        self.minimap_version = None  # Version last composited
+        
+        # Effects; positions are world pixels, simulated once per update()
+        self.particles = ParticlePool()
+        self.particle_rect = None  # Screen area the particles covered last frame
+        self.last_update = pygame.time.get_ticks()
+        
+        # Create sprite surfaces once as 8-bit indices; shell themes only swap the palette
+        self.palette = IndexedPalette()
+        self.shell = 1
+        self.atlas = SpriteAtlas.from_sprites(self._create_sprites(), SPRITE_SIZE, self.palette)
+        self.hero_id = self.atlas.id_of('hero')
+        self.world_layer = WorldLayer(self.atlas, FOG_TINT)
+        for name, frames in self._create_animations().items():
+            self.world_layer.add_animation(name, frames)
+        self.chest_ids = {(opened, variant): self.atlas.id_of('chest_open' if opened else 'chest', variant)
+                          for opened in (False, True) for variant in (None, 'dim')}
+        
+        # Screen layers, bottom up; terrain and props are cached offscreen
+        self.compositor = Compositor(WINDOW_WIDTH, WINDOW_HEIGHT, SPRITE_SIZE, self.dirty, self.profiler)
+        self.compositor.add_layer('terrain', self.draw_terrain, static=True, phase='world')
+        self.compositor.add_layer('props', self.draw_props, static=True, phase='world')
+        self.compositor.add_layer('entities', self.draw_entities, phase='entities')
+        self.compositor.add_layer('particles', self.draw_particles, phase='entities')
+        self.compositor.add_layer('minimap', self.draw_minimap, phase='hud')
+        self.compositor.add_layer('ui', self.draw_ui, phase='menu')
+        self.compositor.add_layer('hud', self.draw_hud, phase='hud')
         
         self.new_game()
         logger.info("Game initialized successfully")
@@ -99,32 +189,21 @@ class Game:
         """Create 32x32 NES-style pixel art sprite surfaces"""
         sprites = {}
         
-        # Grass sprite - detailed pixel art
-        grass = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        grass_pixels = [
-            [0, 168, 0], [0, 180, 0], [0, 168, 0], [0, 180, 0]
-        ]
-        for y in range(SPRITE_SIZE):
-            for x in range(SPRITE_SIZE):
-                color_idx = (x // 8 + y // 8) % 2
-                base_color = grass_pixels[color_idx * 2] if color_idx == 0 else grass_pixels[1]
-                grass.set_at((x, y), tuple(base_color))
-        sprites['grass'] = grass
+        # Grass sprite - 8x8 checker of two greens
+        grass = new_pixels(SPRITE_SIZE, (0, 168, 0))
+        ys, xs = pixel_coords(grass)
+        grass[(xs // 8 + ys // 8) % 2 == 1] = (0, 180, 0)
+        sprites['grass'] = to_surface(grass)
         
         # River sprite - animated water effect
-        river = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        river.fill((0, 88, 248))
-        for y in range(0, SPRITE_SIZE, 8):
-            for x in range(SPRITE_SIZE):
-                if (x + y) % 16 < 8:
-                    river.set_at((x, y), (0, 120, 248))
-                    if y + 1 < SPRITE_SIZE:
-                        river.set_at((x, y + 1), (88, 160, 248))
-        sprites['river'] = river
+        river = new_pixels(SPRITE_SIZE, (0, 88, 248))
+        crests = (ys % 8 == 0) & ((xs + ys) % 16 < 8)
+        river[crests] = (0, 120, 248)
+        river[1:][crests[:-1]] = (88, 160, 248)
+        sprites['river'] = to_surface(river)
         
         # Rock sprite - chunky pixel rock
-        rock = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        rock.fill((0, 168, 0))
+        rock = new_pixels(SPRITE_SIZE, (0, 168, 0))
         rock_pattern = [
             "      ####      ",
             "    ########    ",
@@ -143,22 +222,12 @@ class Game:
             "    ########    ",
             "      ####      "
         ]
-        for y, row in enumerate(rock_pattern):
-            for x, char in enumerate(row):
-                if char == '#':
-                    px = x * 2
-                    py = y * 2
-                    color = (136, 136, 136) if (x + y) % 2 == 0 else (100, 100, 100)
-                    pygame.draw.rect(rock, color, (px, py, 2, 2))
-        sprites['rock'] = rock
+        stamp(rock, rock_pattern, [(136, 136, 136), (100, 100, 100)], scale=2)
+        sprites['rock'] = to_surface(rock)
         
         # Tree sprite - classic NES tree
-        tree = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        tree.fill((0, 168, 0))
-        # Trunk
-        for y in range(20, 32):
-            for x in range(12, 20):
-                tree.set_at((x, y), (101, 67, 33))
+        tree = new_pixels(SPRITE_SIZE, (0, 168, 0))
+        fill_rect(tree, (12, 20, 8, 12), (101, 67, 33))  # Trunk
         # Foliage layers
         foliage_pattern = [
             "    ####    ",
@@ -169,74 +238,80 @@ class Game:
             " ########## ",
             "  ########  "
         ]
-        for y, row in enumerate(foliage_pattern):
-            for x, char in enumerate(row):
-                if char == '#':
-                    px = x * 2 + 4
-                    py = y * 2 + 4
-                    color = (0, 120, 0) if (x + y) % 2 == 0 else (0, 100, 0)
-                    pygame.draw.rect(tree, color, (px, py, 2, 2))
-        sprites['tree'] = tree
+        stamp(tree, foliage_pattern, [(0, 120, 0), (0, 100, 0)], origin=(4, 4), scale=2)
+        sprites['tree'] = to_surface(tree)
         
         # Bridge sprite - wooden planks
-        bridge = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        for y in range(SPRITE_SIZE):
-            for x in range(SPRITE_SIZE):
-                if x % 8 < 6:
-                    bridge.set_at((x, y), (139, 69, 19))
-                else:
-                    bridge.set_at((x, y), (101, 50, 10))
-        sprites['bridge'] = bridge
+        bridge = new_pixels(SPRITE_SIZE, (139, 69, 19))
+        bridge[xs % 8 >= 6] = (101, 50, 10)
+        sprites['bridge'] = to_surface(bridge)
         
         # Chest sprite - treasure chest
-        chest = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        chest.fill((0, 168, 0))
-        # Chest body
-        for y in range(12, 24):
-            for x in range(8, 24):
-                chest.set_at((x, y), (160, 82, 45))
-        # Chest lid
-        for y in range(8, 12):
-            for x in range(8, 24):
-                chest.set_at((x, y), (139, 69, 19))
-        # Lock
-        for y in range(16, 20):
-            for x in range(14, 18):
-                chest.set_at((x, y), (255, 215, 0))
-        sprites['chest'] = chest
+        chest = new_pixels(SPRITE_SIZE, (0, 168, 0))
+        fill_rect(chest, (8, 12, 16, 12), (160, 82, 45))  # Chest body
+        fill_rect(chest, (8, 8, 16, 4), (139, 69, 19))    # Chest lid
+        fill_rect(chest, (14, 16, 4, 4), (255, 215, 0))   # Lock
+        sprites['chest'] = to_surface(chest)
         
         # Hero sprite - Link-inspired character
-        hero = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        hero.fill((0, 168, 0))
-        # Head
-        for y in range(6, 14):
-            for x in range(10, 22):
-                if 8 <= y <= 12:
-                    hero.set_at((x, y), (255, 220, 177))
-        # Body
-        for y in range(14, 22):
-            for x in range(10, 22):
-                hero.set_at((x, y), (255, 0, 0))
-        # Legs
-        for y in range(22, 28):
-            for x in range(10, 15):
-                hero.set_at((x, y), (0, 0, 139))
-            for x in range(17, 22):
-                hero.set_at((x, y), (0, 0, 139))
-        sprites['hero'] = hero
+        hero = new_pixels(SPRITE_SIZE, (0, 168, 0))
+        fill_rect(hero, (10, 8, 12, 5), (255, 220, 177))  # Head
+        fill_rect(hero, (10, 14, 12, 8), (255, 0, 0))     # Body
+        fill_rect(hero, (10, 22, 5, 6), (0, 0, 139))      # Left leg
+        fill_rect(hero, (17, 22, 5, 6), (0, 0, 139))      # Right leg
+        sprites['hero'] = to_surface(hero)
         
         return sprites
     
+    def _create_animations(self):
+        """Create the frames that follow each animated sprite (water drifts 4px a frame)"""
+        frames = []
+        for shift in (4, 8, 12):
+            river = new_pixels(SPRITE_SIZE, (0, 88, 248))
+            ys, xs = pixel_coords(river)
+            crests = (ys % 8 == 0) & ((xs + ys + shift) % 16 < 8)
+            river[crests] = (0, 120, 248)
+            river[1:][crests[:-1]] = (88, 160, 248)
+            frames.append(to_surface(river))
+        return {'river': frames}
+    
     def new_game(self):
         """Start a new game"""
         logger.info("Starting new game")
         self.world, self.hero = self.world_generator.generate()
         self.treasure = self.world_generator.chests
         self.collision.set_world(self.world, self.treasure)
+        self.world_layer.set_world(self.world, self.world_generator.width,
+                                   self.world_generator.height)  # Chests live on the props layer
+        self.explored = ExploredMap(self.world_generator.width, self.world_generator.height)
+        self.minimap.set_world(self.world, self.world_generator.width, self.world_generator.height,
+                               self.treasure)
+        self.minimap.move_hero(self.hero.x, self.hero.y)
+        self.fov.set_world(self.world, self.world_generator.width, self.world_generator.height)
+        self.update_fov()
         logger.info(f"Hero spawned at ({self.hero.x}, {self.hero.y})")
         logger.info(f"Generated {len(self.treasure)} treasure chests")
         
         self.center_camera()
+        self.compositor.invalidate('terrain')
+    
+    def set_shell(self, shell):
+        """Recolour the world for a shell's theme with one palette swap"""
+        self.shell = shell
+        self.palette.set_theme(SHELL_THEMES.get(shell))
+        self.compositor.invalidate('terrain')  # The cached background holds the old colours
+        logger.info(f"Palette set for shell {shell}")
+    
+    def flash(self, color, amount):
+        """
+        Blend the world toward one colour (damage flash, fade)
+        
+        Args:
+            color: RGB to blend toward
+            amount: 0.0 (restores the shell's colours) to 1.0 (solid colour)
+        """
+        self.palette.flash(color, amount)
+        self.compositor.invalidate('terrain')  # The cached background holds the old colours
     
     def center_camera(self):
         """Center camera on hero"""
@@ -249,20 +324,30 @@ class Game:
         self.camera_y = max(0, min(self.camera_y, 
                                    self.world_generator.height - GRID_HEIGHT))
     
-    def handle_input(self):
-        """Handle keyboard input"""
-        for event in pygame.event.get():
+    def handle_input(self, events=None):
+        """Handle keyboard input (events default to pygame.event.get())"""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 logger.info("Game quit by user")
                 return False
             
             if event.type == pygame.KEYDOWN:
                 from engine.menu import MenuState
-                if self.menu.state != MenuState.CLOSED:
+                if event.key == pygame.K_F3:
+                    self.show_hud = not self.show_hud
+                    self.compositor.invalidate('hud', self.hud.rect)
+                elif event.key == pygame.K_n:
+                    self.show_minimap = not self.show_minimap
+                    self.compositor.invalidate('minimap', self.minimap.rect)
+                elif self.menu.state != MenuState.CLOSED:
                     self.menu.handle_input(event)
+                    self.compositor.invalidate('ui')
                 else:
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_TAB or event.key == pygame.K_m:
                         self.menu.toggle()
+                        self.compositor.invalidate('ui')
                     elif event.key == pygame.K_SPACE:
                         self.try_open_chest()
                     elif event.key == pygame.K_UP or event.key == pygame.K_w:
@@ -289,11 +374,27 @@ class Game:
             return
         
         # Move hero
+        old_tile = (self.hero.x - self.camera_x, self.hero.y - self.camera_y)
+        camera = (self.camera_x, self.camera_y)
         self.hero.x = new_x
         self.hero.y = new_y
         self.center_camera()
+        if (self.camera_x, self.camera_y) != camera:
+            self.compositor.invalidate('terrain')  # The view scrolls
+        else:
+            self.compositor.invalidate_tiles('entities', [old_tile, (new_x - self.camera_x, new_y - self.camera_y)])
+        self.minimap.move_hero(new_x, new_y)
+        self.update_fov()
         logger.debug(f"Hero moved to ({new_x}, {new_y})")
     
+    def update_fov(self):
+        """Recompute sight from the hero and remember newly seen tiles"""
+        if self.fov.update(self.hero.x, self.hero.y):
+            self.explored.mark_visible(self.fov.visible, self.fov.bounds())
+            changed = self.world_layer.update_fog(self.fov, self.explored)
+            self.compositor.invalidate_tiles('terrain', self.screen_tiles(changed))
+            self.minimap.reveal(changed)
+    
     def try_open_chest(self):
         """Try to open a chest next to the hero (not on hero)"""
         # Check adjacent tiles for chests (NOT the hero's current position)
@@ -314,6 +415,12 @@ class Game:
         """Open treasure chest and get item"""
         item = chest['item']
         chest['opened'] = True
+        self.collision.refresh_tile(chest['x'], chest['y'])
+        self.compositor.invalidate_tiles('props', self.screen_tiles([(chest['x'], chest['y'])]))
+        self.minimap.refresh_tiles([(chest['x'], chest['y'])])
+        if self.menu.options['particles']:
+            self.particles.emit((chest['x'] + 0.5) * SPRITE_SIZE, (chest['y'] + 0.5) * SPRITE_SIZE, CHEST_BURST,
+                                speed=(60, 240), life_ms=(300, 900), color=CHEST_SPARKS)
         logger.info(f"Treasure opened! Found: {item.name}")
         
         # Add item to menu system (which handles auto-equipping)
@@ -324,18 +431,33 @@ class Game:
     
     def show_message(self, text):
         """Display a message to the player"""
+        if self.message:
+            self.compositor.invalidate('ui', self.message_box)
         self.message = text
+        self.message_surf = self.text_cache.render(self.font, text, True, NES_COLORS['white'])
+        self.message_box = self.message_rect()
+        self.message_pos = self.message_surf.get_rect(center=self.message_box.center).topleft
+        self.compositor.invalidate('ui', self.message_box)
         self.message_timer = self.message_duration
         logger.debug(f"Message shown: {text}")
     
+    def message_rect(self):
+        """Screen area covered by the message box"""
+        width, height = self.font.size(self.message)
+        message_rect = pygame.Rect(0, 0, width, height)
+        message_rect.centerx = WINDOW_WIDTH // 2
+        message_rect.bottom = WINDOW_HEIGHT - 10
+        return message_rect.inflate(20, 10)
+    
     def auto_save(self):
         """Perform auto-save"""
-        self.auto_save_counter += 1
-        if self.auto_save_counter >= self.auto_save_interval:
+        now = pygame.time.get_ticks()
+        if now - self.last_auto_save >= self.auto_save_interval:
             game_state = {
                 'hero': self.hero,
                 'terrain': self.world,
                 'chests': self.treasure,
+                'explored': self.explored,
                 'seed': None,
                 'width': GRID_WIDTH,
                 'height': GRID_HEIGHT,
@@ -345,69 +467,120 @@ class Game:
                 logger.debug("Auto-saved game")
             except Exception as e:
                 logger.error(f"Auto-save failed: {e}")
-            self.auto_save_counter = 0
+            self.last_auto_save = now
     
     def update(self):
         """Update game state"""
+        # Animated tiles in view move to the current frame
+        view = (self.camera_x, self.camera_y, self.camera_x + GRID_WIDTH, self.camera_y + GRID_HEIGHT)
+        now = pygame.time.get_ticks()
+        animated = self.world_layer.animate(now, view)
+        self.compositor.invalidate_tiles('terrain', self.screen_tiles(animated))
+        self.update_particles(now)
+        
         # Update message timer
         if self.message_timer > 0:
             self.message_timer -= 1
             if self.message_timer == 0:
+                self.compositor.invalidate('ui', self.message_box)
                 self.message = ""
+                self.message_surf = None
+    
+    def update_particles(self, now_ms):
+        """Simulate particles and mark where they were and where they are now"""
+        dt_ms, self.last_update = now_ms - self.last_update, now_ms
+        if not self.menu.options['particles']:
+            self.particles.clear()  # Switched off in the options menu
+        if self.particle_rect is None and not self.particles.count:
+            return
+        self.particles.update(dt_ms)
+        rect = self.particles.bounds()
+        if rect:
+            rect.move_ip(-self.camera_x * SPRITE_SIZE, -self.camera_y * SPRITE_SIZE)
+        for covered in (self.particle_rect, rect):
+            if covered:
+                self.compositor.invalidate('particles', covered)
+        self.particle_rect = rect
+    
+    def is_idle(self):
+        """Check if the loop can sleep until the next input event"""
+        return (self.message_timer == 0 and not self.dirty.pending and not self.show_hud
+                and not self.particles.count)
+    
+    def auto_save_due_in(self):
+        """Milliseconds until the next auto-save"""
+        return self.auto_save_interval - (pygame.time.get_ticks() - self.last_auto_save)
+    
+    def wake_in(self):
+        """Milliseconds an idle frame may sleep: next auto-save or animation frame"""
+        animation_due_in = self.world_layer.frame_due_in(pygame.time.get_ticks())
+        if animation_due_in is None:
+            return self.auto_save_due_in()
+        return min(self.auto_save_due_in(), animation_due_in)
     
     def render(self):
-        """Render the game"""
-        self.screen.fill(NES_COLORS['black'])
-        
-        # Render world
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                world_x = x + self.camera_x
-                world_y = y + self.camera_y
-                
-                if (world_x >= 0 and world_x < self.world_generator.width and
-                    world_y >= 0 and world_y < self.world_generator.height):
-                    
-                    tile = self.world.get((world_x, world_y))
-                    if tile:
-                        tile_type = type(tile).__name__.lower()
-                        sprite = self.sprites.get(tile_type, self.sprites['grass'])
-                        self.screen.blit(sprite, (x * SPRITE_SIZE, y * SPRITE_SIZE))
-        
-        # Render treasure
-        if self.treasure:
-            for chest in self.treasure:
-                if not chest['opened']:
-                    screen_x = (chest['x'] - self.camera_x) * SPRITE_SIZE
-                    screen_y = (chest['y'] - self.camera_y) * SPRITE_SIZE
-                    if 0 <= screen_x < WINDOW_WIDTH and 0 <= screen_y < WINDOW_HEIGHT:
-                        self.screen.blit(self.sprites['chest'], (screen_x, screen_y))
-        
-        # Render hero
+        """Recomposite the screen regions whose layers changed since last frame"""
+        if self.show_hud:
+            self.compositor.invalidate('hud', self.hud.rect)  # The graph scrolls every frame
+        if self.show_minimap and self.minimap.version != self.minimap_version:
+            self.compositor.invalidate('minimap', self.minimap.rect)  # Patched since last drawn
+        if self.dirty.pending:
+            self.compositor.compose(self.screen)
+        self.dirty.present()
+        self.profiler.lap('flip')
+    
+    def screen_tiles(self, tiles):
+        """Convert world tiles to screen tiles"""
+        return [(x - self.camera_x, y - self.camera_y) for x, y in tiles]
+    
+    def draw_terrain(self, surface):
+        """Terrain layer: the baked world under the camera, fog included"""
+        self.world_layer.blit_view(surface, self.camera_x, self.camera_y)
+    
+    def draw_props(self, surface):
+        """Props layer: chests, shaded like the terrain under them"""
+        shade = self.world_layer.shade
+        for chest in self.treasure:
+            x, y = chest['x'], chest['y']
+            state = shade[y, x] if shade is not None else None
+            if state == HIDDEN:
+                continue
+            chest_id = self.chest_ids[(chest['opened'], 'dim' if state == DIM else None)]
+            if chest_id is not None:
+                self.atlas.blit(surface, chest_id, ((x - self.camera_x) * SPRITE_SIZE,
+                                                    (y - self.camera_y) * SPRITE_SIZE))
+    
+    def draw_entities(self, surface):
+        """Entity layer: the hero"""
         screen_x = (self.hero.x - self.camera_x) * SPRITE_SIZE
         screen_y = (self.hero.y - self.camera_y) * SPRITE_SIZE
-        self.screen.blit(self.sprites['hero'], (screen_x, screen_y))
-        
-        # Render menu
+        self.atlas.blit(surface, self.hero_id, (screen_x, screen_y))
+    
+    def draw_particles(self, surface):
+        """Particle layer: every live particle in one batched write"""
+        self.particles.draw(surface, (self.camera_x * SPRITE_SIZE, self.camera_y * SPRITE_SIZE))
+    
+    def draw_minimap(self, surface):
+        """Minimap layer: the whole shell, under menus and messages"""
+        if self.show_minimap:
+            self.minimap.draw(surface)
+            self.minimap_version = self.minimap.version
+    
+    def draw_ui(self, surface):
+        """UI layer: menu and message box"""
         from engine.menu import MenuState
         if self.menu.state != MenuState.CLOSED:
-            self.menu.render(self.screen, self.font)
-        
-        # Render message at bottom of screen
-        if self.message:
-            message_surf = self.font.render(self.message, True, NES_COLORS['white'])
-            message_rect = message_surf.get_rect()
-            message_rect.centerx = WINDOW_WIDTH // 2
-            message_rect.bottom = WINDOW_HEIGHT - 10
-            
-            # Draw background for message
-            bg_rect = message_rect.inflate(20, 10)
-            pygame.draw.rect(self.screen, NES_COLORS['black'], bg_rect)
-            pygame.draw.rect(self.screen, NES_COLORS['white'], bg_rect, 2)
-            
-            self.screen.blit(message_surf, message_rect)
-        
-        pygame.display.flip()
+            self.menu.render(surface, self.font)
+        if self.message_surf:
+            box = self.message_box
+            panel = self.render_cache.panel(box.size, NES_COLORS['black'], NES_COLORS['white'], 2)
+            surface.blit(panel, box)
+            surface.blit(self.message_surf, self.message_pos)
+    
+    def draw_hud(self, surface):
+        """Debug layer: the F3 frame-time HUD"""
+        if self.show_hud:
+            self.hud.draw(surface, self.profiler)
     
     def run(self):
         """Main game loop"""
@@ -416,10 +589,17 @@ class Game:
         
         try:
             while running:
-                running = self.handle_input()
+                idle = self.is_idle()
+                events = self.events.get(idle, self.wake_in())
+                self.profiler.begin_frame()  # After the wait, so idle sleeps aren't charged to input
+                running = self.handle_input(events)
+                self.profiler.lap('input')
                 self.update()
+                self.profiler.lap('update')
                 self.auto_save()
+                self.profiler.lap('autosave')
                 self.render()
+                self.profiler.end_frame()
                 self.clock.tick(FPS)
         except Exception as e:
             logger.error(f"Game crashed: {e}", exc_info=True)
@@ -3,6 +3,8 @@ Centralized game state management
 """
 import logging
 
+from engine.exploration import ExploredMap
+
 logger = logging.getLogger(__name__)
 
 class GameState:
@@ -28,6 +30,15 @@ class GameState:
         # Treasure state
         self.chests = []
         
+        # Optional CollisionSystem kept in sync with chest state
+        self.collision = None
+        
+        # Optional FieldOfView kept in sync with the hero position
+        self.fov = None
+        
+        # Tiles the player has seen (filled from the FOV)
+        self.explored = None
+        
         # Inventory state
         self.inventory = {
             'head': None,
@@ -49,6 +60,9 @@ class GameState:
         self.world = world
         self.world_width = width
         self.world_height = height
+        self.explored = ExploredMap(width, height)
+        if self.fov:
+            self.fov.set_world(world, width, height)
         logger.info(f"World set: {width}x{height}")
     
     def set_hero_position(self, x, y):
@@ -56,6 +70,8 @@ class GameState:
         self.hero_x = x
         self.hero_y = y
         self.center_camera()
+        if self.fov and self.fov.update(x, y):
+            self.explored.mark_visible(self.fov.visible, self.fov.bounds())
         logger.debug(f"Hero position: ({x}, {y})")
     
     def center_camera(self):
@@ -87,6 +103,8 @@ class GameState:
         """Open a chest and add item to inventory"""
         if chest and not chest['opened']:
             chest['opened'] = True
+            if self.collision:
+                self.collision.refresh_tile(chest['x'], chest['y'])
             item = chest['item']
             self.add_item(item)
             logger.info(f"Opened chest: {item.name}")
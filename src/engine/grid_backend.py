@@ -0,0 +1,201 @@
+"""
+Grid Backends
+Pathfinding and field-of-view over NumPy grids, running in C through tcod
+when it is installed and falling back to pure Python otherwise
+"""
+import logging
+import numpy as np
+
+from engine.pathfinding import PathResult, find_path
+
+try:
+    import tcod
+    TCOD_AVAILABLE = True
+except ImportError:
+    tcod = None
+    TCOD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Octant transforms (xx, xy, yx, yy) for shadowcasting
+_OCTANTS = [
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+]
+
+
+class PythonGridBackend:
+    """Pure Python backend - always available"""
+
+    name = "python"
+
+    def __init__(self, strategy='astar'):
+        """
+        Initialize Python backend
+
+        Args:
+            strategy: Pathfinding strategy from pathfinding.STRATEGIES
+        """
+        self.strategy = strategy
+
+    def find_path(self, walkable, start, goal):
+        """
+        Find a shortest 4-way path
+
+        Args:
+            walkable: Boolean array indexed [y, x]
+            start: (x, y) start tile
+            goal: (x, y) goal tile
+
+        Returns:
+            PathResult: Path from start to goal inclusive
+        """
+        return find_path(walkable, start, goal, self.strategy)
+
+    def compute_fov(self, transparent, x, y, radius=0):
+        """
+        Compute visible tiles with recursive shadowcasting
+
+        Args:
+            transparent: Boolean array indexed [y, x], True where sight passes
+            x: Viewer X coordinate
+            y: Viewer Y coordinate
+            radius: Maximum view distance (0 = unlimited)
+
+        Returns:
+            numpy.ndarray: Boolean visibility mask indexed [y, x]
+        """
+        height, width = transparent.shape
+        visible = np.zeros((height, width), dtype=bool)
+        if not (0 <= x < width and 0 <= y < height):
+            return visible
+        visible[y, x] = True
+
+        if radius <= 0:
+            radius = max(width, height)
+        radius_sq = radius * radius
+        # Python lists are much faster to index one tile at a time
+        grid = transparent.tolist()
+
+        for xx, xy, yx, yy in _OCTANTS:
+            # Explicit stack instead of recursion so huge radii can't overflow
+            stack = [(1, 1.0, 0.0)]
+            while stack:
+                row, start, end = stack.pop()
+                if start < end:
+                    continue
+                new_start = start
+                for j in range(row, radius + 1):
+                    dx, dy = -j - 1, -j
+                    blocked = False
+                    while dx <= 0:
+                        dx += 1
+                        map_x = x + dx * xx + dy * xy
+                        map_y = y + dx * yx + dy * yy
+                        left_slope = (dx - 0.5) / (dy + 0.5)
+                        right_slope = (dx + 0.5) / (dy - 0.5)
+                        if start < right_slope:
+                            continue
+                        if end > left_slope:
+                            break
+
+                        in_bounds = 0 <= map_x < width and 0 <= map_y < height
+                        if in_bounds and dx * dx + dy * dy <= radius_sq:
+                            visible[map_y, map_x] = True
+                        opaque = not in_bounds or not grid[map_y][map_x]
+
+                        if blocked:
+                            if opaque:
+                                new_start = right_slope
+                            else:
+                                blocked = False
+                                start = new_start
+                        elif opaque and j < radius:
+                            blocked = True
+                            stack.append((j + 1, start, left_slope))
+                            new_start = right_slope
+                    if blocked:
+                        break
+
+        return visible
+
+
+class TcodGridBackend:
+    """tcod backend - pathfinding and FOV run in C over the NumPy arrays"""
+
+    name = "tcod"
+
+    def __init__(self):
+        if not TCOD_AVAILABLE:
+            raise RuntimeError("tcod is not installed")
+        self.fov_algorithm = tcod.constants.FOV_SHADOW
+
+    def find_path(self, walkable, start, goal):
+        """
+        Find a shortest 4-way path
+
+        Args:
+            walkable: Boolean array indexed [y, x]
+            start: (x, y) start tile
+            goal: (x, y) goal tile
+
+        Returns:
+            PathResult: Path from start to goal inclusive (expansions aren't reported)
+        """
+        height, width = walkable.shape
+        gx, gy = goal
+        if not (0 <= gx < width and 0 <= gy < height) or not walkable[gy, gx]:
+            return PathResult(None)
+        if start == goal:
+            return PathResult([start])
+        if height == 1 or width == 1:
+            # libtcod reports a cyclic loop on one-tile-wide grids
+            return find_path(walkable, start, goal)
+
+        graph = tcod.path.SimpleGraph(cost=walkable.astype(np.int8), cardinal=1, diagonal=0)
+        graph.set_heuristic(cardinal=1, diagonal=0)
+        pathfinder = tcod.path.Pathfinder(graph)
+        pathfinder.add_root((start[1], start[0]))
+        ij_path = pathfinder.path_to((gy, gx)).tolist()
+        if len(ij_path) < 2:
+            return PathResult(None)  # tcod returns just the goal when unreachable
+        return PathResult([(j, i) for i, j in ij_path])
+
+    def compute_fov(self, transparent, x, y, radius=0):
+        """
+        Compute visible tiles with libtcod's shadowcasting
+
+        Args:
+            transparent: Boolean array indexed [y, x], True where sight passes
+            x: Viewer X coordinate
+            y: Viewer Y coordinate
+            radius: Maximum view distance (0 = unlimited)
+
+        Returns:
+            numpy.ndarray: Boolean visibility mask indexed [y, x]
+        """
+        height, width = transparent.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return np.zeros((height, width), dtype=bool)
+        return tcod.map.compute_fov(
+            transparent, (y, x), radius=radius, light_walls=True, algorithm=self.fov_algorithm
+        )
+
+
+def get_backend(name=None):
+    """
+    Get a grid backend
+
+    Args:
+        name: "tcod", "python", or None to pick tcod when it's importable
+
+    Returns:
+        PythonGridBackend or TcodGridBackend
+    """
+    if name is None:
+        name = "tcod" if TCOD_AVAILABLE else "python"
+    if name == "tcod":
+        return TcodGridBackend()
+    if name == "python":
+        return PythonGridBackend()
+    raise ValueError(f"Unknown grid backend: {name}")
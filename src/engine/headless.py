@@ -0,0 +1,168 @@
+"""
+Headless Rendering
+Drives the real Game loop offscreen on SDL's dummy video driver: scripted
+key presses, a simulated 60 FPS clock, uncapped speed, and per-step frame
+hashes that can be checked against stored goldens
+"""
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+FRAMES_PER_STEP = 12      # Frames rendered after each scripted key
+FRAME_MS = 1000 / 60      # Simulated frame time
+HASH_LENGTH = 16          # Hex digits kept per step hash
+GOLDENS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tests', 'goldens', 'render_frames.json')
+
+# Script characters -> keys; '.' presses nothing for a step
+SCRIPT_KEYS = {
+    'U': pygame.K_UP,
+    'D': pygame.K_DOWN,
+    'L': pygame.K_LEFT,
+    'R': pygame.K_RIGHT,
+    ' ': pygame.K_SPACE,
+    'T': pygame.K_t,
+    'X': pygame.K_x,
+}
+
+# Menus are left out on purpose: font rasterization differs between
+# FreeType builds, so text would make hashes machine-specific
+SCENARIOS = {
+    'walk': {'seed': 42, 'script': 'RRRRRRDDDDDDLLLLLLUUUUUU'},
+    'explore': {'seed': 1001, 'script': 'X' + '.' * 39},
+    'chest': {'seed': 1234, 'script': 'T' + '.' * 29 + ' ..'},
+}
+
+
+def frame_hash(surface):
+    """
+    Hash a frame's pixels
+
+    Args:
+        surface: Surface to hash
+
+    Returns:
+        str: SHA-1 hex digest of the RGB bytes
+    """
+    return hashlib.sha1(pygame.image.tobytes(surface, 'RGB')).hexdigest()
+
+
+def run_scenario(seed, script, fov_backend=None, frames_per_step=FRAMES_PER_STEP):
+    """
+    Play a scripted scenario headless at uncapped speed
+
+    Args:
+        seed: Random seed for world generation
+        script: One character per step (see SCRIPT_KEYS)
+        fov_backend: Grid backend name for sight, None for the default
+        frames_per_step: Frames rendered per scripted step
+
+    Returns:
+        dict: 'hashes' (one per step, covering all its frames), 'frames',
+        'seconds' spent in Game.step() and 'fps'
+    """
+    from engine.game import Game
+
+    random.seed(seed)
+    game = Game(headless=True, fov_backend=fov_backend)
+    hashes = []
+    frame = 0
+    seconds = 0.0
+    try:
+        for char in script:
+            step_hash = hashlib.sha1()
+            for i in range(frames_per_step):
+                events = []
+                if i == 0 and char in SCRIPT_KEYS:
+                    events.append(pygame.event.Event(pygame.KEYDOWN, key=SCRIPT_KEYS[char]))
+                start = time.perf_counter()
+                game.step(events, round(frame * FRAME_MS))
+                seconds += time.perf_counter() - start
+                step_hash.update(pygame.image.tobytes(game.screen, 'RGB'))
+                frame += 1
+            hashes.append(step_hash.hexdigest()[:HASH_LENGTH])
+        backend = game.game_state.fov.backend.name
+    finally:
+        pygame.quit()
+    return {
+        'backend': backend,
+        'hashes': hashes,
+        'frames': frame,
+        'seconds': seconds,
+        'fps': frame / seconds if seconds else 0.0,
+    }
+
+
+def run_all(fov_backend=None):
+    """
+    Play every scenario in SCENARIOS
+
+    Returns:
+        dict: Scenario name -> run_scenario() result
+    """
+    return {name: run_scenario(spec['seed'], spec['script'], fov_backend)
+            for name, spec in SCENARIOS.items()}
+
+
+def load_goldens(path=GOLDENS_PATH):
+    """
+    Load stored step hashes
+
+    Returns:
+        dict: Backend name -> scenario name -> list of step hashes
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_goldens(results, path=GOLDENS_PATH):
+    """
+    Store step hashes for the backend the results were rendered with
+
+    Args:
+        results: run_all() output
+        path: Goldens JSON file
+    """
+    goldens = load_goldens(path)
+    for name, result in results.items():
+        goldens.setdefault(result['backend'], {})[name] = result['hashes']
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(goldens, f, indent=2, sort_keys=True)
+        f.write('\n')
+    logger.info(f"Saved goldens to {path}")
+
+
+def compare_goldens(results, goldens):
+    """
+    Find scenarios whose frames differ from the goldens
+
+    Args:
+        results: run_all() output
+        goldens: load_goldens() output
+
+    Returns:
+        list: (scenario, first differing step or None if missing) tuples
+    """
+    mismatches = []
+    for name, result in results.items():
+        expected = goldens.get(result['backend'], {}).get(name)
+        if expected is None:
+            mismatches.append((name, None))
+            continue
+        for step, (got, want) in enumerate(zip(result['hashes'], expected)):
+            if got != want:
+                mismatches.append((name, step))
+                break
+        else:
+            if len(result['hashes']) != len(expected):
+                mismatches.append((name, min(len(result['hashes']), len(expected))))
+    return mismatches
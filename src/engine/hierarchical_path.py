@@ -0,0 +1,345 @@
+"""
+Hierarchical Pathfinding (HPA*)
+Splits the walkable grid into clusters so long routes are searched on a small
+abstract graph of cluster entrances instead of millions of tiles
+"""
+import heapq
+import logging
+from collections import deque
+
+from engine.pathfinding import PathResult, astar, manhattan, reconstruct_path, NEIGHBORS
+
+logger = logging.getLogger(__name__)
+
+
+class HierarchicalPathfinder:
+    """Two-level pathfinder over the CollisionSystem walkable grid"""
+
+    # Border openings at least this wide get a transition at each end
+    LONG_ENTRANCE = 6
+
+    def __init__(self, collision, cluster_size=16):
+        """
+        Initialize hierarchical pathfinder
+
+        Args:
+            collision: CollisionSystem providing the walkable grid and change log
+            cluster_size: Width/height of a cluster in tiles
+        """
+        self.collision = collision
+        self.cluster_size = cluster_size
+        self.version = None
+        self.walkable = None
+        self.clusters_x = 0
+        self.clusters_y = 0
+
+        # (cx, cy, 'E'|'S') -> [(node_a, node_b), ...] transitions across that border
+        self._borders = {}
+        # node -> set of nodes on the other side of a cluster border
+        self._links = {}
+        # (cx, cy) -> {node: {other_node: distance}} inside the cluster
+        self._intra = {}
+
+        self.last_stats = {}
+        logger.info(f"Hierarchical pathfinder initialized (cluster size {cluster_size})")
+
+    # ------------------------------------------------------------------
+    # Abstract graph maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self):
+        """
+        Bring the abstract graph up to date with the collision system
+
+        Only clusters touched by changed tiles are rebuilt; a full rebuild
+        happens on the first call or after the world is replaced.
+
+        Returns:
+            int: Number of clusters rebuilt
+        """
+        if self.version == self.collision.version:
+            return 0
+
+        walkable = self.collision.get_walkable_grid()
+        changes = None
+        if self.version is not None and self.walkable is walkable:
+            changes = self.collision.changes_since(self.version)
+
+        if changes is None:
+            rebuilt = self._rebuild_all(walkable)
+        else:
+            rebuilt = self._rebuild_changed(changes)
+
+        self.version = self.collision.version
+        logger.debug(f"Hierarchical graph synced: {rebuilt} clusters rebuilt")
+        return rebuilt
+
+    def _rebuild_all(self, walkable):
+        """Rebuild every border and cluster"""
+        cs = self.cluster_size
+        height, width = walkable.shape
+        self.walkable = walkable
+        self.clusters_x = (width + cs - 1) // cs
+        self.clusters_y = (height + cs - 1) // cs
+        self._borders = {}
+        self._links = {}
+        self._intra = {}
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                if cx + 1 < self.clusters_x:
+                    self._build_border((cx, cy, 'E'))
+                if cy + 1 < self.clusters_y:
+                    self._build_border((cx, cy, 'S'))
+
+        for cy in range(self.clusters_y):
+            for cx in range(self.clusters_x):
+                self._build_intra((cx, cy))
+
+        return self.clusters_x * self.clusters_y
+
+    def _rebuild_changed(self, changes):
+        """Rebuild only the borders and clusters touched by changed tiles"""
+        cs = self.cluster_size
+        borders = set()
+        clusters = set()
+
+        for x, y in changes:
+            cx, cy = x // cs, y // cs
+            clusters.add((cx, cy))
+            # Tiles on a cluster edge also change the entrances on that border
+            if x % cs == cs - 1 and cx + 1 < self.clusters_x:
+                borders.add((cx, cy, 'E'))
+                clusters.add((cx + 1, cy))
+            if x % cs == 0 and cx > 0:
+                borders.add((cx - 1, cy, 'E'))
+                clusters.add((cx - 1, cy))
+            if y % cs == cs - 1 and cy + 1 < self.clusters_y:
+                borders.add((cx, cy, 'S'))
+                clusters.add((cx, cy + 1))
+            if y % cs == 0 and cy > 0:
+                borders.add((cx, cy - 1, 'S'))
+                clusters.add((cx, cy - 1))
+
+        for border in borders:
+            self._build_border(border)
+        for cluster in clusters:
+            self._build_intra(cluster)
+
+        return len(clusters)
+
+    def _build_border(self, key):
+        """Find the entrances across one cluster border"""
+        for node_a, node_b in self._borders.get(key, ()):
+            self._links[node_a].discard(node_b)
+            self._links[node_b].discard(node_a)
+
+        cx, cy, side = key
+        cs = self.cluster_size
+        height, width = self.walkable.shape
+        transitions = []
+
+        if side == 'E':
+            xa = (cx + 1) * cs - 1
+            y0, y1 = cy * cs, min((cy + 1) * cs, height)
+            open_tiles = (self.walkable[y0:y1, xa] & self.walkable[y0:y1, xa + 1]).tolist()
+            for offset in self._transition_offsets(open_tiles):
+                transitions.append(((xa, y0 + offset), (xa + 1, y0 + offset)))
+        else:
+            ya = (cy + 1) * cs - 1
+            x0, x1 = cx * cs, min((cx + 1) * cs, width)
+            open_tiles = (self.walkable[ya, x0:x1] & self.walkable[ya + 1, x0:x1]).tolist()
+            for offset in self._transition_offsets(open_tiles):
+                transitions.append(((x0 + offset, ya), (x0 + offset, ya + 1)))
+
+        self._borders[key] = transitions
+        for node_a, node_b in transitions:
+            self._links.setdefault(node_a, set()).add(node_b)
+            self._links.setdefault(node_b, set()).add(node_a)
+
+    def _transition_offsets(self, open_tiles):
+        """Pick transition points for each run of open tiles along a border"""
+        offsets = []
+        run_start = None
+        for i, is_open in enumerate(open_tiles + [False]):
+            if is_open and run_start is None:
+                run_start = i
+            elif not is_open and run_start is not None:
+                run_end = i - 1
+                if run_end - run_start + 1 >= self.LONG_ENTRANCE:
+                    offsets.extend([run_start, run_end])
+                else:
+                    offsets.append((run_start + run_end) // 2)
+                run_start = None
+        return offsets
+
+    def _cluster_of(self, node):
+        """Get the cluster a tile belongs to"""
+        return (node[0] // self.cluster_size, node[1] // self.cluster_size)
+
+    def _cluster_bounds(self, cluster):
+        """Get the (x0, y0, x1, y1) half-open tile box of a cluster"""
+        cs = self.cluster_size
+        height, width = self.walkable.shape
+        cx, cy = cluster
+        return (cx * cs, cy * cs, min((cx + 1) * cs, width), min((cy + 1) * cs, height))
+
+    def _cluster_nodes(self, cluster):
+        """Get the abstract nodes that lie inside a cluster"""
+        cx, cy = cluster
+        nodes = set()
+        nodes.update(a for a, _ in self._borders.get((cx, cy, 'E'), ()))
+        nodes.update(b for _, b in self._borders.get((cx - 1, cy, 'E'), ()))
+        nodes.update(a for a, _ in self._borders.get((cx, cy, 'S'), ()))
+        nodes.update(b for _, b in self._borders.get((cx, cy - 1, 'S'), ()))
+        return nodes
+
+    def _build_intra(self, cluster):
+        """Precompute distances between every pair of nodes inside a cluster"""
+        nodes = self._cluster_nodes(cluster)
+        bounds = self._cluster_bounds(cluster)
+        x0, y0, x1, y1 = bounds
+        local = self.walkable[y0:y1, x0:x1].tolist()
+
+        edges = {node: {} for node in nodes}
+        for node in nodes:
+            distances = self._local_distances(node, bounds, local)
+            for other in nodes:
+                if other != node and other in distances:
+                    edges[node][other] = distances[other]
+        self._intra[cluster] = edges
+
+    def _local_distances(self, start, bounds, local=None):
+        """BFS distances from a tile to every reachable tile in a cluster"""
+        x0, y0, x1, y1 = bounds
+        if local is None:
+            local = self.walkable[y0:y1, x0:x1].tolist()
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            x, y = queue.popleft()
+            distance = distances[(x, y)] + 1
+            for dx, dy in NEIGHBORS:
+                nx, ny = x + dx, y + dy
+                if (x0 <= nx < x1 and y0 <= ny < y1 and
+                        (nx, ny) not in distances and local[ny - y0][nx - x0]):
+                    distances[(nx, ny)] = distance
+                    queue.append((nx, ny))
+        return distances
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_path(self, start, goal):
+        """
+        Find a path between two tiles
+
+        Searches the abstract entrance graph, then refines each hop with a
+        small A* bounded to a single cluster.
+
+        Args:
+            start: (x, y) start tile
+            goal: (x, y) goal tile
+
+        Returns:
+            PathResult: Tile path (near-optimal) and total expansion count
+        """
+        self.sync()
+        self.last_stats = {'abstract_expanded': 0, 'local_expanded': 0, 'waypoints': 0}
+        height, width = self.walkable.shape
+        gx, gy = goal
+        if not (0 <= gx < width and 0 <= gy < height) or not self.walkable[gy, gx]:
+            return PathResult(None)
+        if start == goal:
+            return PathResult([start])
+
+        # Short trips inside one cluster never touch the abstract graph
+        start_cluster = self._cluster_of(start)
+        goal_cluster = self._cluster_of(goal)
+        if start_cluster == goal_cluster:
+            local = astar(self.walkable, start, goal, self._cluster_bounds(start_cluster))
+            self.last_stats['local_expanded'] += local.expanded
+            if local.found:
+                return PathResult(local.path, local.expanded)
+
+        waypoints = self._abstract_search(start, goal, start_cluster, goal_cluster)
+        if waypoints is None:
+            return PathResult(None, self._total_expanded())
+        self.last_stats['waypoints'] = len(waypoints)
+
+        path = [start]
+        for a, b in zip(waypoints, waypoints[1:]):
+            if manhattan(a, b) == 1:
+                path.append(b)
+                continue
+            segment = astar(self.walkable, a, b, self._cluster_bounds(self._cluster_of(a)))
+            self.last_stats['local_expanded'] += segment.expanded
+            path.extend(segment.path[1:])
+
+        return PathResult(path, self._total_expanded())
+
+    def _total_expanded(self):
+        """Sum of abstract and local expansions for the last query"""
+        return self.last_stats['abstract_expanded'] + self.last_stats['local_expanded']
+
+    def _abstract_search(self, start, goal, start_cluster, goal_cluster):
+        """A* over cluster entrances with start and goal temporarily inserted"""
+        goal_nodes = self._cluster_nodes(goal_cluster)
+        distances = self._local_distances(goal, self._cluster_bounds(goal_cluster))
+        goal_edges = {node: distances[node] for node in goal_nodes if node in distances}
+
+        # node -> {other: cost} for the temporarily inserted start tiles
+        inserted = {}
+        sx, sy = start
+        height, width = self.walkable.shape
+        if self.walkable[sy, sx]:
+            seeds = [start]
+        else:
+            # A blocked start (e.g. a chest) is only left through its walkable
+            # neighbours, which may lie in the next cluster over
+            seeds = [(sx + dx, sy + dy) for dx, dy in NEIGHBORS
+                     if 0 <= sx + dx < width and 0 <= sy + dy < height and self.walkable[sy + dy, sx + dx]]
+            inserted[start] = {seed: 1 for seed in seeds}
+        for seed in seeds:
+            cluster = self._cluster_of(seed)
+            distances = self._local_distances(seed, self._cluster_bounds(cluster))
+            edges = {node: distances[node] for node in self._cluster_nodes(cluster) if node in distances}
+            if goal in distances:
+                edges[goal] = distances[goal]
+            inserted[seed] = edges
+
+        g_score = {start: 0}
+        came_from = {}
+        open_heap = [(manhattan(start, goal), 0, start)]
+
+        while open_heap:
+            _, neg_g, node = heapq.heappop(open_heap)
+            g = -neg_g
+            if g > g_score[node]:
+                continue
+            if node == goal:
+                return reconstruct_path(came_from, node)
+            self.last_stats['abstract_expanded'] += 1
+
+            for neighbor, cost in self._abstract_neighbors(node, goal, inserted, goal_edges):
+                new_g = g + cost
+                if new_g < g_score.get(neighbor, new_g + 1):
+                    g_score[neighbor] = new_g
+                    came_from[neighbor] = node
+                    heapq.heappush(open_heap, (new_g + manhattan(neighbor, goal), -new_g, neighbor))
+
+        return None
+
+    def _abstract_neighbors(self, node, goal, inserted, goal_edges):
+        """Yield (neighbor, cost) pairs on the abstract graph"""
+        for other, cost in inserted.get(node, {}).items():
+            if other != node:
+                yield other, cost
+        cluster_edges = self._intra.get(self._cluster_of(node), {})
+        for other, cost in cluster_edges.get(node, {}).items():
+            yield other, cost
+        for other in self._links.get(node, ()):
+            yield other, 1
+        if node in goal_edges:
+            yield goal, goal_edges[node]
@@ -11,11 +11,26 @@ class InputHandler:
     
     def __init__(self):
         self.menu_open = False
+        self.hud_open = False
+        self.minimap_open = False
+        self.auto_travel = None  # Set by Game when auto-travel is available
         logger.info("Input handler initialized")
     
-    def handle_events(self, game_state, menu_system):
-        """Process all input events"""
-        for event in pygame.event.get():
+    def handle_events(self, game_state, menu_system, events=None):
+        """
+        Process input events
+        
+        Args:
+            game_state: Game state to act on
+            menu_system: Menu receiving input while open
+            events: Events already collected this frame (default: pygame.event.get())
+        
+        Returns:
+            bool: False when the game should quit
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 logger.info("Quit event received")
                 return False
@@ -30,6 +45,21 @@ class InputHandler:
         """Handle key press"""
         key = event.key
         
+        # Frame-time HUD (debug)
+        if key == pygame.K_F3:
+            self.hud_open = not self.hud_open
+            return True
+        
+        # Minimap overlay
+        if key == pygame.K_n:
+            self.minimap_open = not self.minimap_open
+            return True
+        
+        # Any key press interrupts auto-travel
+        if self.auto_travel and self.auto_travel.active:
+            self.auto_travel.stop()
+            return True
+        
         # Menu controls
         if key in [pygame.K_TAB, pygame.K_m, pygame.K_ESCAPE]:
             self.menu_open = not self.menu_open
@@ -43,6 +73,10 @@ class InputHandler:
         # Game controls
         if key == pygame.K_SPACE:
             return self.try_open_chest(game_state)
+        elif key == pygame.K_t and self.auto_travel:
+            self.auto_travel.start(self.auto_travel.MODE_CHEST)
+        elif key == pygame.K_x and self.auto_travel:
+            self.auto_travel.start(self.auto_travel.MODE_EXPLORE)
         elif key in [pygame.K_UP, pygame.K_w]:
             game_state.move_hero(0, -1)
         elif key in [pygame.K_DOWN, pygame.K_s]:
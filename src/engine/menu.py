@@ -8,6 +8,10 @@ from enum import Enum
 from typing import Optional, List, Callable
 from dataclasses import dataclass
 
+from engine.render_cache import RenderCache
+from engine.sprite_atlas import display_format
+from engine.text_cache import TextCache
+
 
 class MenuState(Enum):
     """Menu states"""
@@ -52,6 +56,15 @@ class MenuSystem:
         self.selected_color = (255, 200, 0)
         self.disabled_color = (100, 100, 100)
         self.border_color = (200, 200, 200)
+        self.render_cache = RenderCache()
+        self.text_cache = TextCache()
+        
+        # Offscreen menu surface, redrawn when the key below changes
+        self.menu_version = 0  # Bumped whenever the menu items are rebuilt
+        self.redraws = 0
+        self._surface = None
+        self._surface_pos = (0, 0)
+        self._surface_key = None
         
         # Equipment slots
         self.equipment_slots = {
@@ -86,6 +99,7 @@ class MenuSystem:
     
     def _build_menus(self):
         """Build all menu structures"""
+        self.menu_version += 1
         self.main_menu_items = [
             MenuItem("Inventory", self._open_inventory),
             MenuItem("Equipment", self._open_equipment),
@@ -357,29 +371,47 @@ class MenuSystem:
         self._build_menus()
         return old_item
     
+    def invalidate(self):
+        """Force the menu surface to be redrawn on the next render"""
+        self._surface_key = None
+    
     def render(self, screen, font):
-        """Render the menu"""
+        """Render the menu (one blit unless the menu changed since last frame)"""
         if not self.is_open():
             return
         
+        key = (self.state, self.selected_index, self.menu_version, font)
+        if key != self._surface_key:
+            self._surface, self._surface_pos = self._draw_menu(font)
+            self._surface_key = key
+            self.redraws += 1
+        screen.blit(self._surface, self._surface_pos)
+    
+    def _draw_menu(self, font):
+        """
+        Draw the current menu screen offscreen
+        
+        Args:
+            font: Font for the title and items
+        
+        Returns:
+            tuple: (surface, screen position) covering the panel and any
+            items that run past its edge
+        """
         # Menu dimensions
         menu_width = 400
         menu_height = 350
         menu_x = (self.screen_width - menu_width) // 2
         menu_y = (self.screen_height - menu_height) // 2
+        panel_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
         
-        # Draw menu background
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_width, menu_height)
-        pygame.draw.rect(screen, self.bg_color, menu_rect)
-        pygame.draw.rect(screen, self.border_color, menu_rect, 3)
-        
-        # Draw title
+        # Title
         title = self._get_menu_title()
-        title_surf = font.render(title, True, self.text_color)
+        title_surf = self.text_cache.render(font, title, True, self.text_color)
         title_rect = title_surf.get_rect(centerx=menu_x + menu_width // 2, top=menu_y + 20)
-        screen.blit(title_surf, title_rect)
+        blits = [(title_surf, title_rect.topleft)]
         
-        # Draw menu items
+        # Menu items
         menu = self._get_current_menu()
         item_y = menu_y + 70
         item_spacing = 35
@@ -389,15 +421,29 @@ class MenuSystem:
             if not item.enabled:
                 color = self.disabled_color
             
-            # Draw selection indicator
+            # Selection indicator
             if i == self.selected_index:
                 indicator = "> "
             else:
                 indicator = "  "
             
-            text_surf = font.render(indicator + item.text, True, color)
-            screen.blit(text_surf, (menu_x + 40, item_y))
+            text_surf = self.text_cache.render(font, indicator + item.text, True, color)
+            blits.append((text_surf, (menu_x + 40, item_y)))
             item_y += item_spacing
+        
+        # Long menus spill past the panel; those parts need per-pixel alpha
+        bounds = panel_rect.unionall([surf.get_rect(topleft=pos) for surf, pos in blits])
+        if bounds == panel_rect:
+            surface = display_format(pygame.Surface(bounds.size))
+        else:
+            surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+        
+        panel = self.render_cache.panel(panel_rect.size, self.bg_color, self.border_color, 3)
+        surface.blit(panel, (menu_x - bounds.x, menu_y - bounds.y))
+        surface.blits([(surf, (x - bounds.x, y - bounds.y)) for surf, (x, y) in blits], doreturn=False)
+        return surface, bounds.topleft
     
     def _get_menu_title(self) -> str:
         """Get current menu title"""
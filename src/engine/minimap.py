@@ -0,0 +1,224 @@
+"""
+Minimap
+The whole shell at a few pixels per tile (or a block of tiles per pixel on
+huge shells), built with one palette lookup from a terrain type array and
+then patched pixel by pixel as tiles are explored, chests opened or the hero
+moves
+"""
+import logging
+import math
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+MINIMAP_EDGE = 128   # Longest side in pixels
+MAX_SCALE = 4        # Pixels per tile on small shells
+BORDER = 2
+UNSEEN_COLOR = (0, 0, 0)
+CHEST_COLOR = (248, 184, 0)
+HERO_COLOR = (248, 56, 0)
+BORDER_COLOR = (188, 188, 188)
+REBUILD_SHARE = 0.25  # Rebuild everything when more pixels than this changed
+
+# Palette rows before the terrain colours
+UNSEEN = 0
+CHEST = 1
+HERO = 2
+
+
+def palette_from_atlas(atlas, names):
+    """
+    Average each terrain sprite down to a single minimap colour
+
+    Args:
+        atlas: SpriteAtlas holding the sprites
+        names: Terrain sprite names (lower-case terrain class names)
+
+    Returns:
+        dict: name -> RGB
+    """
+    return {name: tuple(pygame.transform.average_color(atlas.sprite(atlas.id_of(name))))[:3]
+            for name in names if atlas.id_of(name) is not None}
+
+
+class Minimap:
+    """Pixel-per-tile overview of the world, kept up to date incrementally"""
+
+    def __init__(self, palette, topright=(0, 0), edge=MINIMAP_EDGE, max_scale=MAX_SCALE):
+        """
+        Initialize the minimap
+
+        Args:
+            palette: Terrain name -> RGB; must include 'grass' (used for empty tiles)
+            topright: Window position of the frame's top-right corner
+            edge: Longest side of the map in pixels
+            max_scale: Most pixels per tile
+        """
+        self.names = list(palette)
+        self._type_of = {name: i + HERO + 1 for i, name in enumerate(self.names)}
+        self.colors = np.array([UNSEEN_COLOR, CHEST_COLOR, HERO_COLOR] + [palette[name] for name in self.names],
+                               dtype=np.uint8)
+        self.topright = topright
+        self.edge = edge
+        self.max_scale = max_scale
+        self.width = 0
+        self.height = 0
+        self.step = 1   # Tiles per pixel edge; each pixel shows a step x step block
+        self.scale = 1  # Pixels per tile
+        self.types = None   # [y, x] palette row of each tile's terrain
+        self.seen = None    # [y, x] explored tiles
+        self.chests = None  # [y, x] unopened chests
+        self._chests = {}
+        self.hero = None
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Frame included
+        self.version = 0    # Bumped whenever pixels change
+        self.rebuilds = 0
+        self.patches = 0
+
+    def set_world(self, world, width, height, chests=()):
+        """
+        Switch to a new world: classify every tile once and draw the map
+
+        Args:
+            world: Dictionary of terrain tiles keyed by (x, y)
+            width: World width in tiles
+            height: World height in tiles
+            chests: Chest dictionaries with 'x', 'y' and 'opened'
+        """
+        self.width = width
+        self.height = height
+        self.step = max(1, math.ceil(max(width, height) / self.edge))
+        self.scale = max(1, min(self.max_scale, self.edge // max(width, height)))
+        grass = self._type_of['grass']
+        type_of = {}
+        self.types = np.full((height, width), grass, dtype=np.uint8)
+        for (x, y), tile in world.items():
+            if tile is not None:
+                cls = type(tile)
+                if cls not in type_of:
+                    type_of[cls] = self._type_of.get(cls.__name__.lower(), grass)
+                self.types[y, x] = type_of[cls]
+        self.seen = np.zeros((height, width), dtype=bool)
+        self._chests = {(chest['x'], chest['y']): chest for chest in chests}
+        self.chests = np.zeros((height, width), dtype=bool)
+        for (x, y), chest in self._chests.items():
+            self.chests[y, x] = not chest['opened']
+        self.hero = None
+
+        columns = -(-width // self.step)
+        rows = -(-height // self.step)
+        self.surface = pygame.Surface((columns * self.scale, rows * self.scale))
+        self.place(self.topright)
+        self.rebuild()
+        logger.debug(f"Minimap {columns}x{rows} px at {self.step} tiles/px, x{self.scale}")
+
+    def place(self, topright):
+        """Move the minimap so its frame's top-right corner is at a window position"""
+        self.topright = topright
+        size = self.surface.get_size() if self.surface else (0, 0)
+        self.rect = pygame.Rect(0, 0, size[0] + 2 * BORDER, size[1] + 2 * BORDER)
+        self.rect.topright = topright
+        self.version += 1
+
+    def rebuild(self):
+        """Redraw every pixel with one palette lookup"""
+        step = self.step
+        # A block shows once any of it is seen (in its top-left tile's terrain), and a
+        # chest if any seen tile in it holds one
+        rows = np.where(self._block_any(self.seen), self.types[::step, ::step], UNSEEN)
+        rows[self._block_any(self.seen & self.chests)] = CHEST
+        if self.hero:
+            rows[self.hero[1] // step, self.hero[0] // step] = HERO
+        rgb = self.colors[rows]
+        if self.scale > 1:
+            rgb = rgb.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+        pygame.surfarray.blit_array(self.surface, rgb.transpose(1, 0, 2))
+        self.rebuilds += 1
+        self.version += 1
+
+    def reveal(self, tiles):
+        """
+        Show newly explored tiles
+
+        Args:
+            tiles: (x, y) world tiles; ones already seen are skipped
+        """
+        new = [(x, y) for x, y in tiles if not self.seen[y, x]]
+        for x, y in new:
+            self.seen[y, x] = True
+        self._patch(self._pixels(new))
+
+    def refresh_tiles(self, tiles):
+        """
+        Redraw tiles whose chests changed
+
+        Args:
+            tiles: (x, y) world tiles
+        """
+        for x, y in tiles:
+            chest = self._chests.get((x, y))
+            self.chests[y, x] = chest is not None and not chest['opened']
+        self._patch(self._pixels(tiles))
+
+    def move_hero(self, x, y):
+        """Move the hero marker, redrawing only its old and new pixels"""
+        if self.hero == (x, y):
+            return
+        old, self.hero = self.hero, (x, y)
+        pixels = [(x // self.step, y // self.step)]
+        if old:
+            pixels.append((old[0] // self.step, old[1] // self.step))
+        self._patch(pixels)
+
+    def draw(self, screen):
+        """Draw the framed minimap"""
+        screen.fill(BORDER_COLOR, self.rect)
+        screen.blit(self.surface, (self.rect.x + BORDER, self.rect.y + BORDER))
+
+    def _block_any(self, mask):
+        """Collapse a [y, x] tile mask to [py, px] pixels: True where any tile of the block is"""
+        step = self.step
+        if step == 1:
+            return mask
+        rows, columns = -(-self.height // step), -(-self.width // step)
+        padded = np.zeros((rows * step, columns * step), dtype=bool)
+        padded[:self.height, :self.width] = mask
+        return padded.reshape(rows, step, columns, step).any(axis=(1, 3))
+
+    def _pixels(self, tiles):
+        """Pixels whose blocks hold any of the given tiles"""
+        step = self.step
+        return [(x // step, y // step) for x, y in tiles]
+
+    def _row(self, px, py):
+        """Palette row of one pixel"""
+        step = self.step
+        if self.hero and (self.hero[0] // step, self.hero[1] // step) == (px, py):
+            return HERO
+        x, y = px * step, py * step
+        seen = self.seen[y:y + step, x:x + step]
+        if not seen.any():
+            return UNSEEN
+        if (seen & self.chests[y:y + step, x:x + step]).any():
+            return CHEST
+        return self.types[y, x]
+
+    def _patch(self, pixels):
+        """Redraw some pixels, or everything when most of the map changed"""
+        if not pixels:
+            return
+        pixels = set(pixels)
+        total = self.surface.get_width() * self.surface.get_height() // (self.scale * self.scale)
+        if len(pixels) > total * REBUILD_SHARE:
+            self.rebuild()
+            return
+        scale = self.scale
+        fill = self.surface.fill
+        colors = self.colors
+        for px, py in pixels:
+            fill(colors[self._row(px, py)], (px * scale, py * scale, scale, scale))
+        self.patches += len(pixels)
+        self.version += 1
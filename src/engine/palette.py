@@ -0,0 +1,185 @@
+"""
+Indexed Palette
+8-bit palettized surfaces sharing one palette. Sprites are stored once as
+colour indices; a shell theme, a fog shade, a damage flash or a day/night
+tint is a new 256-colour palette pushed to every surface with set_palette,
+so nothing is regenerated or re-tinted
+"""
+import logging
+import weakref
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+PALETTE_SIZE = 256
+BLOCK = 64  # Indices per shade block: base colours first, then one block per shade
+VOID = 0    # Index 0 is always black (hidden tiles, letterboxing) and is never themed
+
+
+def multiply(colors, tint):
+    """Multiply colours by an RGB tint the way BLEND_RGB_MULT does"""
+    return (colors * np.array(tint, dtype=np.int32) + 255) >> 8
+
+
+class IndexedPalette:
+    """One palette shared by every surface it creates"""
+
+    def __init__(self):
+        """Initialize with only the black void colour"""
+        self.base = [(0, 0, 0)]          # Base colour of each index in the first block
+        self._index_of = {(0, 0, 0): VOID}
+        self.shades = {}                 # Shade tint -> block number
+        self.theme = None
+        self.colors = np.zeros((PALETTE_SIZE, 3), dtype=np.uint8)
+        self._surfaces = weakref.WeakSet()
+        self.swaps = 0
+
+    def indices(self, pixels):
+        """
+        Convert RGB pixels to base colour indices, adding colours not seen before
+
+        Args:
+            pixels: uint8 array indexed [y, x, channel]
+
+        Returns:
+            numpy.ndarray: uint8 index array indexed [y, x]
+        """
+        flat = pixels.reshape(-1, 3)
+        unique, inverse = np.unique(flat, axis=0, return_inverse=True)
+        lookup = np.array([self._add_color(tuple(int(c) for c in color)) for color in unique], dtype=np.uint8)
+        return lookup[inverse.reshape(-1)].reshape(pixels.shape[:2])
+
+    def to_surface(self, pixels):
+        """
+        Upload RGB pixels as a new 8-bit surface using this palette
+
+        Args:
+            pixels: uint8 array indexed [y, x, channel]
+
+        Returns:
+            pygame.Surface: Palettized surface
+        """
+        indices = self.indices(pixels)
+        surface = self.new_surface((indices.shape[1], indices.shape[0]))
+        pygame.surfarray.blit_array(surface, indices.swapaxes(0, 1))
+        return surface
+
+    def from_surface(self, surface):
+        """
+        Palettize a surface, or return it unchanged when it already uses this palette
+
+        Returns:
+            pygame.Surface: Palettized surface
+        """
+        if surface in self._surfaces:
+            return surface
+        return self.to_surface(pygame.surfarray.array3d(surface).swapaxes(0, 1))
+
+    def shaded(self, surface, tint):
+        """
+        Copy a palettized surface into the shade block for a tint
+
+        Args:
+            surface: Surface from this palette, drawn with base colours
+            tint: RGB multiplied into the base colours (e.g. the fog tint)
+
+        Returns:
+            pygame.Surface: Surface whose indices point into the shade block
+        """
+        block = self.shades.get(tint)
+        if block is None:
+            block = len(self.shades) + 1
+            if (block + 1) * BLOCK > PALETTE_SIZE:
+                raise ValueError(f"No palette room for shade {tint}")
+            self.shades[tint] = block
+            self._apply()
+        indices = pygame.surfarray.array2d(surface).astype(np.uint8)
+        shaded = np.where(indices == VOID, VOID, indices + block * BLOCK).astype(np.uint8)
+        copy = self.new_surface(surface.get_size())
+        pygame.surfarray.blit_array(copy, shaded)
+        return copy
+
+    def new_surface(self, size):
+        """
+        Create an 8-bit surface that follows this palette
+
+        Args:
+            size: (width, height) in pixels
+
+        Returns:
+            pygame.Surface: Black palettized surface
+        """
+        surface = pygame.Surface(size, depth=8)
+        surface.set_palette(self.colors.tolist())
+        self._surfaces.add(surface)
+        return surface
+
+    def set_theme(self, theme=None):
+        """
+        Recolour every surface for a theme
+
+        Args:
+            theme: Dictionary with an optional 'tint' (RGB multiplied into
+                   every colour, 255 = unchanged) and 'swaps' (base RGB ->
+                   replacement RGB), or None for the base colours
+        """
+        self.theme = theme
+        self._apply()
+
+    def flash(self, color, amount):
+        """
+        Blend every colour toward one colour (damage flash, fade); set_theme() restores
+
+        Args:
+            color: RGB to blend toward
+            amount: 0.0 (no change) to 1.0 (solid colour)
+        """
+        self._apply(np.array(color, dtype=float), amount)
+
+    def themed(self):
+        """
+        Base colours after the current theme
+
+        Returns:
+            numpy.ndarray: int array [index, channel] for the first block
+        """
+        colors = np.array(self.base, dtype=np.int32)
+        theme = self.theme or {}
+        for original, replacement in theme.get('swaps', {}).items():
+            index = self._index_of.get(tuple(original))
+            if index is not None:
+                colors[index] = replacement
+        if 'tint' in theme:
+            colors = multiply(colors, theme['tint'])
+        colors[VOID] = 0
+        return colors
+
+    def _apply(self, flash=None, amount=0.0):
+        """Rebuild the 256 colours and push them to every surface"""
+        themed = self.themed()
+        colors = np.zeros((PALETTE_SIZE, 3), dtype=np.int32)
+        colors[:len(themed)] = themed
+        for tint, block in self.shades.items():
+            colors[block * BLOCK:block * BLOCK + len(themed)] = multiply(themed, tint)
+        if flash is not None:
+            colors = (colors + (flash - colors) * amount).round()
+            colors[VOID::BLOCK] = 0
+        self.colors = colors.clip(0, 255).astype(np.uint8)
+        palette = self.colors.tolist()
+        for surface in self._surfaces:
+            surface.set_palette(palette)
+        self.swaps += 1
+
+    def _add_color(self, color):
+        """Index of a base colour, allocating one if needed"""
+        index = self._index_of.get(color)
+        if index is None:
+            index = len(self.base)
+            if index >= BLOCK:
+                raise ValueError(f"More than {BLOCK} base colours")
+            self.base.append(color)
+            self._index_of[color] = index
+            self._apply()
+        return index
@@ -0,0 +1,154 @@
+"""
+Particle Pool
+Fixed-capacity particles kept as NumPy arrays (position, velocity, lifetime,
+colour). Every live particle is updated with a few vectorized operations and
+drawn in one batched pixel write, so bursts of thousands stay cheap
+"""
+import logging
+import math
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+MAX_PARTICLES = 4096
+GRAVITY = 300.0      # Pixels per second squared, downwards
+MAX_STEP_MS = 50     # Longer frames (e.g. after an idle sleep) are simulated as this
+
+
+class ParticlePool:
+    """Preallocated particle arrays; live particles are packed at the front"""
+
+    def __init__(self, capacity=MAX_PARTICLES, gravity=GRAVITY, size=2, seed=None):
+        """
+        Initialize an empty pool
+
+        Args:
+            capacity: Most particles alive at once; extra emits are dropped
+            gravity: Downward acceleration in pixels/s^2
+            size: Particle edge in pixels
+            seed: Optional seed for emission directions
+        """
+        self.capacity = capacity
+        self.gravity = gravity
+        self.size = size
+        self.position = np.zeros((capacity, 2), dtype=np.float32)  # Pixels
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)  # Pixels/s
+        self.life = np.zeros(capacity, dtype=np.float32)           # Remaining ms
+        self.lifetime = np.ones(capacity, dtype=np.float32)        # Starting ms
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.count = 0
+        self.dropped = 0
+        self._rng = np.random.default_rng(seed)
+
+    def emit(self, x, y, count, speed, life_ms, color, spread=math.tau, direction=-math.pi / 2):
+        """
+        Emit a burst from one point
+
+        Args:
+            x: Origin X in pixels
+            y: Origin Y in pixels
+            count: Particles wanted
+            speed: (min, max) launch speed in pixels/s
+            life_ms: (min, max) lifetime in ms
+            color: RGB, or an array of RGB picked from at random
+            spread: Cone width in radians (tau for a full circle)
+            direction: Cone centre in radians (default straight up)
+
+        Returns:
+            int: Particles actually emitted (the pool may be full)
+        """
+        start = self.count
+        emitted = min(count, self.capacity - start)
+        self.dropped += count - emitted
+        if emitted <= 0:
+            return 0
+        end = start + emitted
+        rng = self._rng
+        angle = direction + rng.uniform(-spread / 2, spread / 2, emitted)
+        launch = rng.uniform(speed[0], speed[1], emitted)
+        self.position[start:end] = (x, y)
+        self.velocity[start:end, 0] = np.cos(angle) * launch
+        self.velocity[start:end, 1] = np.sin(angle) * launch
+        self.life[start:end] = self.lifetime[start:end] = rng.uniform(life_ms[0], life_ms[1], emitted)
+        colors = np.asarray(color, dtype=np.uint8).reshape(-1, 3)
+        self.color[start:end] = colors[rng.integers(len(colors), size=emitted)]
+        self.count = end
+        return emitted
+
+    def update(self, dt_ms):
+        """
+        Advance every live particle and drop the expired ones
+
+        Args:
+            dt_ms: Elapsed time in ms (capped at MAX_STEP_MS)
+        """
+        count = self.count
+        if not count:
+            return
+        dt_ms = min(dt_ms, MAX_STEP_MS)
+        dt = dt_ms / 1000
+        velocity = self.velocity[:count]
+        velocity[:, 1] += self.gravity * dt
+        self.position[:count] += velocity * dt
+        life = self.life[:count]
+        life -= dt_ms
+
+        alive = life > 0
+        if not alive.all():
+            kept = int(alive.sum())
+            for array in (self.position, self.velocity, self.life, self.lifetime, self.color):
+                array[:kept] = array[:count][alive]
+            self.count = kept
+
+    def clear(self):
+        """Drop every particle"""
+        self.count = 0
+
+    def bounds(self):
+        """
+        Get the box covering every live particle
+
+        Returns:
+            pygame.Rect: Pixel box, or None when the pool is empty
+        """
+        if not self.count:
+            return None
+        position = self.position[:self.count]
+        x0, y0 = np.floor(position.min(axis=0)).astype(int)
+        x1, y1 = np.floor(position.max(axis=0)).astype(int) + self.size
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Write every live particle's pixels in one batch, fading with age
+
+        Only pixels inside the surface's clip are touched. Needs a 24 or
+        32-bit surface.
+
+        Args:
+            surface: Surface to draw on
+            offset: (x, y) pixels subtracted from particle positions (camera)
+        """
+        count = self.count
+        if not count:
+            return
+        clip = surface.get_clip()
+        xs = self.position[:count, 0].astype(np.int32) - offset[0]
+        ys = self.position[:count, 1].astype(np.int32) - offset[1]
+        fade = (self.life[:count] / self.lifetime[:count])[:, None]
+        colors = (self.color[:count] * fade).astype(np.uint8)
+
+        # One column per pixel of each particle's size x size block
+        size = self.size
+        dx, dy = np.divmod(np.arange(size * size), size)
+        xs = (xs[:, None] + dx).ravel()
+        ys = (ys[:, None] + dy).ravel()
+        colors = np.repeat(colors, size * size, axis=0)
+        inside = (xs >= clip.left) & (xs < clip.right) & (ys >= clip.top) & (ys < clip.bottom)
+        if not inside.any():
+            return
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[xs[inside], ys[inside]] = colors[inside]
+        del pixels  # Unlock the surface
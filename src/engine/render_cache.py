@@ -0,0 +1,96 @@
+"""
+Render Cache
+Reusable overlay and panel surfaces, so frames draw UI chrome without
+allocating new surfaces
+"""
+import logging
+from collections import OrderedDict
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+RENDER_CACHE_SIZE = 64  # Distinct overlays and panels kept before the oldest is dropped
+
+
+class RenderCache:
+    """Surfaces built once per distinct look and reused every frame"""
+
+    def __init__(self, max_entries=RENDER_CACHE_SIZE):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_entries: Surfaces kept before least-recently-used ones are evicted
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def overlay(self, size, color, alpha=None):
+        """
+        Get a solid overlay (dimming layers, highlight masks)
+
+        Args:
+            size: (width, height) in pixels
+            color: RGB fill colour
+            alpha: Optional surface alpha (0-255)
+
+        Returns:
+            pygame.Surface: Shared surface - don't draw on it
+        """
+        key = ('overlay', tuple(size), tuple(color), alpha)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            if alpha is not None:
+                surface.set_alpha(alpha)
+            self._store(key, surface)
+        return surface
+
+    def panel(self, size, fill, border_color, border_width):
+        """
+        Get a filled panel with a border (message boxes, menu frames)
+
+        Args:
+            size: (width, height) in pixels
+            fill: RGB background colour
+            border_color: RGB border colour
+            border_width: Border thickness in pixels
+
+        Returns:
+            pygame.Surface: Shared surface - don't draw on it
+        """
+        key = ('panel', tuple(size), tuple(fill), tuple(border_color), border_width)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(fill)
+            pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+            self._store(key, surface)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+
+    def _lookup(self, key):
+        """Find a cached surface and count the hit or miss"""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            logger.debug(f"Render cache miss: {key}")
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def _store(self, key, surface):
+        """Cache a new surface, evicting the least recently used past the limit"""
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
@@ -4,17 +4,42 @@ Simplified rendering system
 import pygame
 import logging
 
+from engine.world_layer import WorldLayer
+from engine.sprite_atlas import SpriteAtlas
+from engine.sprite_factory import new_pixels, pixel_coords, to_surface
+from engine.smooth_camera import SmoothCamera
+
 logger = logging.getLogger(__name__)
 
 SPRITE_SIZE = 32
+FOG_TINT = (90, 90, 120)  # Multiplied into tiles outside the field of view
 
 class Renderer:
     """Handles all rendering"""
     
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, tile_size=SPRITE_SIZE):
+        """
+        Initialize the renderer
+        
+        Args:
+            screen_width: Width of the surface drawn into, in pixels
+            screen_height: Height of the surface drawn into, in pixels
+            tile_size: Tile edge in pixels; sprites are authored at SPRITE_SIZE
+                       and scaled (nearest neighbour) to it once
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.sprites = self._create_sprites()
+        self.tile_size = tile_size
+        sprites = {name: self._scaled(sprite) for name, sprite in self._create_sprites().items()}
+        self.atlas = SpriteAtlas.from_sprites(sprites, tile_size)
+        self.hero_id = self.atlas.id_of('hero')
+        self.world_layer = WorldLayer(self.atlas, FOG_TINT)
+        for name, frames in self._create_animations().items():
+            self.world_layer.add_animation(name, [self._scaled(frame) for frame in frames])
+        
+        # The view and hero sprite glide between tiles in pixels
+        self.camera = SmoothCamera(tile_size)
+        self.hero_sprite = SmoothCamera(tile_size)
         logger.info("Renderer initialized")
     
     def _create_sprites(self):
@@ -22,21 +47,15 @@ class Renderer:
         sprites = {}
         
         # Grass - simple green with variation
-        grass = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        for y in range(SPRITE_SIZE):
-            for x in range(SPRITE_SIZE):
-                color = (0, 168, 0) if (x + y) % 4 < 2 else (0, 180, 0)
-                grass.set_at((x, y), color)
-        sprites['grass'] = grass
+        grass = new_pixels(SPRITE_SIZE, (0, 168, 0))
+        ys, xs = pixel_coords(grass)
+        grass[(xs + ys) % 4 >= 2] = (0, 180, 0)
+        sprites['grass'] = to_surface(grass)
         
         # River - blue with waves
-        river = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        river.fill((0, 88, 248))
-        for y in range(0, SPRITE_SIZE, 4):
-            for x in range(SPRITE_SIZE):
-                if (x + y) % 8 < 4:
-                    river.set_at((x, y), (88, 160, 248))
-        sprites['river'] = river
+        river = new_pixels(SPRITE_SIZE, (0, 88, 248))
+        river[(ys % 4 == 0) & ((xs + ys) % 8 < 4)] = (88, 160, 248)
+        sprites['river'] = to_surface(river)
         
         # Rock - gray boulder
         rock = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
@@ -67,6 +86,14 @@ class Renderer:
         pygame.draw.rect(chest, (255, 215, 0), (13, 16, 6, 6))  # Lock
         sprites['chest'] = chest
         
+        # Opened chest - same box under a light overlay
+        chest_open = chest.copy()
+        overlay = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
+        overlay.fill((255, 255, 255))
+        overlay.set_alpha(100)
+        chest_open.blit(overlay, (0, 0))
+        sprites['chest_open'] = chest_open
+        
         # Hero - red character
         hero = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
         hero.fill((0, 168, 0))
@@ -79,43 +106,116 @@ class Renderer:
         logger.info("Created all sprites")
         return sprites
     
-    def render_world(self, screen, game_state, grid_width, grid_height):
-        """Render the visible world"""
-        for y in range(grid_height):
-            for x in range(grid_width):
-                world_x = x + game_state.camera_x
-                world_y = y + game_state.camera_y
-                
-                if (0 <= world_x < game_state.world_width and
-                    0 <= world_y < game_state.world_height):
-                    
-                    tile = game_state.world.get((world_x, world_y))
-                    if tile:
-                        tile_type = type(tile).__name__.lower()
-                        sprite = self.sprites.get(tile_type, self.sprites['grass'])
-                    else:
-                        sprite = self.sprites['grass']
-                    
-                    screen.blit(sprite, (x * SPRITE_SIZE, y * SPRITE_SIZE))
+    def _create_animations(self):
+        """
+        Create the extra frames of animated tiles
+        
+        Returns:
+            dict: Sprite name -> frames following the plain sprite
+        """
+        # River - the wave pattern drifts 2px per frame (period 8px, so it loops)
+        frames = []
+        for shift in (2, 4, 6):
+            river = new_pixels(SPRITE_SIZE, (0, 88, 248))
+            ys, xs = pixel_coords(river)
+            river[(ys % 4 == 0) & ((xs + ys + shift) % 8 < 4)] = (88, 160, 248)
+            frames.append(to_surface(river))
+        return {'river': frames}
+    
+    def _scaled(self, sprite):
+        """Scale a SPRITE_SIZE sprite to the tile size (nearest neighbour)"""
+        if self.tile_size == SPRITE_SIZE:
+            return sprite
+        return pygame.transform.scale(sprite, (self.tile_size, self.tile_size))
+    
+    def set_world(self, game_state):
+        """Re-bake the world layer for a new world (call after chests are placed)"""
+        self.world_layer.set_world(game_state.world, game_state.world_width,
+                                   game_state.world_height, game_state.chests)
+        self.camera.snap(game_state.camera_x, game_state.camera_y)
+        self.hero_sprite.snap(game_state.hero_x, game_state.hero_y)
+    
+    @property
+    def moving(self):
+        """Check if the camera or hero is still gliding"""
+        return self.camera.moving or self.hero_sprite.moving
+    
+    def update_motion(self, game_state, now_ms):
+        """
+        Advance the camera and hero glide toward the game state
+        
+        Args:
+            game_state: GameState whose camera and hero to follow
+            now_ms: Current time in ms
+        
+        Returns:
+            bool: True if anything moved
+        """
+        camera_moved = self.camera.update(game_state.camera_x, game_state.camera_y, now_ms)
+        hero_moved = self.hero_sprite.update(game_state.hero_x, game_state.hero_y, now_ms)
+        return camera_moved or hero_moved
+    
+    def animate(self, now_ms):
+        """
+        Advance animated tiles under the camera
+        
+        Args:
+            now_ms: Current time in ms
+        
+        Returns:
+            list: (x, y) world tiles that changed
+        """
+        camera_x, camera_y = self.camera.offset()
+        size = self.tile_size
+        view = (camera_x // size, camera_y // size,
+                (camera_x + self.screen_width - 1) // size + 1, (camera_y + self.screen_height - 1) // size + 1)
+        return self.world_layer.animate(now_ms, view)
+    
+    def animation_due_in(self, now_ms):
+        """Milliseconds until animated tiles in view change, None if there are none"""
+        return self.world_layer.frame_due_in(now_ms)
+    
+    def refresh_tile(self, x, y):
+        """Re-bake one tile after its terrain or chest changed"""
+        self.world_layer.refresh_tile(x, y)
+    
+    def update_fog(self, game_state):
+        """
+        Re-bake tiles whose visibility changed after the FOV was recomputed
+        
+        Returns:
+            list: (x, y) world tiles that look different now
+        """
+        if not game_state.fov:
+            return []
+        return self.world_layer.update_fog(game_state.fov, game_state.explored)
+    
+    def render_view(self, screen, game_state, rects=None, profiler=None):
+        """
+        Render world, fog and hero
+        
+        Args:
+            screen: Surface to draw on
+            game_state: GameState to draw
+            rects: Screen rectangles to redraw, or None for the whole screen
+            profiler: FrameProfiler charged with 'world' and 'entities' time
+        """
+        for rect in rects or [screen.get_rect()]:
+            screen.set_clip(rect)
+            self.render_world(screen, game_state)
+            if profiler:
+                profiler.lap('world')
+            self.render_hero(screen, game_state)
+            if profiler:
+                profiler.lap('entities')
+        screen.set_clip(None)
     
-    def render_chests(self, screen, game_state):
-        """Render treasure chests"""
-        for chest in game_state.chests:
-            screen_x = (chest['x'] - game_state.camera_x) * SPRITE_SIZE
-            screen_y = (chest['y'] - game_state.camera_y) * SPRITE_SIZE
-            
-            if 0 <= screen_x < self.screen_width and 0 <= screen_y < self.screen_height:
-                screen.blit(self.sprites['chest'], (screen_x, screen_y))
-                # If opened, draw an indicator
-                if chest['opened']:
-                    # Draw a lighter overlay to show it's opened
-                    overlay = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-                    overlay.fill((255, 255, 255))
-                    overlay.set_alpha(100)
-                    screen.blit(overlay, (screen_x, screen_y))
+    def render_world(self, screen, game_state):
+        """Render the visible world from the baked layer at the camera's pixel offset"""
+        self.world_layer.blit_view_px(screen, *self.camera.offset())
     
     def render_hero(self, screen, game_state):
-        """Render hero"""
-        screen_x = (game_state.hero_x - game_state.camera_x) * SPRITE_SIZE
-        screen_y = (game_state.hero_y - game_state.camera_y) * SPRITE_SIZE
-        screen.blit(self.sprites['hero'], (screen_x, screen_y))
+        """Render hero at its gliding pixel position"""
+        hero_x, hero_y = self.hero_sprite.offset()
+        camera_x, camera_y = self.camera.offset()
+        self.atlas.blit(screen, self.hero_id, (hero_x - camera_x, hero_y - camera_y))
@@ -63,6 +63,11 @@ class SaveSystem:
             }
         }
         
+        # Fog of war memory, stored as compressed bits
+        explored = game_state.get('explored')
+        if explored is not None:
+            data['explored'] = explored.to_save()
+        
         with open(save_path, 'w') as f:
             json.dump(data, f, indent=2)
         
@@ -4,8 +4,13 @@ Simplified menu system
 import pygame
 import logging
 
+from engine.render_cache import RenderCache
+from engine.text_cache import TextCache
+
 logger = logging.getLogger(__name__)
 
+SLOTS = ['head', 'chest', 'legs', 'weapon1', 'weapon2', 'ring1', 'ring2']
+
 class SimpleMenu:
     """Simple menu display"""
     
@@ -14,8 +19,19 @@ class SimpleMenu:
         self.height = height
         self.cursor = 0
         self.options = ['Inventory', 'Options', 'Save', 'Load', 'Close']
+        self.render_cache = RenderCache()
+        self.text_cache = TextCache()
+        self._text = None      # Menu label blits
+        self._text_key = None  # (cursor, font) it was laid out for
+        self._names = []       # Item name per slot it was laid out with
         logger.info("Menu system initialized")
     
+    def resize(self, width, height):
+        """Lay the menu out for a new window size"""
+        self.width = width
+        self.height = height
+        self._text_key = None
+    
     def move_cursor(self, direction):
         """Move menu cursor"""
         self.cursor = (self.cursor + direction) % len(self.options)
@@ -29,33 +45,62 @@ class SimpleMenu:
     def render(self, screen, font, game_state):
         """Render menu overlay"""
         # Semi-transparent background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(200)
-        overlay.fill((20, 20, 20))
+        overlay = self.render_cache.overlay((self.width, self.height), (20, 20, 20), 200)
         screen.blit(overlay, (0, 0))
         
+        # Text layout is only rebuilt when the cursor or inventory changes
+        key = (self.cursor, font)
+        if key != self._text_key or self._names_changed(game_state):
+            self._names = [self._item_name(game_state, slot) for slot in SLOTS]
+            self._text = self._layout_text(font, self._names)
+            self._text_key = key
+        screen.blits(self._text, doreturn=False)
+    
+    def _names_changed(self, game_state):
+        """Check if any slot shows a different item than the current layout"""
+        for slot, name in zip(SLOTS, self._names):
+            if self._item_name(game_state, slot) != name:
+                return True
+        return False
+    
+    def _item_name(self, game_state, slot):
+        """Name shown for an inventory slot"""
+        item = game_state.inventory.get(slot)
+        return item.name if item else "Empty"
+    
+    def _layout_text(self, font, names):
+        """
+        Render and place every menu label
+        
+        Args:
+            font: Font for every label
+            names: Item name per slot in SLOTS
+        
+        Returns:
+            list: (surface, position) pairs for Surface.blits()
+        """
+        blits = []
+        
         # Menu title
-        title = font.render("MENU", True, (255, 255, 255))
-        screen.blit(title, (self.width // 2 - title.get_width() // 2, 50))
+        title = self.text_cache.render(font, "MENU", True, (255, 255, 255))
+        blits.append((title, (self.width // 2 - title.get_width() // 2, 50)))
         
         # Inventory section
         y = 120
-        inv_title = font.render("INVENTORY", True, (200, 200, 200))
-        screen.blit(inv_title, (50, y))
+        inv_title = self.text_cache.render(font, "INVENTORY", True, (200, 200, 200))
+        blits.append((inv_title, (50, y)))
         y += 40
         
-        slots = ['head', 'chest', 'legs', 'weapon1', 'weapon2', 'ring1', 'ring2']
-        for slot in slots:
-            item = game_state.inventory.get(slot)
-            item_name = item.name if item else "Empty"
-            text = font.render(f"{slot.upper()}: {item_name}", True, (150, 150, 150))
-            screen.blit(text, (70, y))
+        for slot, item_name in zip(SLOTS, names):
+            text = self.text_cache.render(font, f"{slot.upper()}: {item_name}", True, (150, 150, 150))
+            blits.append((text, (70, y)))
             y += 35
         
         # Menu options
         y = self.height - 200
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.cursor else (180, 180, 180)
-            text = font.render(f"{'>' if i == self.cursor else ' '} {option}", True, color)
-            screen.blit(text, (self.width // 2 - 100, y))
+            text = self.text_cache.render(font, f"{'>' if i == self.cursor else ' '} {option}", True, color)
+            blits.append((text, (self.width // 2 - 100, y)))
             y += 35
+        return blits
@@ -0,0 +1,99 @@
+"""
+Smooth Camera
+Eases a pixel position toward a tile-aligned target over several frames, so
+the view glides between tiles instead of snapping a whole tile per step
+"""
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+SCROLL_EASE_MS = 40   # Time constant: the gap shrinks by ~63% every 40 ms
+FRAME_MS = 1000 / 60  # Step used for the first frame after resting
+MAX_STEP_MS = 100     # Longest step, so a stalled frame doesn't jump
+
+
+class SmoothCamera:
+    """Pixel position following a tile target with exponential easing"""
+
+    def __init__(self, tile_size, ease_ms=SCROLL_EASE_MS):
+        """
+        Initialize at the origin
+
+        Args:
+            tile_size: Tile edge length in pixels
+            ease_ms: Easing time constant; 0 snaps straight to the target
+        """
+        self.tile_size = tile_size
+        self.ease_ms = ease_ms
+        self.x = 0.0
+        self.y = 0.0
+        self.target_x = 0
+        self.target_y = 0
+        self._last_ms = None
+
+    @property
+    def moving(self):
+        """Check if the position hasn't reached its target yet"""
+        return self.x != self.target_x or self.y != self.target_y
+
+    def snap(self, tile_x, tile_y):
+        """
+        Jump straight to a tile (new world, teleport)
+
+        Args:
+            tile_x: Target X in tiles
+            tile_y: Target Y in tiles
+        """
+        self.target_x = self.x = tile_x * self.tile_size
+        self.target_y = self.y = tile_y * self.tile_size
+        self._last_ms = None
+
+    def update(self, tile_x, tile_y, now_ms):
+        """
+        Move toward a tile target
+
+        Args:
+            tile_x: Target X in tiles
+            tile_y: Target Y in tiles
+            now_ms: Current time in ms (pygame.time.get_ticks())
+
+        Returns:
+            bool: True if the position changed
+        """
+        was_moving = self.moving
+        self.target_x = tile_x * self.tile_size
+        self.target_y = tile_y * self.tile_size
+        if not self.moving:
+            self._last_ms = now_ms
+            return False
+        if self.ease_ms <= 0:
+            self.snap(tile_x, tile_y)
+            return True
+
+        # Starting from rest, the time since the last update is idle time
+        if was_moving and self._last_ms is not None:
+            dt = min(max(now_ms - self._last_ms, 0), MAX_STEP_MS)
+        else:
+            dt = FRAME_MS
+        self._last_ms = now_ms
+
+        pull = 1 - math.exp(-dt / self.ease_ms)
+        self.x = self._approach(self.x, self.target_x, pull)
+        self.y = self._approach(self.y, self.target_y, pull)
+        return True
+
+    def offset(self):
+        """
+        Get the position rounded to whole pixels
+
+        Returns:
+            tuple: (x, y) in pixels
+        """
+        return round(self.x), round(self.y)
+
+    @staticmethod
+    def _approach(value, target, pull):
+        """Move a share of the way to target, landing on it when under half a pixel"""
+        value += (target - value) * pull
+        return target if abs(target - value) < 0.5 else value
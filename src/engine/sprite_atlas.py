@@ -0,0 +1,159 @@
+"""
+Sprite Atlas
+Packs every tile, variant and entity sprite into one display-format surface
+(or one 8-bit surface sharing an IndexedPalette); sprites are addressed by
+integer tile ID and drawn as area blits
+"""
+import logging
+import pygame
+
+logger = logging.getLogger(__name__)
+
+ATLAS_COLUMNS = 16
+
+
+def display_format(surface):
+    """
+    Convert a surface to the display's pixel format when a display exists
+
+    Args:
+        surface: Surface to convert
+
+    Returns:
+        pygame.Surface: Converted surface, or the original one when headless
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert()
+    return surface
+
+
+class SpriteAtlas:
+    """One packed surface of equally sized sprites, looked up by integer ID"""
+
+    def __init__(self, tile_size, columns=ATLAS_COLUMNS, palette=None):
+        """
+        Initialize an empty atlas
+
+        Args:
+            tile_size: Sprite edge length in pixels
+            columns: Sprites per atlas row
+            palette: Optional IndexedPalette; sprites are then palettized
+                     and the atlas and its chunks are 8-bit surfaces
+        """
+        self.tile_size = tile_size
+        self.columns = columns
+        self.palette = palette
+        self.ids = {}     # (name, variant) -> tile ID
+        self.rects = []   # tile ID -> area rect in the atlas surface
+        self._sources = []
+        self._surface = None
+
+    @classmethod
+    def from_sprites(cls, sprites, tile_size, palette=None):
+        """
+        Build an atlas from a name -> Surface dictionary
+
+        Args:
+            sprites: Dictionary of sprite surfaces
+            tile_size: Sprite edge length in pixels
+            palette: Optional IndexedPalette shared by the atlas
+
+        Returns:
+            SpriteAtlas: Atlas holding every sprite, IDs in dictionary order
+        """
+        atlas = cls(tile_size, palette=palette)
+        for name, sprite in sprites.items():
+            atlas.add(name, sprite)
+        logger.info(f"Sprite atlas built with {len(sprites)} sprites")
+        return atlas
+
+    def add(self, name, sprite, variant=None):
+        """
+        Add a sprite
+
+        Args:
+            name: Sprite name (e.g. 'grass', 'hero')
+            sprite: Surface of tile_size x tile_size
+            variant: Optional variant label (e.g. 'dim')
+
+        Returns:
+            int: Tile ID of the sprite
+        """
+        if self.palette:
+            sprite = self.palette.from_surface(sprite)
+        tile_id = len(self._sources)
+        self._sources.append(sprite)
+        self.ids[(name, variant)] = tile_id
+        column, row = tile_id % self.columns, tile_id // self.columns
+        self.rects.append(pygame.Rect(column * self.tile_size, row * self.tile_size,
+                                      self.tile_size, self.tile_size))
+        self._surface = None  # Repacked on next use
+        return tile_id
+
+    def add_tinted(self, variant, tint):
+        """
+        Add a multiplied-colour variant of every plain sprite
+
+        Args:
+            variant: Variant label for the new sprites
+            tint: RGB multiplied into each pixel
+        """
+        for (name, existing), tile_id in list(self.ids.items()):
+            if existing is None:
+                if self.palette:
+                    tinted = self.palette.shaded(self._sources[tile_id], tint)  # Same indices, shade block
+                else:
+                    tinted = self._sources[tile_id].copy()
+                    tinted.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+                self.add(name, tinted, variant)
+
+    def id_of(self, name, variant=None, default=None):
+        """
+        Look up a tile ID
+
+        Args:
+            name: Sprite name
+            variant: Variant label, or None for the plain sprite
+            default: Value returned when the sprite is missing
+
+        Returns:
+            int: Tile ID, or default
+        """
+        return self.ids.get((name, variant), default)
+
+    @property
+    def surface(self):
+        """Packed display-format surface, rebuilt after sprites are added"""
+        if self._surface is None:
+            rows = (len(self._sources) + self.columns - 1) // self.columns
+            packed = self.new_surface((self.columns * self.tile_size, max(rows, 1) * self.tile_size))
+            packed.blits(list(zip(self._sources, self.rects)), doreturn=False)
+            self._surface = packed
+        return self._surface
+
+    def new_surface(self, size):
+        """
+        Create a surface that atlas sprites copy into unchanged (e.g. a baked chunk)
+
+        Args:
+            size: (width, height) in pixels
+
+        Returns:
+            pygame.Surface: Display-format surface, or 8-bit on the atlas palette
+        """
+        if self.palette:
+            return self.palette.new_surface(size)
+        return display_format(pygame.Surface(size))
+
+    def blit(self, target, tile_id, position):
+        """Draw one sprite onto a surface"""
+        target.blit(self.surface, position, self.rects[tile_id])
+
+    def sprite(self, tile_id):
+        """
+        Get a sprite as its own surface (a view into the atlas)
+
+        Returns:
+            pygame.Surface: Subsurface for the tile ID
+        """
+        return self.surface.subsurface(self.rects[tile_id])
@@ -0,0 +1,105 @@
+"""
+Sprite Factory
+Builds procedural sprites as NumPy pixel arrays and uploads each one with a
+single pygame.surfarray call, instead of painting pixel by pixel with set_at
+"""
+import logging
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+def new_pixels(size, color):
+    """
+    Create a square pixel array filled with one colour
+
+    Args:
+        size: Edge length in pixels
+        color: RGB fill colour
+
+    Returns:
+        numpy.ndarray: uint8 array indexed [y, x, channel]
+    """
+    return np.full((size, size, 3), color, dtype=np.uint8)
+
+
+def pixel_coords(pixels):
+    """
+    Get per-pixel coordinate grids for writing pattern formulas
+
+    Returns:
+        tuple: (ys, xs) integer arrays shaped like the image
+    """
+    return np.indices(pixels.shape[:2])
+
+
+def fill_rect(pixels, rect, color):
+    """
+    Fill a rectangle of a pixel array
+
+    Args:
+        pixels: Array from new_pixels()
+        rect: (x, y, width, height)
+        color: RGB colour
+    """
+    x, y, width, height = rect
+    pixels[y:y + height, x:x + width] = color
+
+
+def pattern_mask(pattern, char='#'):
+    """
+    Turn an ASCII pattern into a boolean mask
+
+    Args:
+        pattern: List of equal-length strings, one per row
+        char: Character that marks a filled cell
+
+    Returns:
+        numpy.ndarray: Boolean mask indexed [row, column]
+    """
+    return np.array([[c == char for c in row] for row in pattern], dtype=bool)
+
+
+def stamp(pixels, pattern, colors, origin=(0, 0), scale=1, char='#'):
+    """
+    Draw an ASCII pattern into a pixel array
+
+    Each pattern cell becomes a scale x scale block. With two colours, cells
+    alternate in a checkerboard on (column + row) % 2, which gives the chunky
+    dithered NES look.
+
+    Args:
+        pixels: Array from new_pixels()
+        pattern: List of equal-length strings (e.g. rock_pattern)
+        colors: One RGB colour, or a pair alternated per cell
+        origin: (x, y) pixel position of the pattern's top-left corner
+        scale: Pixels per pattern cell
+        char: Character that marks a filled cell
+    """
+    mask = pattern_mask(pattern, char)
+    rows, columns = np.indices(mask.shape)
+    palette = np.array(colors, dtype=np.uint8).reshape(-1, 3)
+    cells = palette[(rows + columns) % len(palette)]
+
+    mask = mask.repeat(scale, axis=0).repeat(scale, axis=1)
+    cells = cells.repeat(scale, axis=0).repeat(scale, axis=1)
+    x, y = origin
+    target = pixels[y:y + mask.shape[0], x:x + mask.shape[1]]
+    target[mask] = cells[mask]
+
+
+def to_surface(pixels):
+    """
+    Upload a pixel array to a new surface in one call
+
+    Args:
+        pixels: uint8 array indexed [y, x, channel]
+
+    Returns:
+        pygame.Surface: Surface holding the pixels
+    """
+    height, width = pixels.shape[:2]
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, pixels.swapaxes(0, 1))
+    return surface
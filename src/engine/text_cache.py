@@ -0,0 +1,87 @@
+"""
+Text Cache
+Least-recently-used cache of rendered text surfaces, so UI labels are
+rasterized once instead of on every frame
+"""
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+TEXT_CACHE_SIZE = 256  # Distinct labels kept before the oldest is dropped
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color, antialias)"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_entries: Surfaces kept before least-recently-used ones are evicted
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Get a text surface, rendering it on a miss
+
+        Takes the same arguments as pygame.font.Font.render, plus the font.
+
+        Args:
+            font: pygame.font.Font to render with
+            text: String to draw
+            antialias: Smooth edges
+            color: RGB text colour
+
+        Returns:
+            pygame.Surface: Shared surface - don't draw on it
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    @property
+    def hit_rate(self):
+        """Share of lookups served from the cache (0.0 before any lookup)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entry count, hits, misses, evictions and hit rate
+        """
+        return {
+            'entries': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def clear(self):
+        """Drop every cached surface and log the final statistics"""
+        logger.debug(f"Text cache cleared: {self.stats()}")
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
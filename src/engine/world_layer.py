@@ -0,0 +1,372 @@
+"""
+World Layer
+Terrain, chests and fog pre-rendered into chunk surfaces, so a frame draws
+the viewport with a few area blits instead of one blit per tile. Animated
+terrain (water) cycles through precomputed atlas frames by re-baking only
+the animated tiles in view
+"""
+import logging
+import math
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+CHUNK_TILES = 32  # Chunk edge in tiles; a 25x19 viewport overlaps at most 4 chunks
+ANIM_FRAME_MS = 200  # Time each animation frame is shown
+
+# Fog state of a baked tile
+HIDDEN = 0  # Never seen - drawn black
+DIM = 1     # Explored but out of sight - drawn with darkened sprites
+LIT = 2     # In sight
+
+
+class WorldLayer:
+    """Lazily baked chunk surfaces of the world"""
+
+    def __init__(self, atlas, fog_tint, chunk_tiles=CHUNK_TILES, frame_ms=ANIM_FRAME_MS):
+        """
+        Initialize the world layer
+
+        Args:
+            atlas: SpriteAtlas with sprites named by lower-case terrain class
+                   name, plus 'chest' and optionally 'chest_open' (opened
+                   chests are left off the layer without it). 'dim' variants
+                   and a black 'hidden' tile are added to it.
+            fog_tint: RGB multiplied into explored tiles out of sight
+            chunk_tiles: Chunk edge in tiles
+            frame_ms: Time each animation frame is shown
+        """
+        self.atlas = atlas
+        tile_size = atlas.tile_size
+        if atlas.id_of('grass', 'dim') is None:
+            atlas.add_tinted('dim', fog_tint)
+        if atlas.id_of('hidden') is None:
+            atlas.add('hidden', pygame.Surface((tile_size, tile_size)))
+        self.hidden_id = atlas.id_of('hidden')
+        self._terrain_ids = {}  # (terrain class, variant) -> tile ID
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.world = {}
+        self.width = 0
+        self.height = 0
+        self.chests = {}
+        self.shade = None  # [y, x] fog state, None until fog is first applied
+        self._fog_bounds = None
+        self._fog_recomputes = None
+        self._chunks = {}
+        self.bakes = 0
+        self.rebakes = 0
+
+        # Tile animation: plain tile ID -> frame tile IDs, advanced on a global tick
+        self.frame_ms = frame_ms
+        self.tick = 0
+        self._cycles = {}
+        self._period = 1           # Ticks before every cycle is back at frame 0
+        self._frame_blits = {}     # Tick % period -> (chunk key, blits, tiles) for _frame_key
+        self._frame_key = None
+        self._animated = None      # [y, x] mask of animated terrain
+        self._shade_version = 0    # Bumped whenever fog states change
+        self._view_tiles = None    # (view, shade version) -> animated lit tiles in it
+        self._view_key = None
+
+    def set_world(self, world, width, height, chests=()):
+        """
+        Switch to a new world, dropping every baked chunk
+
+        Args:
+            world: Dictionary of terrain tiles keyed by (x, y)
+            width: World width in tiles
+            height: World height in tiles
+            chests: Chest dictionaries with 'x', 'y' and 'opened'
+        """
+        self.world = world
+        self.width = width
+        self.height = height
+        self.chests = {(chest['x'], chest['y']): chest for chest in chests}
+        self.shade = None
+        self._fog_bounds = None
+        self._fog_recomputes = None
+        self._chunks.clear()
+        self._animated = None
+        self._view_key = None
+        self._frame_key = None
+        logger.debug(f"World layer reset for {width}x{height} world")
+
+    def add_animation(self, name, frames):
+        """
+        Animate a sprite by cycling through precomputed frames
+
+        Args:
+            name: Sprite name already in the atlas (frame 0)
+            frames: Surfaces for the following frames; added to the atlas as
+                    variants ('anim1', 'anim2', ...)
+        """
+        base_id = self.atlas.id_of(name)
+        ids = [base_id] + [self.atlas.add(name, frame, f'anim{i}') for i, frame in enumerate(frames, 1)]
+        self._cycles[base_id] = ids
+        self._period = math.lcm(*(len(cycle) for cycle in self._cycles.values()))
+        self._animated = None
+        self._chunks.clear()  # Atlas was repacked
+        logger.debug(f"Animation for {name}: {len(ids)} frames")
+
+    def frame_due_in(self, now_ms):
+        """
+        Milliseconds until the next animation frame
+
+        Returns:
+            int: Time to wait, or None when nothing animated was in view last update
+        """
+        if not self._view_tiles:
+            return None
+        return self.frame_ms - now_ms % self.frame_ms
+
+    def animate(self, now_ms, view):
+        """
+        Advance animated tiles to the frame for now_ms, re-baking the ones in view
+
+        Tiles outside the view keep their old frame until they scroll in (the
+        view changes) or get re-baked for another reason.
+
+        Args:
+            now_ms: Current time in ms
+            view: (x0, y0, x1, y1) world tiles on screen, end exclusive
+
+        Returns:
+            list: (x, y) world tiles that were re-baked
+        """
+        if not self._cycles:
+            return []
+        tick = now_ms // self.frame_ms
+        view_changed = self._view_key is None or self._view_key[0] != view
+        if tick == self.tick and not view_changed:
+            return []
+        self.tick = tick
+        tiles = self.animated_tiles(view)
+        self._bake_frame(tiles)
+        return tiles
+
+    def animated_tiles(self, view):
+        """
+        Get the animated, in-sight tiles inside a view (cached per view and fog state)
+
+        Args:
+            view: (x0, y0, x1, y1) world tiles, end exclusive
+
+        Returns:
+            list: (x, y) world tiles
+        """
+        key = (view, self._shade_version)
+        if key == self._view_key:
+            return self._view_tiles
+        if self._animated is None:
+            self._animated = np.zeros((self.height, self.width), dtype=bool)
+            for (x, y), tile in self.world.items():
+                if self._terrain_id(tile, None) in self._cycles:
+                    self._animated[y, x] = True
+        x0, y0 = max(view[0], 0), max(view[1], 0)
+        x1, y1 = min(view[2], self.width), min(view[3], self.height)
+        mask = self._animated[y0:y1, x0:x1]
+        if self.shade is not None:
+            mask = mask & (self.shade[y0:y1, x0:x1] == LIT)
+        self._view_tiles = [(int(x) + x0, int(y) + y0) for y, x in np.argwhere(mask)]
+        self._view_key = key
+        return self._view_tiles
+
+    def _bake_frame(self, tiles):
+        """
+        Re-bake the animated tiles in view for the current tick
+
+        The blit sequences repeat every period ticks while the view and fog
+        stay the same, so every phase is built when they change and tick
+        frames only replay them.
+        """
+        key = (self._view_key, self.atlas.surface)
+        if key != self._frame_key:
+            by_chunk = {}
+            for x, y in tiles:
+                by_chunk.setdefault((x // self.chunk_tiles, y // self.chunk_tiles), []).append((x, y))
+            self._frame_blits = {
+                phase: [(chunk_key, self._tile_blits(chunk_key, chunk_tiles, phase), len(chunk_tiles))
+                        for chunk_key, chunk_tiles in by_chunk.items()]
+                for phase in range(self._period)}
+            self._frame_key = key
+        for chunk_key, sequence, count in self._frame_blits[self.tick % self._period]:
+            chunk = self._chunks.get(chunk_key)
+            if chunk is not None:  # Others get baked when first drawn
+                chunk.blits(sequence, doreturn=False)
+                self.rebakes += count
+
+    def refresh_tile(self, x, y):
+        """
+        Re-bake one tile after its terrain or chest changed
+
+        Args:
+            x: World X coordinate
+            y: World Y coordinate
+        """
+        self.refresh_tiles([(x, y)])
+
+    def refresh_tiles(self, tiles):
+        """
+        Re-bake several tiles with one blits() call per chunk
+
+        Args:
+            tiles: Iterable of (x, y) world coordinates
+        """
+        by_chunk = {}
+        for x, y in tiles:
+            chunk_key = (x // self.chunk_tiles, y // self.chunk_tiles)
+            if chunk_key in self._chunks:  # Others get baked when first drawn
+                by_chunk.setdefault(chunk_key, []).append((x, y))
+        for chunk_key, chunk_tiles in by_chunk.items():
+            self._chunks[chunk_key].blits(self._tile_blits(chunk_key, chunk_tiles), doreturn=False)
+            self.rebakes += len(chunk_tiles)
+
+    def update_fog(self, fov, explored):
+        """
+        Re-bake tiles whose fog state changed since the last call
+
+        When the FOV was recomputed exactly once since the last call, only
+        the box around the previous and current FOV boxes is compared, since
+        nothing outside it can change state; otherwise the whole map is.
+
+        Args:
+            fov: FieldOfView with an up-to-date visible mask
+            explored: ExploredMap, or None to treat only visible tiles as seen
+
+        Returns:
+            list: (x, y) world tiles that changed state
+        """
+        bounds = fov.bounds()
+        if bounds is None:
+            return []
+        if self.shade is None:
+            self.shade = np.full((self.height, self.width), HIDDEN, dtype=np.int8)
+            self._chunks.clear()  # Baked without fog; redo on next draw
+        previous, self._fog_bounds = self._fog_bounds, bounds
+        if previous and fov.recomputes == self._fog_recomputes + 1:
+            bounds = (min(bounds[0], previous[0]), min(bounds[1], previous[1]),
+                      max(bounds[2], previous[2]), max(bounds[3], previous[3]))
+        else:
+            bounds = (0, 0, self.width, self.height)
+        self._fog_recomputes = fov.recomputes
+        x0, y0, x1, y1 = bounds
+
+        shade = np.where(fov.visible[y0:y1, x0:x1], LIT, HIDDEN).astype(np.int8)
+        if explored is not None:
+            seen = explored.as_mask(y0, y1)[:, x0:x1]
+            shade[seen & (shade == HIDDEN)] = DIM
+        changed = [(int(x) + x0, int(y) + y0)
+                   for y, x in np.argwhere(shade != self.shade[y0:y1, x0:x1])]
+        self.shade[y0:y1, x0:x1] = shade
+        if changed:
+            self._shade_version += 1
+        self.refresh_tiles(changed)
+        return changed
+
+    def blit_view(self, screen, camera_x, camera_y):
+        """
+        Draw the part of the world under the camera
+
+        Args:
+            screen: Surface to draw on
+            camera_x: Camera X in world tiles
+            camera_y: Camera Y in world tiles
+        """
+        self.blit_view_px(screen, camera_x * self.tile_size, camera_y * self.tile_size)
+
+    def blit_view_px(self, screen, offset_x, offset_y):
+        """
+        Draw the world scrolled to a pixel offset (smooth scrolling)
+
+        Only chunks overlapping the screen's clip rectangle are touched, each
+        with one blit(area=...). Anything outside the world is filled black.
+
+        Args:
+            screen: Surface to draw on
+            offset_x: World pixel X shown at the screen's left edge
+            offset_y: World pixel Y shown at the screen's top edge
+        """
+        size = self.tile_size
+        chunk_px = self.chunk_tiles * size
+        clip = screen.get_clip()
+        world_rect = pygame.Rect(0, 0, self.width * size, self.height * size)
+        view = clip.move(offset_x, offset_y)
+        if not world_rect.contains(view):
+            screen.fill((0, 0, 0), clip)
+        view = view.clip(world_rect)
+        if view.width == 0 or view.height == 0:
+            return
+
+        for chunk_y in range(view.top // chunk_px, (view.bottom - 1) // chunk_px + 1):
+            for chunk_x in range(view.left // chunk_px, (view.right - 1) // chunk_px + 1):
+                chunk = self._chunk(chunk_x, chunk_y)
+                area = view.clip(chunk.get_rect(topleft=(chunk_x * chunk_px, chunk_y * chunk_px)))
+                dest = (area.x - offset_x, area.y - offset_y)
+                screen.blit(chunk, dest, area.move(-chunk_x * chunk_px, -chunk_y * chunk_px))
+
+    def _chunk(self, chunk_x, chunk_y):
+        """Get a chunk surface, baking it on first use"""
+        chunk = self._chunks.get((chunk_x, chunk_y))
+        if chunk is not None:
+            return chunk
+
+        x0, y0 = chunk_x * self.chunk_tiles, chunk_y * self.chunk_tiles
+        tiles_w = min(self.chunk_tiles, self.width - x0)
+        tiles_h = min(self.chunk_tiles, self.height - y0)
+        chunk = self.atlas.new_surface((tiles_w * self.tile_size, tiles_h * self.tile_size))
+        tiles = [(x, y) for y in range(y0, y0 + tiles_h) for x in range(x0, x0 + tiles_w)]
+        chunk.blits(self._tile_blits((chunk_x, chunk_y), tiles), doreturn=False)
+        self._chunks[(chunk_x, chunk_y)] = chunk
+        self.bakes += 1
+        return chunk
+
+    def _tile_blits(self, chunk_key, tiles, tick=None):
+        """
+        Build the (atlas, position, area) triples that draw tiles into their chunk
+
+        Args:
+            chunk_key: (chunk_x, chunk_y) the tiles belong to
+            tiles: List of (x, y) world coordinates
+            tick: Animation tick to draw (default: the current one)
+
+        Returns:
+            list: Blit sequence for Surface.blits()
+        """
+        size = self.tile_size
+        origin_x = chunk_key[0] * self.chunk_tiles
+        origin_y = chunk_key[1] * self.chunk_tiles
+        atlas = self.atlas.surface
+        rects = self.atlas.rects
+        blit_sequence = []
+        for x, y in tiles:
+            position = ((x - origin_x) * size, (y - origin_y) * size)
+            shade = LIT if self.shade is None else self.shade[y, x]
+            if shade == HIDDEN:
+                blit_sequence.append((atlas, position, rects[self.hidden_id]))
+                continue
+            variant = None if shade == LIT else 'dim'
+
+            tile_id = self._terrain_id(self.world.get((x, y)), variant)
+            cycle = self._cycles.get(tile_id) if shade == LIT else None
+            if cycle:
+                tile_id = cycle[(self.tick if tick is None else tick) % len(cycle)]
+            blit_sequence.append((atlas, position, rects[tile_id]))
+
+            chest = self.chests.get((x, y))
+            if chest:
+                chest_id = self.atlas.id_of('chest_open' if chest['opened'] else 'chest', variant)
+                if chest_id is not None:
+                    blit_sequence.append((atlas, position, rects[chest_id]))
+        return blit_sequence
+
+    def _terrain_id(self, tile, variant):
+        """Tile ID for a terrain object, falling back to grass"""
+        key = (type(tile), variant)
+        tile_id = self._terrain_ids.get(key)
+        if tile_id is None:
+            name = type(tile).__name__.lower() if tile else 'grass'
+            tile_id = self.atlas.id_of(name, variant, self.atlas.id_of('grass', variant))
+            self._terrain_ids[key] = tile_id
+        return tile_id
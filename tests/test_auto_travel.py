@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Test for auto-travel with incremental D* Lite replanning."""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.game_state import GameState
+from engine.collision import CollisionSystem
+from engine.auto_travel import AutoTravel
+from environment.world.world_generator import WorldGenerator
+from assets.terrain import Rock
+
+
+def make_game_state(seed):
+    """Generate a seeded world wired up like engine/game.py does."""
+    random.seed(seed)
+    world_gen = WorldGenerator(width=50, height=38)
+    world, hero = world_gen.generate()
+    game_state = GameState(25, 19)
+    game_state.collision = CollisionSystem(world_gen)
+    game_state.set_world(world, world_gen.width, world_gen.height)
+    game_state.set_hero_position(hero.x, hero.y)
+    for chest_data in world_gen.chests:
+        game_state.add_chest(chest_data['x'], chest_data['y'], chest_data['item'])
+    game_state.collision.set_world(world, game_state.chests)
+    return world_gen, game_state
+
+
+def test_travel_to_chest():
+    """Test that auto-travel walks the hero next to the chest."""
+    print("\n✓ Testing auto-travel to chest:")
+    world_gen, game_state = make_game_state(42)
+    travel = AutoTravel(game_state, game_state.collision)
+
+    assert travel.start(AutoTravel.MODE_CHEST)
+    steps = 0
+    while travel.step():
+        steps += 1
+        assert steps < 500, "Auto-travel did not terminate"
+
+    chest = game_state.chests[0]
+    distance = abs(chest['x'] - game_state.hero_x) + abs(chest['y'] - game_state.hero_y)
+    print(f"  Arrived after {steps} steps, {travel.total_touched} nodes touched")
+    assert distance == 1, "Hero should end next to the chest"
+    assert not travel.active
+
+
+def test_incremental_replan_on_terrain_change():
+    """Test that blocking the route repairs the plan instead of restarting it."""
+    print("\n✓ Testing incremental replanning:")
+    world_gen, game_state = make_game_state(1001)
+    collision = game_state.collision
+    travel = AutoTravel(game_state, collision)
+    assert travel.start(AutoTravel.MODE_CHEST)
+    initial_touched = travel.planner.compute_shortest_path()
+    assert travel.step()
+
+    # Drop a rock on the next tile of the route
+    x, y = travel.planner.next_step()
+    if (x, y) == travel.target:
+        print("  Hero already next to target - nothing to block")
+        return
+    world_gen.terrain[(x, y)] = Rock(x, y)
+    game_state.world[(x, y)] = world_gen.terrain[(x, y)]
+    assert collision.refresh_tile(x, y)
+
+    planner = travel.planner
+    touched_before = planner.touched
+    moved = travel.step()
+    stats = travel.last_step_stats
+    print(f"  Initial plan touched {initial_touched} nodes, repair touched {stats['touched']}")
+    assert stats['replans'] == 1 and not stats['full_plan']
+    assert stats['touched'] == planner.touched - touched_before, "Tile updates count as repair work"
+    if moved:
+        assert (game_state.hero_x, game_state.hero_y) != (x, y)
+
+
+def test_explore_until_everything_seen():
+    """Test that explore mode keeps picking new ground until none is left."""
+    print("\n✓ Testing explore mode:")
+    world_gen, game_state = make_game_state(7)
+    travel = AutoTravel(game_state, game_state.collision)
+
+    travel.start(AutoTravel.MODE_EXPLORE)
+    steps = 0
+    while travel.active:
+        travel.step()
+        steps += 1
+        assert steps < 2000, "Explore did not terminate"
+
+    walkable = game_state.collision.get_walkable_grid()
+    unseen = (walkable & ~travel.seen).sum()
+    print(f"  Explored for {steps} steps, {unseen} walkable tiles left unseen")
+
+
+def test_start_on_chest():
+    """Test that travel leaves a blocked start tile, such as the chest the hero stands on."""
+    print("\n✓ Testing a start on a chest:")
+    for mode in [AutoTravel.MODE_CHEST, AutoTravel.MODE_EXPLORE]:
+        world_gen, game_state = make_game_state(42)
+        chest = game_state.chests[0]
+        game_state.set_hero_position(chest['x'], chest['y'])
+        assert not game_state.collision.get_walkable_grid()[chest['y'], chest['x']]
+        travel = AutoTravel(game_state, game_state.collision)
+
+        assert travel.start(mode)
+        assert travel.step(), f"{mode}: the first step leaves the chest"
+        assert (game_state.hero_x, game_state.hero_y) != (chest['x'], chest['y'])
+        steps = 1
+        while travel.step():
+            steps += 1
+            assert steps < 500, "Auto-travel did not terminate"
+        print(f"  {mode}: {steps} steps, ended at {(game_state.hero_x, game_state.hero_y)}")
+
+
+def test_steps_only_check_the_target():
+    """Test that steps check the target tile instead of rebuilding whole-map masks."""
+    print("\n✓ Testing per-step target checks:")
+    world_gen, game_state = make_game_state(42)
+    travel = AutoTravel(game_state, game_state.collision)
+    assert travel.start(AutoTravel.MODE_CHEST)
+
+    builds = []
+    build_mask = travel._chest_approach_mask
+    travel._chest_approach_mask = lambda walkable: builds.append(1) or build_mask(walkable)
+    steps = 0
+    while travel.step():
+        steps += 1
+    print(f"  {steps} steps, {len(builds)} chest masks built")
+    assert steps > 0 and not builds
+
+    assert travel.start(AutoTravel.MODE_CHEST) and travel._target_still_valid()
+    game_state.chests[0]['opened'] = True
+    assert not travel._target_still_valid(), "Opening the target's chest retires the target"
+
+
+if __name__ == "__main__":
+    test_travel_to_chest()
+    test_start_on_chest()
+    test_steps_only_check_the_target()
+    test_incremental_replan_on_terrain_change()
+    test_explore_until_everything_seen()
+    print("\n✓ All auto-travel tests passed!")
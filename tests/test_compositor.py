@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test for the layer compositor."""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.compositor import Compositor
+from engine.dirty_rects import DirtyRects
+
+TILE = 8
+SIZE = (8 * TILE, 6 * TILE)
+
+
+def make_compositor():
+    """Compositor with a green terrain, a prop, a moving entity and a translucent UI box."""
+    dirty = DirtyRects(*SIZE, TILE)
+    compositor = Compositor(*SIZE, TILE, dirty)
+    state = {'prop': (2, 2), 'entity': (5, 3), 'ui': pygame.Rect(0, 0, 2 * TILE, TILE)}
+    shade = pygame.Surface(state['ui'].size, pygame.SRCALPHA)
+    shade.fill((0, 0, 0, 128))
+
+    compositor.add_layer('entities', lambda s: s.fill((255, 0, 0), (*[c * TILE for c in state['entity']], TILE, TILE)))
+    compositor.add_layer('terrain', lambda s: s.fill((0, 160, 0)), static=True)
+    compositor.add_layer('props', lambda s: s.fill((200, 100, 0), (*[c * TILE for c in state['prop']], TILE, TILE)),
+                         static=True)
+    compositor.add_layer('ui', lambda s: s.blit(shade, state['ui']))
+    return compositor, dirty, state
+
+
+def test_static_layers_are_cached():
+    """Test that moving an entity only copies the cached background."""
+    print("\n✓ Testing static layer caching:")
+    compositor, dirty, state = make_compositor()
+    assert [layer.name for layer in compositor.layers] == ['terrain', 'props', 'entities', 'ui'], "Static layers go first"
+    screen = pygame.Surface(SIZE)
+    compositor.compose(screen)
+    dirty.clear()
+    terrain, props, entities, ui = compositor.layers
+    assert (terrain.draws, props.draws, ui.draws, entities.draws) == (1, 1, 1, 1)
+
+    old = state['entity']
+    state['entity'] = (6, 3)
+    compositor.invalidate_tiles('entities', [old, state['entity']])
+    compositor.compose(screen)
+    dirty.clear()
+    print(f"  draws: terrain {terrain.draws}, entities {entities.draws}")
+    assert terrain.draws == 1 and props.draws == 1, "Background untouched"
+    assert entities.draws == 2, "Both tiles merge into one rect"
+    assert screen.get_at((5 * TILE, 3 * TILE))[:3] == (0, 160, 0)
+    assert screen.get_at((6 * TILE, 3 * TILE))[:3] == (255, 0, 0)
+
+
+def test_invalidated_regions_match_full_redraw():
+    """Test that partial recomposition gives the same pixels as a full one."""
+    print("\n✓ Testing partial recomposition:")
+    compositor, dirty, state = make_compositor()
+    screen = pygame.Surface(SIZE)
+    compositor.compose(screen)
+    dirty.clear()
+
+    state['prop'] = (3, 4)
+    compositor.invalidate_tiles('props', [(2, 2), (3, 4)])
+    state['ui'] = pygame.Rect(TILE, TILE, 3 * TILE, TILE)
+    compositor.invalidate('ui', pygame.Rect(0, 0, 2 * TILE, TILE))
+    compositor.invalidate('ui', state['ui'])
+    compositor.compose(screen)
+    dirty.clear()
+
+    expected = pygame.Surface(SIZE)
+    compositor.invalidate('terrain')
+    compositor.compose(expected)
+    assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+    assert screen.get_at((TILE, TILE))[:3] == (0, 80, 0), "Translucent UI blended exactly once"
+
+
+if __name__ == "__main__":
+    test_static_layers_are_cached()
+    test_invalidated_regions_match_full_redraw()
+    print("\n✓ All compositor tests passed!")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Test for dirty-rectangle tracking."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.dirty_rects import DirtyRects
+
+
+def test_first_frame_is_full_then_idle():
+    """Test that only the first frame draws when nothing changes."""
+    print("\n✓ Testing idle frames are skipped:")
+    pygame.display.init()
+    pygame.display.set_mode((320, 256))
+    dirty = DirtyRects(320, 256, 32)
+
+    assert dirty.full and dirty.pending
+    assert dirty.present() == 1
+    for _ in range(10):
+        assert not dirty.pending
+        assert dirty.present() == 0
+    print(f"  {dirty.frames_presented} presented, {dirty.frames_skipped} skipped")
+    assert dirty.frames_skipped == 10
+    pygame.display.quit()
+
+
+def test_tiles_merge_into_row_runs():
+    """Test that neighbouring dirty tiles are pushed as one rectangle."""
+    print("\n✓ Testing dirty tiles merge into runs:")
+    dirty = DirtyRects(320, 256, 32)
+    dirty.full = False
+    dirty.mark_tiles([(2, 1), (3, 1), (4, 1), (7, 1), (2, 2), (50, 50)])
+
+    rects = dirty.rects()
+    assert rects == [pygame.Rect(64, 32, 96, 32), pygame.Rect(224, 32, 32, 32),
+                     pygame.Rect(64, 64, 32, 32)]
+    print(f"  5 tiles -> {len(rects)} rects")
+
+    assert dirty.rects() is rects, "Rects are reused until something else is marked"
+    dirty.mark_tile(3, 2)
+    assert dirty.rects()[-1] == pygame.Rect(64, 64, 64, 32)
+
+
+def test_rect_marking():
+    """Test marking the tiles under a pixel rectangle."""
+    print("\n✓ Testing rect marking:")
+    dirty = DirtyRects(320, 256, 32)
+    dirty.full = False
+    dirty.mark_rect((40, 40, 30, 10))
+    assert dirty.tiles() == [(1, 1), (2, 1)]
+    dirty.mark_rect((-100, 500, 30, 10))
+    assert dirty.tiles() == [(1, 1), (2, 1)], "Off-screen rects are ignored"
+
+
+def test_many_tiles_fall_back_to_full():
+    """Test that dirtying most of the screen switches to a full redraw."""
+    print("\n✓ Testing full redraw fallback:")
+    dirty = DirtyRects(320, 256, 32)
+    dirty.full = False
+    dirty.mark_rect((0, 0, 320, 160))
+    assert dirty.full
+    assert len(dirty.tiles()) == 80
+
+
+if __name__ == "__main__":
+    test_first_frame_is_full_then_idle()
+    test_tiles_merge_into_row_runs()
+    test_rect_marking()
+    test_many_tiles_fall_back_to_full()
+    print("\n✓ All dirty rect tests passed!")
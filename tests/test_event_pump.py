@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test for idle-mode event collection."""
+import sys
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.event_pump import EventPump
+
+
+def test_idle_wait_returns_posted_events():
+    """Test that an idle wait hands back queued input in order."""
+    print("\n✓ Testing idle wait with input:")
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.get()
+    pump = EventPump(idle_wait_ms=1000)
+
+    for key in (pygame.K_UP, pygame.K_LEFT):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    events = pump.get(idle=True)
+    assert [event.key for event in events] == [pygame.K_UP, pygame.K_LEFT]
+    assert pump.idle and pump.idle_waits == 1 and pump.idle_timeouts == 0
+    pygame.display.quit()
+
+
+def test_idle_wait_times_out():
+    """Test that an idle frame without input returns nothing after the timeout."""
+    print("\n✓ Testing idle timeout:")
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.get()
+    pump = EventPump(idle_wait_ms=1000)
+
+    start = time.perf_counter()
+    assert pump.get(idle=True, timeout=20) == [], "Timer deadline shortens the wait"
+    assert pump.get(idle=True, timeout=-5) == [], "Overdue timer doesn't block forever"
+    elapsed = time.perf_counter() - start
+    print(f"  two waits took {elapsed * 1000:.0f} ms")
+    assert elapsed < 0.5
+    assert pump.idle_timeouts == 2
+
+    assert pump.get(idle=False) == []
+    assert not pump.idle and pump.busy_frames == 1
+    pygame.display.quit()
+
+
+if __name__ == "__main__":
+    test_idle_wait_returns_posted_events()
+    test_idle_wait_times_out()
+    print("\n✓ All event pump tests passed!")
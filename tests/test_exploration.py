@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Test for the explored-tile bitmap and its save format."""
+import sys
+import os
+import json
+import random
+import tempfile
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.exploration import ExploredMap
+from engine.fov import FieldOfView
+from engine.game_state import GameState
+from engine.save_system import SaveSystem
+from environment.world.world_generator import WorldGenerator
+
+
+def test_mark_visible_accumulates():
+    """Test that explored bits only ever get added."""
+    print("\n✓ Testing explored bits accumulate:")
+    explored = ExploredMap(13, 5)
+    first = np.zeros((5, 13), dtype=bool)
+    first[1, 2:11] = True
+    explored.mark_visible(first)
+    second = np.zeros((5, 13), dtype=bool)
+    second[3, 12] = True
+    explored.mark_visible(second, bounds=(12, 3, 13, 4))
+
+    assert np.array_equal(explored.as_mask(), first | second)
+    assert explored.is_explored(12, 3) and explored.is_explored(2, 1)
+    assert not explored.is_explored(0, 0) and not explored.is_explored(13, 0)
+    assert explored.explored_count() == 10
+
+    version = explored.version
+    explored.mark_visible(first)
+    assert explored.version == version, "Re-marking seen tiles is not a change"
+    print(f"  {explored.explored_count()} tiles explored in {explored.nbytes()} bytes")
+
+
+def test_save_round_trip():
+    """Test that the compressed save restores the same bits."""
+    print("\n✓ Testing exploration save round trip:")
+    rng = np.random.default_rng(3)
+    explored = ExploredMap(50, 38)
+    explored.mark_visible(rng.random((38, 50)) < 0.4)
+
+    data = json.loads(json.dumps(explored.to_save()))
+    restored = ExploredMap.from_save(data)
+    assert np.array_equal(restored.as_mask(), explored.as_mask())
+
+    data['bits'] = data['bits'][:-8]
+    assert ExploredMap.from_save(data) is None, "Corrupt data should be rejected"
+    assert ExploredMap.from_save(None) is None
+
+
+def test_large_map_stays_small():
+    """Test that a 1000x1000 map fits in a few kilobytes when saved."""
+    print("\n✓ Testing large map footprint:")
+    explored = ExploredMap(1000, 1000)
+    visible = np.zeros((1000, 1000), dtype=bool)
+    visible[100:400, 200:700] = True
+    explored.mark_visible(visible)
+
+    saved = len(explored.to_save()['bits'])
+    print(f"  In memory: {explored.nbytes()} bytes, saved: {saved} bytes")
+    assert explored.nbytes() == 125000
+    assert saved < 4096
+
+
+def test_game_state_remembers_seen_tiles():
+    """Test that tiles stay explored after the hero walks away and are saved."""
+    print("\n✓ Testing GameState exploration wiring:")
+    random.seed(42)
+    world_gen = WorldGenerator(width=50, height=38)
+    world, hero = world_gen.generate()
+    game_state = GameState(25, 19)
+    game_state.fov = FieldOfView()
+    game_state.set_world(world, world_gen.width, world_gen.height)
+    game_state.set_hero_position(hero.x, hero.y)
+
+    seen_at_start = game_state.explored.as_mask()
+    assert seen_at_start.sum() == game_state.fov.visible.sum()
+    for _ in range(10):
+        for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+            game_state.move_hero(dx, dy)
+    mask = game_state.explored.as_mask()
+    assert (mask | seen_at_start).sum() == mask.sum(), "Explored tiles were forgotten"
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        save_system = SaveSystem(save_dir)
+        save_system.save_game({'hero': hero, 'explored': game_state.explored}, "test")
+        data = save_system.load_game("test")
+    restored = ExploredMap.from_save(data['explored'])
+    assert np.array_equal(restored.as_mask(), mask)
+    print(f"  {mask.sum()} tiles explored and restored")
+
+
+if __name__ == "__main__":
+    test_mark_visible_accumulates()
+    test_save_round_trip()
+    test_large_map_stays_small()
+    test_game_state_remembers_seen_tiles()
+    print("\n✓ All exploration tests passed!")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test for the flow field (Dijkstra map) system."""
+import sys
+import os
+import random
+from collections import deque
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from environment.world.world_generator import WorldGenerator
+from engine.collision import CollisionSystem
+from engine.flow_field import FlowField
+
+
+def bfs_distances(collision, start_x, start_y):
+    """Reference BFS distances from a tile over the collision system."""
+    distances = {(start_x, start_y): 0}
+    queue = deque([(start_x, start_y)])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) not in distances and not collision.is_blocked(nx, ny):
+                distances[(nx, ny)] = distances[(x, y)] + 1
+                queue.append((nx, ny))
+    return distances
+
+
+def make_world(seed):
+    """Generate a seeded world with a synced collision system."""
+    random.seed(seed)
+    world_gen = WorldGenerator(width=60, height=50)
+    terrain, hero = world_gen.generate()
+    collision = CollisionSystem(world_gen)
+    collision.set_world(terrain, world_gen.chests)
+    return world_gen, collision, hero
+
+
+def test_flow_field_matches_bfs():
+    """Test that field distances match a reference BFS."""
+    print("\n✓ Testing flow field distances:")
+    world_gen, collision, hero = make_world(42)
+    field = FlowField(collision)
+    field.update(hero.x, hero.y)
+
+    expected = bfs_distances(collision, hero.x, hero.y)
+    for y in range(world_gen.height):
+        for x in range(world_gen.width):
+            assert field.distance_at(x, y) == expected.get((x, y)), f"Mismatch at ({x}, {y})"
+    print(f"  {len(expected)} reachable tiles match BFS")
+
+
+def test_next_step_walks_to_target():
+    """Test that following next_step from any tile reaches the target."""
+    print("\n✓ Testing actors following the field:")
+    world_gen, collision, hero = make_world(1001)
+    field = FlowField(collision)
+    field.update(hero.x, hero.y)
+
+    followed = 0
+    for y in range(0, world_gen.height, 7):
+        for x in range(0, world_gen.width, 7):
+            distance = field.distance_at(x, y)
+            if distance is None:
+                continue
+            for _ in range(distance):
+                dx, dy = field.next_step(x, y)
+                x, y = x + dx, y + dy
+                assert not collision.is_blocked(x, y) or (x, y) == (hero.x, hero.y)
+            assert (x, y) == (hero.x, hero.y), "Actor did not reach the target"
+            followed += 1
+    print(f"  {followed} actors reached the hero")
+
+
+def test_field_rebuilds_only_on_change():
+    """Test that the field is recomputed only when needed."""
+    print("\n✓ Testing flow field invalidation:")
+    world_gen, collision, hero = make_world(7)
+    field = FlowField(collision)
+
+    assert field.update(hero.x, hero.y), "First update should build the field"
+    assert not field.update(hero.x, hero.y), "Unchanged target should reuse the field"
+
+    chest = world_gen.chests[0]
+    assert field.distance_at(chest['x'], chest['y']) is None, "Closed chest blocks the field"
+    chest['opened'] = True
+    collision.refresh_tile(chest['x'], chest['y'])
+    assert field.update(hero.x, hero.y), "Walkability change should rebuild the field"
+    assert field.distance_at(chest['x'], chest['y']) is not None
+
+    neighbor = next((hero.x + dx, hero.y + dy) for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]
+                    if not collision.is_blocked(hero.x + dx, hero.y + dy))
+    assert field.update(*neighbor), "Target move should rebuild the field"
+    print(f"  {field.rebuilds} rebuilds for 4 updates")
+    assert field.rebuilds == 3
+
+
+if __name__ == "__main__":
+    test_flow_field_matches_bfs()
+    test_next_step_walks_to_target()
+    test_field_rebuilds_only_on_change()
+    print("\n✓ All flow field tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Test for the field-of-view engine."""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.fov import FieldOfView
+from engine.game_state import GameState
+from environment.world.world_generator import WorldGenerator
+from assets.terrain import Grass, Tree
+
+
+def open_world(width, height):
+    """Build an all-grass world dictionary."""
+    return {(x, y): Grass(x, y) for y in range(height) for x in range(width)}
+
+
+def test_trees_block_sight():
+    """Test that a wall of trees hides what is behind it."""
+    print("\n✓ Testing tree line blocks sight:")
+    world = open_world(30, 20)
+    for y in range(20):
+        world[(20, y)] = Tree(20, y)
+
+    fov = FieldOfView(radius=0)
+    fov.set_world(world, 30, 20)
+    fov.update(10, 10)
+    assert fov.is_visible(10, 10) and fov.is_visible(19, 10)
+    assert fov.is_visible(20, 10), "The trees themselves are visible"
+    assert not fov.is_visible(21, 10), "Tiles behind the tree line are hidden"
+    print(f"  {fov.visible.sum()} tiles visible")
+
+
+def test_recompute_only_when_needed():
+    """Test that visibility is recomputed only on movement or sight changes."""
+    print("\n✓ Testing FOV invalidation:")
+    world = open_world(30, 20)
+    fov = FieldOfView(radius=8)
+    fov.set_world(world, 30, 20)
+
+    assert fov.update(5, 5)
+    assert not fov.update(5, 5), "Same position should reuse the mask"
+
+    # Grass for grass changes nothing
+    world[(7, 5)] = Grass(7, 5)
+    assert not fov.refresh_tile(7, 5, world[(7, 5)])
+    assert not fov.update(5, 5)
+
+    world[(7, 5)] = Tree(7, 5)
+    assert fov.refresh_tile(7, 5, world[(7, 5)])
+    assert fov.update(5, 5), "Sight-blocking change should recompute"
+    assert not fov.is_visible(9, 5)
+
+    assert fov.update(5, 6), "Moving should recompute"
+    print(f"  {fov.recomputes} recomputes")
+    assert fov.recomputes == 3
+
+
+def test_game_state_keeps_fov_in_sync():
+    """Test that GameState updates the FOV when the hero moves."""
+    print("\n✓ Testing GameState FOV wiring:")
+    random.seed(42)
+    world_gen = WorldGenerator(width=50, height=38)
+    world, hero = world_gen.generate()
+    game_state = GameState(25, 19)
+    game_state.fov = FieldOfView()
+    game_state.set_world(world, world_gen.width, world_gen.height)
+    game_state.set_hero_position(hero.x, hero.y)
+
+    assert game_state.fov.origin == (hero.x, hero.y)
+    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+        if game_state.move_hero(dx, dy):
+            break
+    assert game_state.fov.origin == (game_state.hero_x, game_state.hero_y)
+    print(f"  FOV follows hero to {game_state.fov.origin}")
+
+
+if __name__ == "__main__":
+    test_trees_block_sight()
+    test_recompute_only_when_needed()
+    test_game_state_keeps_fov_in_sync()
+    print("\n✓ All field of view tests passed!")
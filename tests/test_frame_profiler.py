@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test for per-phase frame timing and the F3 HUD."""
+import sys
+import os
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.frame_profiler import FrameProfiler, FrameHUD, PHASES, PHASE_COLORS
+
+
+def test_laps_are_charged_to_phases():
+    """Test that laps split the frame and slow frames count as dropped."""
+    print("\n✓ Testing phase laps:")
+    profiler = FrameProfiler(history=4, budget_ms=5)
+    profiler.lap('input')  # Outside a frame: ignored
+    assert profiler.frames == 0
+
+    for sleep_ms in (0, 8, 0, 0, 0):
+        profiler.begin_frame()
+        profiler.lap('input')
+        time.sleep(sleep_ms / 1000)
+        profiler.lap('autosave')
+        profiler.lap('world')
+        profiler.lap('world')
+        profiler.end_frame()
+
+    recent = profiler.recent()
+    print(f"  autosave ms per frame: {recent[:, PHASES.index('autosave')].round(2).tolist()}")
+    assert recent.shape == (4, len(PHASES)), "History keeps the last frames only"
+    assert recent[0, PHASES.index('autosave')] >= 7, "Oldest kept frame is the slow one"
+    assert profiler.dropped == 1
+    assert profiler.averages()['autosave'] >= 1.75
+    assert profiler.fps() > 0
+
+
+def test_hud_draws_graph():
+    """Test that the HUD graphs the history inside its rect."""
+    print("\n✓ Testing HUD drawing:")
+    pygame.init()
+    screen = pygame.display.set_mode((320, 240))
+    profiler = FrameProfiler(budget_ms=10)
+    profiler.begin_frame()
+    profiler.end_frame()
+    profiler.phase_ms[0, PHASES.index('world')] = 5  # Half a budget of world time
+
+    hud = FrameHUD(position=(0, 0))
+    screen.fill((1, 2, 3))
+    hud.draw(screen, profiler)
+    assert screen.get_at((hud.rect.right + 1, 0))[:3] == (1, 2, 3), "Nothing drawn outside the rect"
+
+    graph_x = 4 + len(profiler.phase_ms) - 1
+    graph_bottom = 4 + hud.line_height + 2 + hud.graph_height - 1
+    assert screen.get_at((graph_x, graph_bottom))[:3] == PHASE_COLORS['world']
+    assert screen.get_at((graph_x, graph_bottom - hud.graph_height // 2 - 1))[:3] == (0, 0, 0)
+    pygame.quit()
+
+
+def test_f3_toggles_hud():
+    """Test that F3 shows the HUD and keeps the loop awake."""
+    print("\n✓ Testing F3 toggle:")
+    from engine.game import Game
+
+    game = Game(headless=True)
+    try:
+        game.step([], 0)
+        assert game.is_idle() and game.profiler.frames == 1
+
+        game.step([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)], 17)
+        assert game.input_handler.hud_open and not game.is_idle()
+        game.step([], 33)
+        print(f"  {game.profiler.frames} frames, averages {game.profiler.averages()}")
+        assert game.profiler.averages()['hud'] > 0
+
+        game.step([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)], 50)
+        assert not game.input_handler.hud_open
+        game.step([], 67)
+        assert game.is_idle()
+    finally:
+        pygame.quit()
+
+
+def test_idle_waits_are_not_timed():
+    """Test that the NES loop starts timing a frame after its idle wait."""
+    print("\n✓ Testing idle waits:")
+    from engine.game_nes import Game
+
+    game = Game()
+    passes = []
+
+    def slow_get(idle, timeout_ms=None):
+        passes.append(idle)
+        time.sleep(0.05)  # An idle sleep far beyond the frame budget
+        return [pygame.event.Event(pygame.QUIT)] if len(passes) == 4 else []
+    game.events.get = slow_get
+    game.run()
+
+    print(f"  {game.profiler.frames} frames, {game.profiler.dropped} dropped, "
+          f"input {game.profiler.averages()['input']:.2f} ms")
+    assert game.profiler.frames == 4
+    assert game.profiler.dropped == 0
+    assert game.profiler.averages()['input'] < 25
+
+
+if __name__ == "__main__":
+    test_laps_are_charged_to_phases()
+    test_hud_draws_graph()
+    test_f3_toggles_hud()
+    test_idle_waits_are_not_timed()
+    print("\n✓ All frame profiler tests passed!")
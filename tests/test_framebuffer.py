@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test for the low-resolution framebuffer and its integer upscale."""
+import sys
+import os
+import random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.framebuffer import Framebuffer
+
+
+def test_integer_scale_and_letterbox():
+    """Test that the largest whole-number scale is centred in the window."""
+    print("\n✓ Testing scale fit:")
+    pygame.display.init()
+    window = pygame.display.set_mode((1000, 700))
+    fb = Framebuffer(200, 152, window)
+    print(f"  scale {fb.scale}, dest {fb.dest}")
+    assert fb.scale == 4 and fb.dest == pygame.Rect(100, 46, 800, 608)
+
+    assert fb.to_window(pygame.Rect(8, 8, 8, 8)) == pygame.Rect(132, 78, 32, 32)
+    assert fb.to_native((133, 79, 30, 30)) == pygame.Rect(8, 8, 8, 8), "Rounded outward"
+    assert fb.to_native((0, 0, 50, 50)).size == (0, 0), "Letterbox maps to nothing"
+
+    fb.resize(pygame.display.set_mode((300, 200)))
+    assert fb.scale == 1
+    pygame.display.quit()
+
+
+def test_partial_upscale_matches_full():
+    """Test that upscaling dirty rects gives the same window as a full upscale."""
+    print("\n✓ Testing partial upscale:")
+    pygame.display.init()
+    window = pygame.display.set_mode((400, 304))
+    fb = Framebuffer(200, 152, window)
+    random.seed(7)
+    for _ in range(50):
+        fb.surface.fill([random.randrange(256) for _ in range(3)],
+                        (random.randrange(200), random.randrange(152), 9, 9))
+    fb.upscale()
+
+    fb.surface.fill((255, 0, 0), (16, 16, 8, 8))
+    fb.upscale([pygame.Rect(16, 16, 8, 8)])
+    assert window.get_at((33, 33))[:3] == (255, 0, 0)
+    expected = pygame.transform.scale(fb.surface, (400, 304))
+    assert pygame.image.tobytes(expected, 'RGB') == pygame.image.tobytes(window, 'RGB')
+    pygame.display.quit()
+
+
+def test_low_res_game_frame():
+    """Test that an 8px game shows its native view scaled x4."""
+    print("\n✓ Testing low-resolution game:")
+    from engine.game import Game
+
+    random.seed(42)
+    game = Game(headless=True, tile_size=8)
+    try:
+        assert game.screen.get_size() == (200, 152) and game.framebuffer.scale == 4
+        for i, key in enumerate([pygame.K_RIGHT, None, pygame.K_DOWN, None]):
+            events = [pygame.event.Event(pygame.KEYDOWN, key=key)] if key else []
+            for frame in range(10):
+                game.step(events if frame == 0 else [], i * 200 + frame * 17)
+
+        reference = pygame.Surface(game.screen.get_size())
+        game.renderer.render_view(reference, game.game_state)
+        expected = pygame.transform.scale(reference, (800, 608))
+        assert pygame.image.tobytes(expected, 'RGB') == pygame.image.tobytes(game.window, 'RGB')
+    finally:
+        pygame.quit()
+
+
+def test_menu_leaves_no_letterbox_residue():
+    """Test that closing the menu after a resize leaves the letterbox black."""
+    print("\n✓ Testing letterbox after the menu:")
+    import numpy as np
+    from engine.game import Game
+
+    random.seed(42)
+    game = Game(headless=True, tile_size=16)
+    try:
+        pygame.display.set_mode((1000, 700), pygame.RESIZABLE)
+        now = 0
+        for event in [pygame.event.Event(pygame.VIDEORESIZE, size=(1000, 700), w=1000, h=700),
+                      pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB),
+                      pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB)]:
+            for frame in range(50):
+                now += 17
+                game.step([event] if frame == 0 else [], now)
+            shown = pygame.image.tobytes(game.window, 'RGB')
+            game.dirty.mark_all()
+            game.render(now)
+            assert shown == pygame.image.tobytes(game.window, 'RGB'), "Frames match a full redraw"
+
+        pixels = pygame.surfarray.array3d(game.window).any(axis=2)
+        dest = game.framebuffer.dest
+        pixels[dest.left:dest.right, dest.top:dest.bottom] = False
+        print(f"  {int(np.count_nonzero(pixels))} lit letterbox pixels around {dest}")
+        assert dest.size != game.window.get_size()
+        assert not pixels.any(), "The menu overlay stayed in the letterbox"
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    test_integer_scale_and_letterbox()
+    test_partial_upscale_matches_full()
+    test_low_res_game_frame()
+    test_menu_leaves_no_letterbox_residue()
+    print("\n✓ All framebuffer tests passed!")
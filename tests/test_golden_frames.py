@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test rendered frames against stored golden hashes, headless.
+
+After an intended visual change, refresh the goldens with
+python benchmarks/bench_headless.py --update (once per FOV backend).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.headless import run_all, load_goldens, compare_goldens
+from engine.grid_backend import TCOD_AVAILABLE
+
+
+def check_backend(backend):
+    """Play every scenario with one FOV backend and compare with its goldens"""
+    results = run_all(backend)
+    for name, result in results.items():
+        print(f"  {backend} {name}: {result['frames']} frames at {result['fps']:.0f} fps")
+    mismatches = compare_goldens(results, load_goldens())
+    assert not mismatches, f"Frames differ from goldens (scenario, step): {mismatches}"
+
+
+def test_golden_frames_python_backend():
+    """Test scenarios rendered with pure-Python sight."""
+    print("\n✓ Testing golden frames (python FOV):")
+    check_backend('python')
+
+
+def test_golden_frames_tcod_backend():
+    """Test scenarios rendered with tcod sight, when tcod is installed."""
+    print("\n✓ Testing golden frames (tcod FOV):")
+    if not TCOD_AVAILABLE:
+        print("  tcod not installed, skipped")
+        return
+    check_backend('tcod')
+
+
+if __name__ == "__main__":
+    test_golden_frames_python_backend()
+    test_golden_frames_tcod_backend()
+    print("\n✓ All golden frame tests passed!")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test for the Python and tcod grid backends."""
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.grid_backend import get_backend, TCOD_AVAILABLE, PythonGridBackend
+
+
+def random_grid(seed, open_ratio):
+    """Build a reproducible random grid indexed [y, x]."""
+    rng = np.random.default_rng(seed)
+    grid = rng.random((40, 60)) < open_ratio
+    grid[20, 30] = True
+    return grid
+
+
+def test_default_backend_selection():
+    """Test that tcod is preferred only when importable."""
+    backend = get_backend()
+    expected = "tcod" if TCOD_AVAILABLE else "python"
+    print(f"\n✓ Default backend: {backend.name}")
+    assert backend.name == expected
+    assert isinstance(get_backend("python"), PythonGridBackend)
+
+
+def test_python_fov():
+    """Test basic shadowcasting properties."""
+    print("\n✓ Testing Python FOV:")
+    backend = get_backend("python")
+
+    open_field = np.ones((21, 21), dtype=bool)
+    visible = backend.compute_fov(open_field, 10, 10, radius=5)
+    assert visible[10, 10] and visible[10, 15] and visible[5, 10]
+    assert not visible[10, 16], "Tiles past the radius must not be visible"
+    assert not visible[4, 4], "Corners past the radius must not be visible"
+
+    walled = open_field.copy()
+    walled[:, 12] = False
+    visible = backend.compute_fov(walled, 10, 10)
+    assert visible[10, 12], "Walls themselves are lit"
+    assert not visible[10, 13:].any(), "Nothing behind a full wall is visible"
+    print(f"  {visible.sum()} tiles visible behind a wall")
+
+
+def test_backends_agree():
+    """Test that tcod and Python give matching results when both exist."""
+    if not TCOD_AVAILABLE:
+        print("\n  tcod not installed - skipping backend comparison")
+        return
+    print("\n✓ Comparing Python and tcod backends:")
+    python_backend = get_backend("python")
+    tcod_backend = get_backend("tcod")
+
+    for seed in range(10):
+        walkable = random_grid(seed, 0.7)
+        goal = tuple(np.argwhere(walkable)[-1][::-1])
+        a = python_backend.find_path(walkable, (30, 20), goal)
+        b = tcod_backend.find_path(walkable, (30, 20), goal)
+        assert a.length == b.length, f"Seed {seed}: path lengths differ"
+
+        transparent = random_grid(seed, 0.85)
+        a = python_backend.compute_fov(transparent, 30, 20, radius=8)
+        b = tcod_backend.compute_fov(transparent, 30, 20, radius=8)
+        agreement = (a == b).mean()
+        assert agreement > 0.98, f"Seed {seed}: FOV agreement only {agreement:.3f}"
+    print("  Paths and FOV match on 10 seeds")
+
+    for shape in [(1, 9), (9, 1)]:
+        walkable = np.ones(shape, dtype=bool)
+        end = (shape[1] - 1, shape[0] - 1)
+        for grid in [walkable, np.where(np.arange(9).reshape(shape) == 4, False, walkable)]:
+            a = python_backend.find_path(grid, (0, 0), end)
+            b = tcod_backend.find_path(grid, (0, 0), end)
+            assert a.path == b.path, f"One-tile-wide grid {shape}: paths differ"
+            a = python_backend.compute_fov(grid, 0, 0)
+            b = tcod_backend.compute_fov(grid, 0, 0)
+            assert (a == b).all(), f"One-tile-wide grid {shape}: FOV differs"
+    print("  One-tile-wide grids match")
+
+
+if __name__ == "__main__":
+    test_default_backend_selection()
+    test_python_fov()
+    test_backends_agree()
+    print("\n✓ All grid backend tests passed!")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test for hierarchical (cluster-based) pathfinding."""
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from environment.world.world_generator import WorldGenerator
+from assets.terrain import Rock
+from engine.collision import CollisionSystem
+from engine.pathfinding import astar, NEIGHBORS
+from engine.hierarchical_path import HierarchicalPathfinder
+
+
+def make_world(seed, width=120, height=90):
+    """Generate a seeded world with a synced collision system."""
+    random.seed(seed)
+    world_gen = WorldGenerator(width=width, height=height)
+    terrain, hero = world_gen.generate()
+    collision = CollisionSystem(world_gen)
+    collision.set_world(terrain, world_gen.chests)
+    return world_gen, collision, hero
+
+
+def walkable_tiles(collision, rng, count):
+    """Pick random walkable tiles."""
+    grid = collision.get_walkable_grid()
+    tiles = []
+    while len(tiles) < count:
+        x = rng.randrange(grid.shape[1])
+        y = rng.randrange(grid.shape[0])
+        if grid[y, x]:
+            tiles.append((x, y))
+    return tiles
+
+
+def assert_valid_path(collision, path, start, goal):
+    """Check a path is contiguous and only crosses walkable tiles."""
+    assert path[0] == start and path[-1] == goal
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        assert abs(ax - bx) + abs(ay - by) == 1, "Path is not contiguous"
+        assert not collision.is_blocked(bx, by), f"Path crosses blocked tile ({bx}, {by})"
+
+
+def test_hierarchical_matches_astar():
+    """Test that HPA* finds near-optimal paths wherever A* does."""
+    print("\n✓ Testing hierarchical paths against A*:")
+    world_gen, collision, hero = make_world(1234)
+    hpa = HierarchicalPathfinder(collision, cluster_size=10)
+    grid = collision.get_walkable_grid()
+    rng = random.Random(99)
+
+    total_optimal = 0
+    total_hpa = 0
+    for goal in walkable_tiles(collision, rng, 40):
+        start = (hero.x, hero.y)
+        optimal = astar(grid, start, goal)
+        result = hpa.find_path(start, goal)
+        assert result.found == optimal.found, f"Reachability mismatch for {goal}"
+        if not optimal.found:
+            continue
+        assert_valid_path(collision, result.path, start, goal)
+        total_optimal += optimal.length
+        total_hpa += result.length
+
+    ratio = total_hpa / total_optimal
+    print(f"  Path length ratio vs optimal: {ratio:.3f}")
+    assert ratio < 1.15, "Hierarchical paths are too far from optimal"
+
+
+def test_incremental_rebuild_matches_full():
+    """Test that terrain changes only rebuild nearby clusters, with the same result."""
+    print("\n✓ Testing incremental cluster rebuilds:")
+    world_gen, collision, hero = make_world(4321)
+    hpa = HierarchicalPathfinder(collision, cluster_size=10)
+    full = hpa.sync()
+    print(f"  Initial build: {full} clusters")
+
+    rng = random.Random(5)
+    for x, y in walkable_tiles(collision, rng, 6):
+        if (x, y) == (hero.x, hero.y):
+            continue
+        world_gen.terrain[(x, y)] = Rock(x, y)
+        collision.refresh_tile(x, y)
+
+    rebuilt = hpa.sync()
+    print(f"  After 6 terrain changes: {rebuilt} clusters rebuilt")
+    assert 0 < rebuilt < full
+
+    fresh = HierarchicalPathfinder(collision, cluster_size=10)
+    fresh.sync()
+    assert hpa._borders == fresh._borders, "Incremental entrances differ from full rebuild"
+    assert hpa._intra == fresh._intra, "Incremental cluster edges differ from full rebuild"
+    assert hpa.sync() == 0, "No changes should mean no rebuild"
+
+
+def test_blocked_start_leaves_its_cluster():
+    """Test that a blocked start (e.g. a chest) on a cluster edge finds paths A* finds."""
+    print("\n✓ Testing blocked starts on cluster edges:")
+    world_gen, collision, hero = make_world(1234)
+    hpa = HierarchicalPathfinder(collision, cluster_size=2)
+    grid = collision.get_walkable_grid()
+    height, width = grid.shape
+    rng = random.Random(7)
+
+    starts = []
+    while len(starts) < 60:
+        x, y = rng.randrange(width), rng.randrange(height)
+        if not grid[y, x] and any(0 <= x + dx < width and 0 <= y + dy < height and grid[y + dy, x + dx]
+                                  for dx, dy in NEIGHBORS):
+            starts.append((x, y))
+
+    found = 0
+    for start, goal in zip(starts, walkable_tiles(collision, rng, len(starts))):
+        optimal = astar(grid, start, goal)
+        result = hpa.find_path(start, goal)
+        assert result.found == optimal.found, f"Reachability mismatch for {start} -> {goal}"
+        if result.found:
+            assert_valid_path(collision, result.path, start, goal)
+            found += 1
+    print(f"  {found}/{len(starts)} blocked starts reached their goal, as with A*")
+
+
+if __name__ == "__main__":
+    test_hierarchical_matches_astar()
+    test_blocked_start_leaves_its_cluster()
+    test_incremental_rebuild_matches_full()
+    print("\n✓ All hierarchical pathfinding tests passed!")
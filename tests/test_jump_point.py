@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test for jump point search against plain A*."""
+import sys
+import os
+import random
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from environment.world.world_generator import WorldGenerator
+from engine.collision import CollisionSystem
+from engine.pathfinding import find_path
+
+
+def test_jps_matches_astar_on_world_seeds():
+    """Test that JPS finds equally short paths while expanding fewer nodes."""
+    print("\n✓ Comparing JPS and A* on generated worlds:")
+    astar_expanded = 0
+    jps_expanded = 0
+    jps_scanned = 0
+
+    for seed in [42, 1001, 1234]:
+        random.seed(seed)
+        world_gen = WorldGenerator(width=80, height=60)
+        terrain, hero = world_gen.generate()
+        collision = CollisionSystem(world_gen)
+        collision.set_world(terrain, world_gen.chests)
+        walkable = collision.get_walkable_grid()
+
+        rng = random.Random(seed)
+        open_tiles = np.argwhere(walkable)
+        for _ in range(15):
+            goal = tuple(int(v) for v in open_tiles[rng.randrange(len(open_tiles))][::-1])
+            start = (hero.x, hero.y)
+            a = find_path(walkable, start, goal, 'astar')
+            b = find_path(walkable, start, goal, 'jps')
+            assert a.length == b.length, f"Seed {seed}: JPS length {b.length} != A* {a.length}"
+            if b.found:
+                assert b.path[0] == start and b.path[-1] == goal
+                for (ax, ay), (bx, by) in zip(b.path, b.path[1:]):
+                    assert abs(ax - bx) + abs(ay - by) == 1
+                    assert walkable[by, bx], "JPS path crosses a blocked tile"
+            astar_expanded += a.expanded
+            jps_expanded += b.expanded
+            jps_scanned += b.scanned
+            assert a.scanned == 0, "A* has no straight-line scans"
+
+    print(f"  A* expanded {astar_expanded}, JPS expanded {jps_expanded} and scanned {jps_scanned}")
+    assert jps_expanded < astar_expanded
+    assert jps_scanned > 0, "JPS reports the tiles its scans step over"
+
+
+def test_row_probes_are_bounded():
+    """Test that sideways probes cost a lookup, not a walk down the row."""
+    walkable = np.ones((40, 400), dtype=bool)
+    walkable[20, 1:] = False  # A wall with a gap at x == 0 forces one turn
+    result = find_path(walkable, (399, 0), (399, 39), 'jps')
+    print(f"\n✓ Wide field: length {result.length}, expanded {result.expanded}, scanned {result.scanned}")
+    assert result.length == 2 * 399 + 39
+    assert result.scanned < 1000, "Each vertical step probes both rows in O(1)"
+
+
+def test_jps_open_field():
+    """Test the best case: a straight run across open ground."""
+    walkable = np.ones((30, 30), dtype=bool)
+    result = find_path(walkable, (0, 0), (29, 29), 'jps')
+    print(f"\n✓ Open field: length {result.length}, expanded {result.expanded}")
+    assert result.length == 58
+    assert result.expanded < 60
+
+
+def test_unknown_strategy():
+    """Test that an unknown strategy is rejected."""
+    try:
+        find_path(np.ones((3, 3), dtype=bool), (0, 0), (2, 2), 'dijkstra')
+    except ValueError:
+        return
+    assert False, "Unknown strategy should raise ValueError"
+
+
+if __name__ == "__main__":
+    test_jps_matches_astar_on_world_seeds()
+    test_jps_open_field()
+    test_row_probes_are_bounded()
+    test_unknown_strategy()
+    print("\n✓ All jump point search tests passed!")
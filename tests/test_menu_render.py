@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test that menus are drawn offscreen once and reused while unchanged."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.menu import MenuSystem, MenuState
+from engine.simple_menu import SimpleMenu
+from environment.items.item import Item, ItemSlot
+
+
+def test_menu_redraws_only_on_change():
+    """Test that MenuSystem redraws on state, selection and inventory changes only."""
+    print("\n✓ Testing menu surface reuse:")
+    pygame.init()
+    screen = pygame.display.set_mode((800, 608))
+    font = pygame.font.Font(None, 36)
+    menu = MenuSystem(800, 608)
+
+    menu.render(screen, font)
+    assert menu.redraws == 0, "Closed menu draws nothing"
+
+    menu.open()
+    for _ in range(10):
+        menu.render(screen, font)
+    assert menu.redraws == 1
+
+    menu._move_selection(1)
+    menu.render(screen, font)
+    assert menu.redraws == 2, "Selection move redraws"
+
+    menu.add_to_inventory(Item("Iron Helmet", ItemSlot.HEAD, {"defense": 5}))
+    menu.render(screen, font)
+    assert menu.redraws == 3, "Inventory change redraws"
+
+    menu._open_options()
+    menu.render(screen, font)
+    menu.invalidate()
+    menu.render(screen, font)
+    print(f"  {menu.redraws} redraws, text cache {menu.text_cache.stats()}")
+    assert menu.redraws == 5
+    pygame.quit()
+
+
+def test_long_menu_covers_overflow():
+    """Test that items spilling past the panel are kept, with per-pixel alpha."""
+    print("\n✓ Testing long menu surface:")
+    pygame.init()
+    screen = pygame.display.set_mode((800, 608))
+    font = pygame.font.Font(None, 36)
+    menu = MenuSystem(800, 608)
+
+    menu.open()
+    menu.render(screen, font)
+    assert menu._surface.get_size() == (400, 350)
+    assert not menu._surface.get_flags() & pygame.SRCALPHA, "Main menu fits and is opaque"
+
+    menu._open_inventory()
+    assert menu.state == MenuState.INVENTORY
+    menu.render(screen, font)
+    width, height = menu._surface.get_size()
+    print(f"  inventory surface {width}x{height} at {menu._surface_pos}")
+    assert height > 350
+    assert menu._surface.get_flags() & pygame.SRCALPHA
+    pygame.quit()
+
+
+def test_simple_menu_layout_reused():
+    """Test that SimpleMenu keeps its label layout until the cursor moves."""
+    print("\n✓ Testing simple menu layout reuse:")
+    pygame.init()
+    screen = pygame.display.set_mode((800, 608))
+    font = pygame.font.Font(None, 36)
+    menu = SimpleMenu(800, 608)
+    game_state = type('State', (), {'inventory': {}})()
+
+    menu.render(screen, font, game_state)
+    layout = menu._text
+    menu.render(screen, font, game_state)
+    assert menu._text is layout
+    menu.move_cursor(1)
+    menu.render(screen, font, game_state)
+    assert menu._text is not layout
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    test_menu_redraws_only_on_change()
+    test_long_menu_covers_overflow()
+    test_simple_menu_layout_reused()
+    print("\n✓ All menu render tests passed!")
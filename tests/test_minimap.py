@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Test for the incrementally patched minimap."""
+import sys
+import os
+import random
+import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.minimap import Minimap, CHEST_COLOR, HERO_COLOR, UNSEEN_COLOR
+
+
+class Grass:
+    pass
+
+
+class River:
+    pass
+
+
+PALETTE = {'grass': (0, 168, 0), 'river': (0, 88, 248)}
+
+
+def make_world(size):
+    """Square world with a river every fifth diagonal"""
+    return {(x, y): River() if (x + y) % 5 == 0 else Grass() for x in range(size) for y in range(size)}
+
+
+def pixels(minimap):
+    """Minimap surface as bytes"""
+    return pygame.image.tobytes(minimap.surface, 'RGB')
+
+
+def test_tiles_become_pixels():
+    """Test that each tile shows its terrain colour once explored."""
+    print("\n✓ Testing palette lookup:")
+    minimap = Minimap(PALETTE, (100, 0), edge=40)
+    minimap.set_world(make_world(10), 10, 10, [{'x': 2, 'y': 3, 'opened': False}])
+    print(f"  {minimap.surface.get_size()} at x{minimap.scale}, frame {minimap.rect}")
+    assert minimap.scale == 4 and minimap.surface.get_size() == (40, 40)
+    assert minimap.rect.topright == (100, 0) and minimap.rect.size == (44, 44)
+    assert minimap.surface.get_at((0, 0))[:3] == UNSEEN_COLOR
+
+    minimap.reveal([(0, 0), (1, 0), (2, 3)])
+    minimap.move_hero(9, 9)
+    assert minimap.surface.get_at((0, 0))[:3] == PALETTE['river']
+    assert minimap.surface.get_at((7, 3))[:3] == PALETTE['grass']
+    assert minimap.surface.get_at((8, 12))[:3] == CHEST_COLOR
+    assert minimap.surface.get_at((39, 39))[:3] == HERO_COLOR, "The hero shows even when unexplored"
+
+
+def test_patches_match_rebuild():
+    """Test that patched pixels equal a full palette rebuild."""
+    print("\n✓ Testing incremental patches:")
+    random.seed(5)
+    chests = [{'x': random.randrange(30), 'y': random.randrange(30), 'opened': False} for _ in range(8)]
+    minimap = Minimap(PALETTE, edge=60)
+    minimap.set_world(make_world(30), 30, 30, chests)
+    for _ in range(200):
+        minimap.reveal([(random.randrange(30), random.randrange(30)) for _ in range(3)])
+        minimap.move_hero(random.randrange(30), random.randrange(30))
+    for chest in chests[:4]:
+        chest['opened'] = True
+    minimap.refresh_tiles([(chest['x'], chest['y']) for chest in chests])
+    print(f"  {minimap.patches} pixels patched, {minimap.rebuilds} rebuild")
+    assert minimap.rebuilds == 1, "Small changes never redraw the whole map"
+
+    patched = pixels(minimap)
+    minimap.rebuild()
+    assert patched == pixels(minimap)
+
+
+def test_large_shell_updates_are_cheap():
+    """Test that a 1000x1000 shell is sampled down and patched per pixel."""
+    print("\n✓ Testing 1000x1000 shell:")
+    minimap = Minimap(PALETTE)
+    minimap.set_world(make_world(1000), 1000, 1000)
+    assert minimap.step == 8 and minimap.surface.get_size() == (125, 125)
+
+    start = time.perf_counter()
+    for i in range(500):
+        minimap.move_hero(i, 500)
+        minimap.reveal([(i, 500 + dy) for dy in range(-8, 9)])
+    update_ms = (time.perf_counter() - start) * 1000 / 500
+    print(f"  {update_ms:.4f} ms per move, {minimap.patches} pixels patched")
+    assert minimap.rebuilds == 1
+    assert update_ms < 1.0
+
+    patched = pixels(minimap)
+    minimap.rebuild()
+    assert patched == pixels(minimap)
+
+
+def test_blocks_show_every_chest_and_seen_tile():
+    """Test that on a sampled-down shell each pixel reflects its whole block."""
+    print("\n✓ Testing block aggregation:")
+    random.seed(9)
+    chests = [{'x': random.randrange(1000), 'y': random.randrange(1000), 'opened': False} for _ in range(64)]
+    minimap = Minimap(PALETTE)
+    minimap.set_world(make_world(1000), 1000, 1000, chests)
+    assert minimap.step == 8
+    off_lattice = [chest for chest in chests if chest['x'] % 8 or chest['y'] % 8]
+
+    minimap.reveal([(chest['x'], chest['y']) for chest in chests])
+    shown = sum(minimap.surface.get_at((chest['x'] // 8, chest['y'] // 8))[:3] == CHEST_COLOR
+                for chest in off_lattice)
+    print(f"  {shown}/{len(off_lattice)} off-lattice chests shown")
+    assert shown == len(off_lattice)
+
+    # One explored tile inside a block lights its whole pixel
+    minimap.reveal([(13, 21)])
+    assert minimap.surface.get_at((1, 2))[:3] != UNSEEN_COLOR
+
+    for chest in chests[::2]:
+        chest['opened'] = True
+    minimap.refresh_tiles([(chest['x'], chest['y']) for chest in chests])
+    patched = pixels(minimap)
+    minimap.rebuild()
+    assert patched == pixels(minimap)
+
+
+def test_game_minimap():
+    """Test that the N minimap follows the hero and survives partial redraws."""
+    print("\n✓ Testing game minimap:")
+    from engine.game import Game
+
+    random.seed(42)
+    game = Game(headless=True)
+    try:
+        now = 0
+        for key in [pygame.K_n, pygame.K_RIGHT, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_x]:
+            for frame in range(20):
+                now += 17
+                game.step([pygame.event.Event(pygame.KEYDOWN, key=key)] if frame == 0 else [], now)
+        minimap = game.minimap
+        hero_x, hero_y = minimap.hero
+        assert (hero_x, hero_y) == (game.game_state.hero_x, game.game_state.hero_y)
+        assert minimap.rebuilds == 1
+        corner = (minimap.rect.x + 2 + hero_x * minimap.scale, minimap.rect.y + 2 + hero_y * minimap.scale)
+        assert game.window.get_at(corner)[:3] == HERO_COLOR
+
+        shown = pygame.image.tobytes(game.window, 'RGB')
+        game.dirty.mark_all()
+        game.render(now)
+        assert shown == pygame.image.tobytes(game.window, 'RGB'), "Dirty frames match a full redraw"
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    test_tiles_become_pixels()
+    test_patches_match_rebuild()
+    test_large_shell_updates_are_cheap()
+    test_blocks_show_every_chest_and_seen_tile()
+    test_game_minimap()
+    print("\n✓ All minimap tests passed!")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test for 8-bit palettized surfaces and palette swaps."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pygame
+
+from engine.palette import IndexedPalette
+from engine.sprite_atlas import SpriteAtlas
+from engine.sprite_factory import new_pixels, pixel_coords, to_surface
+
+FOG_TINT = (90, 90, 120)
+
+
+def make_sprite():
+    """Two-colour checker sprite as RGB pixels"""
+    pixels = new_pixels(8, (0, 168, 0))
+    ys, xs = pixel_coords(pixels)
+    pixels[(xs + ys) % 2 == 1] = (0, 88, 248)
+    return pixels
+
+
+def rgb(surface):
+    """Surface pixels as RGB bytes"""
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def test_indexed_sprites_match_rgb():
+    """Test that palettized sprites and shades show the same colours as RGB ones."""
+    print("\n✓ Testing indexed sprites:")
+    palette = IndexedPalette()
+    pixels = make_sprite()
+    indexed = palette.to_surface(pixels)
+    print(f"  {indexed.get_bitsize()}-bit, {len(palette.base)} colours")
+    assert indexed.get_bitsize() == 8 and len(palette.base) == 3, "Black void plus two colours"
+    assert rgb(indexed) == rgb(to_surface(pixels))
+
+    tinted = to_surface(pixels)
+    tinted.fill(FOG_TINT, special_flags=pygame.BLEND_RGB_MULT)
+    assert rgb(palette.shaded(indexed, FOG_TINT)) == rgb(tinted), "Shade block matches BLEND_RGB_MULT"
+
+
+def test_theme_swaps_recolour_without_redrawing():
+    """Test that a theme recolours sprites, shades and baked copies through the palette."""
+    print("\n✓ Testing palette swaps:")
+    palette = IndexedPalette()
+    atlas = SpriteAtlas.from_sprites({'grass': to_surface(make_sprite())}, 8, palette)
+    atlas.add_tinted('dim', FOG_TINT)
+    chunk = atlas.new_surface((16, 8))
+    atlas.blit(chunk, atlas.id_of('grass'), (0, 0))
+    atlas.blit(chunk, atlas.id_of('grass', 'dim'), (8, 0))
+    base = rgb(chunk)
+
+    palette.set_theme({'swaps': {(0, 168, 0): (224, 232, 248)}, 'tint': (255, 255, 128)})
+    print(f"  themed grass {chunk.get_at((0, 0))[:3]}, dim {chunk.get_at((8, 0))[:3]}")
+    assert chunk.get_at((0, 0))[:3] == (224, 232, 124)
+    assert chunk.get_at((8, 0))[:3] == (79, 82, 59), "Shades follow the theme"
+    assert chunk.get_at((1, 0))[:3] == (0, 88, 124)
+
+    palette.flash((255, 0, 0), 1.0)
+    assert chunk.get_at((0, 0))[:3] == (255, 0, 0)
+    palette.set_theme(None)
+    assert rgb(chunk) == base, "Indices never changed"
+    assert np.array_equal(pygame.surfarray.array2d(atlas.sprite(atlas.id_of('grass'))),
+                          pygame.surfarray.array2d(chunk)[:8])
+
+
+def test_game_shell_themes():
+    """Test that switching shells recolours the NES screen and switching back restores it."""
+    print("\n✓ Testing shell themes:")
+    from engine.game_nes import Game
+
+    game = Game()
+    try:
+        game.render()
+        base = rgb(game.screen)
+        bakes = game.world_layer.bakes
+        game.set_shell(5)
+        game.render()
+        assert rgb(game.screen) != base
+        assert game.world_layer.bakes == bakes, "No chunk was re-baked"
+        game.set_shell(1)
+        game.render()
+        assert rgb(game.screen) == base
+    finally:
+        pygame.quit()
+
+
+def test_game_flash():
+    """Test that a palette flash reaches the NES screen and fades back out."""
+    print("\n✓ Testing screen flash:")
+    from engine.game_nes import Game
+
+    game = Game()
+    try:
+        game.render()
+        base = rgb(game.screen)
+        bakes = game.world_layer.bakes
+        game.flash((248, 0, 0), 0.5)
+        game.render()
+        changed = np.frombuffer(rgb(game.screen), np.uint8) != np.frombuffer(base, np.uint8)
+        print(f"  {changed.mean():.0%} of colour bytes changed")
+        assert changed.mean() > 0.25, "The explored world is tinted, not just the palette"
+        assert game.world_layer.bakes == bakes, "No chunk was re-baked"
+        game.flash((248, 0, 0), 0.0)
+        game.render()
+        assert rgb(game.screen) == base
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    test_indexed_sprites_match_rgb()
+    test_theme_swaps_recolour_without_redrawing()
+    test_game_shell_themes()
+    test_game_flash()
+    print("\n✓ All palette tests passed!")
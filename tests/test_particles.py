@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test for the array particle pool."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pygame
+
+from engine.particles import ParticlePool
+
+
+def test_pool_is_fixed_capacity():
+    """Test that emits beyond capacity are dropped and expired particles are compacted away."""
+    print("\n✓ Testing pool capacity:")
+    pool = ParticlePool(capacity=100, gravity=0, seed=3)
+    assert pool.emit(50, 50, 80, speed=(10, 20), life_ms=(100, 100), color=(255, 0, 0)) == 80
+    assert pool.emit(50, 50, 80, speed=(10, 20), life_ms=(300, 300), color=(0, 0, 255)) == 20
+    print(f"  {pool.count} alive, {pool.dropped} dropped")
+    assert pool.count == 100 and pool.dropped == 60
+
+    pool.update(50)
+    pool.update(50)
+    assert pool.count == 20, "The short-lived burst expired"
+    assert (pool.color[:20] == (0, 0, 255)).all(), "Survivors packed at the front"
+    assert np.allclose(pool.life[:20], 200)
+
+
+def test_vectorized_motion():
+    """Test that particles move by velocity and gravity per update."""
+    print("\n✓ Testing motion:")
+    pool = ParticlePool(capacity=4, gravity=1000, seed=3)
+    pool.emit(0, 0, 1, speed=(100, 100), life_ms=(1000, 1000), color=(255, 255, 255), spread=0, direction=0)
+    pool.update(50)
+    print(f"  position {pool.position[0]}, velocity {pool.velocity[0]}")
+    assert np.allclose(pool.velocity[0], (100, 50))
+    assert np.allclose(pool.position[0], (5, 2.5))
+    pool.update(1000)
+    assert np.allclose(pool.life[0], 900), "Long frames are capped"
+
+
+def test_batched_draw_respects_clip():
+    """Test that drawing writes faded pixels inside the clip only."""
+    print("\n✓ Testing batched draw:")
+    pool = ParticlePool(capacity=4, gravity=0, seed=3)
+    for x in (4, 20):
+        pool.emit(x, 4, 1, speed=(0, 0), life_ms=(200, 200), color=(200, 100, 0))
+    pool.update(50)
+
+    surface = pygame.Surface((32, 16))
+    surface.set_clip((0, 0, 16, 16))
+    pool.draw(surface)
+    assert surface.get_at((4, 4))[:3] == (150, 75, 0), "Faded to 3/4"
+    assert surface.get_at((5, 5))[:3] == (150, 75, 0), "2x2 block"
+    assert surface.get_at((20, 4))[:3] == (0, 0, 0), "Outside the clip"
+    assert pool.bounds() == pygame.Rect(4, 4, 18, 2)
+
+
+def test_chest_burst_honours_option():
+    """Test that opening a chest bursts particles only with Options > Particles on."""
+    print("\n✓ Testing chest burst:")
+    from engine.game_nes import Game
+
+    game = Game()
+    try:
+        for enabled in (False, True):
+            game.menu.options['particles'] = enabled
+            chest = game.treasure[0]
+            chest['opened'] = False
+            game.open_treasure(chest)
+            print(f"  particles {'on' if enabled else 'off'}: {game.particles.count} alive")
+            assert (game.particles.count > 0) == enabled
+
+        game.render()
+        assert game.particle_rect is None
+        game.update_particles(game.last_update + 17)
+        game.render()
+        assert game.particle_rect is not None and not game.is_idle()
+
+        game.menu.options['particles'] = False
+        game.update_particles(game.last_update + 17)
+        assert game.particles.count == 0 and game.particle_rect is None, "Switching off clears them"
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    test_pool_is_fixed_capacity()
+    test_vectorized_motion()
+    test_batched_draw_respects_clip()
+    test_chest_burst_honours_option()
+    print("\n✓ All particle tests passed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test that steady-state frames stay within an allocation budget.
+
+tracemalloc only sees the Python heap, so this catches per-frame Surfaces,
+Rects, lists and strings created by render code - not SDL pixel buffers.
+"""
+import sys
+import os
+import gc
+import tracemalloc
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+FRAMES = 300
+WARMUP = 60
+MAX_RETAINED_PER_FRAME = 32   # Bytes still held after each frame, on average
+MAX_FRAME_PEAK = 8 * 1024     # Bytes allocated at once inside the worst frame
+
+
+def measure(step, frames=FRAMES, warmup=WARMUP):
+    """
+    Run frames under tracemalloc after a warm-up
+
+    Args:
+        step: Callable that runs one frame
+        frames: Frames to measure
+        warmup: Frames run first so caches are filled
+
+    Returns:
+        tuple: (retained bytes per frame, worst single-frame peak in bytes)
+    """
+    for _ in range(warmup):
+        step()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        worst = 0
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            step()
+            _, peak = tracemalloc.get_traced_memory()
+            worst = max(worst, peak - before)
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (end - start) / frames, worst
+
+
+def check_budget(name, step):
+    """Measure a frame loop and assert it stays within budget"""
+    retained, peak = measure(step)
+    print(f"  {name}: {retained:.1f} B/frame retained, {peak} B worst frame")
+    assert retained <= MAX_RETAINED_PER_FRAME, f"{name} keeps {retained:.1f} B per frame"
+    assert peak <= MAX_FRAME_PEAK, f"{name} allocates {peak} B in one frame"
+
+
+def test_nes_frames_within_budget():
+    """Test idle, message and menu frames in the NES engine."""
+    print("\n✓ Testing NES engine frame allocations:")
+    from engine.game_nes import Game
+
+    game = Game()
+
+    def idle():
+        game.update()
+        game.render()
+    check_budget("idle", idle)
+
+    game.show_message("Found: Iron Sword!")
+    game.message_timer = FRAMES * 10
+
+    def message():
+        game.update()
+        game.dirty.mark_rect(game.message_box)
+        game.render()
+    check_budget("message", message)
+
+    game.menu.open()
+
+    def menu():
+        game.dirty.mark_all()
+        game.render()
+    check_budget("menu", menu)
+    pygame.quit()
+
+
+def test_simple_engine_frames_within_budget():
+    """Test idle and menu frames in the simplified engine."""
+    print("\n✓ Testing simplified engine frame allocations:")
+    from engine.game import Game
+
+    game = Game()
+    check_budget("idle", game.render)
+
+    game.input_handler.menu_open = True
+
+    def menu():
+        game.dirty.mark_all()
+        game.render()
+    check_budget("menu", menu)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    test_nes_frames_within_budget()
+    test_simple_engine_frames_within_budget()
+    print("\n✓ All render allocation tests passed!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Test for the reusable overlay and panel cache."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.render_cache import RenderCache
+
+
+def test_surfaces_are_reused():
+    """Test that the same look returns the same surface."""
+    print("\n✓ Testing cache reuse:")
+    cache = RenderCache()
+    overlay = cache.overlay((64, 32), (20, 20, 20), 200)
+    assert cache.overlay((64, 32), [20, 20, 20], 200) is overlay
+    assert overlay.get_alpha() == 200
+    assert cache.overlay((64, 32), (20, 20, 20)) is not overlay, "Alpha is part of the key"
+    print(f"  {cache.hits} hits, {cache.misses} misses")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.clear()
+    assert cache.overlay((64, 32), (20, 20, 20), 200) is not overlay
+    assert cache.misses == 3
+
+
+def test_panel_matches_drawn_rects():
+    """Test that a cached panel looks like filling and outlining a rect."""
+    print("\n✓ Testing panel pixels:")
+    cache = RenderCache()
+    panel = cache.panel((40, 20), (0, 0, 0), (255, 255, 255), 2)
+
+    expected = pygame.Surface((40, 20))
+    pygame.draw.rect(expected, (0, 0, 0), expected.get_rect())
+    pygame.draw.rect(expected, (255, 255, 255), expected.get_rect(), 2)
+    assert pygame.image.tobytes(panel, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+    assert panel.get_at((1, 1))[:3] == (255, 255, 255)
+    assert panel.get_at((2, 2))[:3] == (0, 0, 0)
+
+
+def test_least_recently_used_are_evicted():
+    """Test that panels of ever-changing sizes don't grow the cache without bound."""
+    print("\n✓ Testing eviction:")
+    cache = RenderCache(max_entries=4)
+    first = cache.panel((10, 10), (0, 0, 0), (255, 255, 255), 1)
+    for width in range(11, 14):
+        cache.panel((width, 10), (0, 0, 0), (255, 255, 255), 1)
+    assert cache.panel((10, 10), (0, 0, 0), (255, 255, 255), 1) is first, "A hit refreshes the entry"
+
+    for width in range(20, 120):
+        cache.panel((width, 10), (0, 0, 0), (255, 255, 255), 1)
+    print(f"  {len(cache._surfaces)} kept, {cache.evictions} evicted")
+    assert len(cache._surfaces) == 4
+    assert cache.evictions == 100
+    assert cache.panel((10, 10), (0, 0, 0), (255, 255, 255), 1) is not first
+
+
+if __name__ == "__main__":
+    test_surfaces_are_reused()
+    test_panel_matches_drawn_rects()
+    test_least_recently_used_are_evicted()
+    print("\n✓ All render cache tests passed!")
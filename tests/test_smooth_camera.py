@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test for smooth sub-tile camera easing."""
+import sys
+import os
+import random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.smooth_camera import SmoothCamera
+
+
+def test_glides_to_target():
+    """Test that a one-tile step eases in over several frames and lands exactly."""
+    print("\n✓ Testing camera glide:")
+    camera = SmoothCamera(32, ease_ms=40)
+    camera.snap(5, 5)
+    assert not camera.moving and camera.offset() == (160, 160)
+
+    positions = []
+    now = 10000  # Long idle before the step must not cause a jump
+    while camera.update(6, 5, now):
+        positions.append(camera.offset()[0])
+        now += 16
+    print(f"  x per frame: {positions}")
+    assert 1 < len(positions) < 20
+    assert positions[0] < 176, "First frame moves less than half a tile"
+    assert positions == sorted(positions), "Never overshoots or backs up"
+    assert camera.offset() == (192, 160) and not camera.moving
+
+
+def test_snap_and_zero_ease():
+    """Test that ease 0 follows the target immediately."""
+    print("\n✓ Testing snapping:")
+    camera = SmoothCamera(32, ease_ms=0)
+    assert camera.update(3, 4, 0)
+    assert camera.offset() == (96, 128) and not camera.moving
+    assert not camera.update(3, 4, 16), "Resting camera reports no change"
+
+
+def test_chest_opened_while_scrolling():
+    """Test that a chest opened while the view still glides is re-baked open."""
+    print("\n✓ Testing chest opened mid-scroll:")
+    from engine.game import Game
+
+    random.seed(1234)
+    game = Game(headless=True)
+    try:
+        now = 0
+
+        def step(key=None):
+            nonlocal now
+            now += 17
+            game.step([pygame.event.Event(pygame.KEYDOWN, key=key)] if key else [], now)
+
+        step(pygame.K_t)
+        while game.auto_travel.active:
+            step()
+        assert game.renderer.moving, "Arrived before the camera landed"
+        step(pygame.K_SPACE)
+        opened = [chest for chest in game.game_state.chests if chest['opened']]
+        print(f"  opened {len(opened)} chest(s) while moving")
+        assert opened
+        for _ in range(40):
+            step()
+
+        shown = pygame.image.tobytes(game.screen, 'RGB')
+        game.renderer.world_layer._chunks.clear()  # Re-bake everything from scratch
+        game.dirty.mark_all()
+        game.render(now)
+        assert shown == pygame.image.tobytes(game.screen, 'RGB'), "Chest still drawn closed"
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    test_glides_to_target()
+    test_snap_and_zero_ease()
+    test_chest_opened_while_scrolling()
+    print("\n✓ All smooth camera tests passed!")
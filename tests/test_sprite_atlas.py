@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test for the sprite atlas."""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.sprite_atlas import SpriteAtlas
+
+
+def solid(color, size=4):
+    """Single-colour sprite."""
+    sprite = pygame.Surface((size, size))
+    sprite.fill(color)
+    return sprite
+
+
+def test_ids_map_to_packed_areas():
+    """Test that each tile ID draws its own sprite from the packed surface."""
+    print("\n✓ Testing atlas lookups:")
+    colors = {'grass': (0, 168, 0), 'rock': (136, 136, 136), 'hero': (255, 0, 0)}
+    atlas = SpriteAtlas(4, columns=2)
+    for name, color in colors.items():
+        atlas.add(name, solid(color))
+
+    assert [atlas.id_of(name) for name in colors] == [0, 1, 2]
+    assert atlas.rects[2].topleft == (0, 4), "Third sprite wraps to the second row"
+    assert atlas.surface.get_size() == (8, 8)
+    assert atlas.id_of('tree') is None and atlas.id_of('tree', default=0) == 0
+
+    target = pygame.Surface((4, 4))
+    for name, color in colors.items():
+        atlas.blit(target, atlas.id_of(name), (0, 0))
+        assert tuple(target.get_at((3, 3)))[:3] == color
+        assert tuple(atlas.sprite(atlas.id_of(name)).get_at((0, 0)))[:3] == color
+
+
+def test_tinted_variants():
+    """Test that tinted variants get their own IDs and the surface is repacked."""
+    print("\n✓ Testing tinted variants:")
+    atlas = SpriteAtlas.from_sprites({'grass': solid((0, 200, 0)), 'rock': solid((200, 200, 200))}, 4)
+    first_surface = atlas.surface
+    atlas.add_tinted('dim', (128, 128, 128))
+
+    dim_id = atlas.id_of('grass', 'dim')
+    assert dim_id == 2 and atlas.id_of('rock', 'dim') == 3
+    assert atlas.surface is not first_surface
+    assert tuple(atlas.sprite(dim_id).get_at((0, 0)))[:3] == (0, 100, 0)
+    print(f"  {len(atlas.rects)} sprites packed")
+
+
+if __name__ == "__main__":
+    test_ids_map_to_packed_areas()
+    test_tinted_variants()
+    print("\n✓ All sprite atlas tests passed!")
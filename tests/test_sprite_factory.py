@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Test for the NumPy sprite factory."""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from engine.sprite_factory import new_pixels, fill_rect, pattern_mask, stamp, to_surface
+
+
+def test_pattern_stamp_scales_and_dithers():
+    """Test that pattern cells become scaled blocks in alternating colours."""
+    print("\n✓ Testing pattern stamp:")
+    pattern = [
+        " ## ",
+        "####",
+    ]
+    assert pattern_mask(pattern).sum() == 6
+
+    pixels = new_pixels(10, (0, 0, 0))
+    stamp(pixels, pattern, [(10, 10, 10), (20, 20, 20)], origin=(1, 2), scale=2)
+    lit = pixels.any(axis=2)
+    assert lit.sum() == 6 * 4, "Each cell is a 2x2 block"
+    assert not lit[2, 1] and lit[2, 3], "Blank cells are left alone"
+    assert tuple(pixels[2, 3]) == (20, 20, 20)  # Cell (1, 0): odd
+    assert tuple(pixels[4, 1]) == (20, 20, 20)  # Cell (0, 1): odd
+    assert tuple(pixels[4, 3]) == (10, 10, 10)  # Cell (1, 1): even
+
+
+def test_surface_upload_matches_array():
+    """Test that the uploaded surface holds the same pixels."""
+    print("\n✓ Testing surface upload:")
+    pixels = new_pixels(8, (0, 168, 0))
+    fill_rect(pixels, (2, 1, 3, 4), (255, 0, 0))
+    surface = to_surface(pixels)
+
+    assert surface.get_size() == (8, 8)
+    assert tuple(surface.get_at((2, 1)))[:3] == (255, 0, 0)
+    assert tuple(surface.get_at((4, 4)))[:3] == (255, 0, 0)
+    assert tuple(surface.get_at((5, 1)))[:3] == (0, 168, 0)
+    assert tuple(surface.get_at((2, 5)))[:3] == (0, 168, 0)
+
+
+if __name__ == "__main__":
+    test_pattern_stamp_scales_and_dithers()
+    test_surface_upload_matches_array()
+    print("\n✓ All sprite factory tests passed!")
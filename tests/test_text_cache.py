@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test for the LRU text-surface cache."""
+import sys
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.text_cache import TextCache
+
+
+def test_repeated_text_is_rendered_once():
+    """Test that the same label is served from the cache."""
+    print("\n✓ Testing text reuse:")
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    cache = TextCache()
+
+    first = cache.render(font, "MENU", True, (255, 255, 255))
+    for _ in range(9):
+        assert cache.render(font, "MENU", True, [255, 255, 255]) is first
+    assert cache.render(font, "MENU", False, (255, 255, 255)) is not first
+    assert cache.render(font, "MENU", True, (255, 200, 0)) is not first
+    print(f"  {cache.stats()}")
+    assert (cache.hits, cache.misses) == (9, 3)
+    assert abs(cache.hit_rate - 0.75) < 1e-9
+
+    expected = font.render("MENU", True, (255, 255, 255))
+    assert pygame.image.tobytes(first, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+
+def test_least_recently_used_is_evicted():
+    """Test that the bound drops the label unused for longest."""
+    print("\n✓ Testing LRU eviction:")
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    cache = TextCache(max_entries=2)
+
+    a = cache.render(font, "a", True, (255, 255, 255))
+    cache.render(font, "b", True, (255, 255, 255))
+    assert cache.render(font, "a", True, (255, 255, 255)) is a  # 'b' is now oldest
+    cache.render(font, "c", True, (255, 255, 255))
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.render(font, "a", True, (255, 255, 255)) is a
+    assert cache.misses == 3, "'a' survived, so only a, b and c were rendered"
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hit_rate > 0
+
+
+if __name__ == "__main__":
+    test_repeated_text_is_rendered_once()
+    test_least_recently_used_is_evicted()
+    print("\n✓ All text cache tests passed!")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Test for the baked world layer."""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pygame
+
+from engine.world_layer import WorldLayer, HIDDEN, DIM, LIT
+from engine.sprite_atlas import SpriteAtlas
+from engine.exploration import ExploredMap
+from engine.fov import FieldOfView
+from assets.terrain import Grass, Tree
+
+TILE = 4
+COLORS = {'grass': (0, 168, 0), 'tree': (0, 100, 0), 'chest': (200, 100, 0)}
+
+
+def make_atlas():
+    """Atlas of solid-colour sprites, easy to check pixel by pixel."""
+    sprites = {}
+    for name, color in COLORS.items():
+        sprite = pygame.Surface((TILE, TILE))
+        sprite.fill(color)
+        sprites[name] = sprite
+    return SpriteAtlas.from_sprites(sprites, TILE)
+
+
+def make_world(width, height):
+    """Grass world with one tree at (3, 2)."""
+    world = {(x, y): Grass(x, y) for y in range(height) for x in range(width)}
+    world[(3, 2)] = Tree(3, 2)
+    return world
+
+
+def test_view_matches_tiles_across_chunks():
+    """Test that the baked view shows the right tile at every position."""
+    print("\n✓ Testing baked view across chunks:")
+    chest = {'x': 9, 'y': 9, 'opened': False}
+    layer = WorldLayer(make_atlas(), (128, 128, 128), chunk_tiles=8)
+    layer.set_world(make_world(20, 20), 20, 20, [chest])
+
+    screen = pygame.Surface((10 * TILE, 10 * TILE))
+    layer.blit_view(screen, 2, 1)
+    assert tuple(screen.get_at((1 * TILE, 1 * TILE)))[:3] == COLORS['tree']
+    assert tuple(screen.get_at((7 * TILE, 8 * TILE)))[:3] == COLORS['chest']
+    assert tuple(screen.get_at((0, 0)))[:3] == COLORS['grass']
+    print(f"  {layer.bakes} chunks baked for one view")
+    assert layer.bakes == 4, "A view straddling chunk corners bakes four chunks"
+
+    # Camera past the world edge leaves black outside
+    layer.blit_view(screen, -3, 0)
+    assert tuple(screen.get_at((0, 0)))[:3] == (0, 0, 0)
+    assert layer.bakes == 4
+
+
+def test_pixel_offset_view():
+    """Test that a sub-tile scroll offset shifts the baked view by pixels."""
+    print("\n✓ Testing pixel-offset view:")
+    layer = WorldLayer(make_atlas(), (128, 128, 128), chunk_tiles=8)
+    layer.set_world(make_world(20, 20), 20, 20, [])
+
+    aligned = pygame.Surface((10 * TILE, 10 * TILE))
+    layer.blit_view(aligned, 2, 1)
+    scrolled = pygame.Surface((10 * TILE, 10 * TILE))
+    layer.blit_view_px(scrolled, 2 * TILE, 1 * TILE)
+    assert pygame.image.tobytes(aligned, 'RGB') == pygame.image.tobytes(scrolled, 'RGB')
+
+    # Tree at world pixel (12, 8); with offset (9, 6) it starts at screen (3, 2)
+    layer.blit_view_px(scrolled, 9, 6)
+    assert tuple(scrolled.get_at((3, 2)))[:3] == COLORS['tree']
+    assert tuple(scrolled.get_at((2, 2)))[:3] == COLORS['grass']
+    assert tuple(scrolled.get_at((3 + TILE, 2)))[:3] == COLORS['grass']
+
+
+def test_refresh_tile_rebakes_one_tile():
+    """Test that opening a chest re-bakes only its tile."""
+    print("\n✓ Testing single-tile re-bake:")
+    chest = {'x': 2, 'y': 2, 'opened': False}
+    layer = WorldLayer(make_atlas(), (128, 128, 128))
+    layer.set_world(make_world(10, 10), 10, 10, [chest])
+    screen = pygame.Surface((10 * TILE, 10 * TILE))
+    layer.blit_view(screen, 0, 0)
+
+    chest['opened'] = True
+    layer.refresh_tile(2, 2)
+    layer.blit_view(screen, 0, 0)
+    assert tuple(screen.get_at((2 * TILE, 2 * TILE)))[:3] == COLORS['grass']
+    assert layer.bakes == 1 and layer.rebakes == 1
+
+
+def test_fog_rebakes_changed_tiles_only():
+    """Test that moving the viewer re-bakes just the tiles that changed state."""
+    print("\n✓ Testing fog re-bake:")
+    world = make_world(30, 30)
+    layer = WorldLayer(make_atlas(), (128, 128, 128))
+    layer.set_world(world, 30, 30)
+    fov = FieldOfView(radius=4)
+    fov.set_world(world, 30, 30)
+    explored = ExploredMap(30, 30)
+
+    fov.update(10, 10)
+    explored.mark_visible(fov.visible, fov.bounds())
+    layer.update_fog(fov, explored)
+    screen = pygame.Surface((30 * TILE, 30 * TILE))
+    layer.blit_view(screen, 0, 0)
+
+    fov.update(11, 10)
+    explored.mark_visible(fov.visible, fov.bounds())
+    changed = layer.update_fog(fov, explored)
+    print(f"  {len(changed)} tiles re-baked after one step")
+    assert 0 < len(changed) < 30 and layer.rebakes == len(changed)
+    assert layer.shade[10, 15] == LIT and layer.shade[10, 6] == DIM
+    assert layer.shade[0, 0] == HIDDEN
+    layer.blit_view(screen, 0, 0)
+    assert tuple(screen.get_at((0, 0)))[:3] == (0, 0, 0)
+    assert tuple(screen.get_at((6 * TILE, 10 * TILE)))[:3] == (0, 84, 0)
+
+
+def test_animation_rebakes_visible_animated_tiles():
+    """Test that a new animation frame re-bakes only animated tiles in view."""
+    print("\n✓ Testing tile animation:")
+    world = make_world(20, 20)
+    world[(15, 15)] = Tree(15, 15)  # Animated but off screen
+    layer = WorldLayer(make_atlas(), (128, 128, 128), chunk_tiles=8, frame_ms=200)
+    frames = []
+    for color in [(255, 0, 0), (0, 0, 255)]:
+        frame = pygame.Surface((TILE, TILE))
+        frame.fill(color)
+        frames.append(frame)
+    layer.add_animation('tree', frames)
+    layer.set_world(world, 20, 20)
+    screen = pygame.Surface((10 * TILE, 10 * TILE))
+    layer.blit_view(screen, 0, 0)
+
+    view = (0, 0, 10, 10)
+    assert layer.animate(0, view) == [(3, 2)], "First view re-bakes its animated tiles"
+    assert layer.animate(150, view) == [], "Same frame: nothing to do"
+    assert layer.frame_due_in(150) == 50
+    cached = layer.animated_tiles(view)
+    assert layer.animated_tiles(view) is cached
+
+    for now_ms, color in [(200, (255, 0, 0)), (400, (0, 0, 255)), (600, COLORS['tree'])]:
+        assert layer.animate(now_ms, view) == [(3, 2)]
+        layer.blit_view(screen, 0, 0)
+        assert tuple(screen.get_at((3 * TILE, 2 * TILE)))[:3] == color
+    print(f"  {layer.rebakes} tile re-bakes for 4 frames")
+    assert layer.rebakes == 4
+
+
+if __name__ == "__main__":
+    test_view_matches_tiles_across_chunks()
+    test_pixel_offset_view()
+    test_refresh_tile_rebakes_one_tile()
+    test_fog_rebakes_changed_tiles_only()
+    test_animation_rebakes_visible_animated_tiles()
+    print("\n✓ All world layer tests passed!")